@@ -1,110 +1,240 @@
 #!/usr/bin/env python3
+import functools
+import linecache
 import os
 import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+# All relative import forms fused into one alternation so each file is scanned
+# once; exactly one named group captures the path for any given match.
+IMPORT_RE = re.compile(
+    # import ... from './path' or '../path'
+    r"import\s+(?:.*?)\s+from\s+['\"](?P<import_from>[./].*?)['\"]"
+    # import './path' or '../path'
+    r"|import\s+['\"](?P<import_bare>[./].*?)['\"]"
+    # require('./path') or require('../path')
+    r"|require\s*\(\s*['\"](?P<require>[./].*?)['\"]"
+    # export ... from './path' or '../path'
+    r"|export\s+(?:.*?)\s+from\s+['\"](?P<export_from>[./].*?)['\"]"
+)
+
+# Source files scanned for imports
+JS_EXTS = ('.js', '.jsx', '.ts', '.tsx')
+# Suffixes tried, in order, when resolving an import path
+RESOLVE_EXTS = ('', '.js', '.jsx', '.ts', '.tsx', '.json', '.css', '.scss', '.module.css', '.module.scss')
+# Directory index files tried when an import points at a folder
+INDEX_FILES = tuple(f'index{ext}' for ext in JS_EXTS)
+
+# Dependency, VCS and build output directories never hold project sources
+SKIP_DIRS = frozenset({'node_modules', '.git', 'build', 'dist', '.next', 'coverage', '__pycache__'})
+
+# Every IMPORT_RE alternative starts with one of these literals
+IMPORT_TOKENS = ('import', 'require', 'export')
+
+def has_import_token(text):
+    """Cheap substring check that rules out text IMPORT_RE cannot match."""
+    return any(token in text for token in IMPORT_TOKENS)
+
+@dataclass(slots=True)
+class ImportInfo:
+    """A relative import that could not be resolved."""
+    import_path: str
+    line_num: int
+    line: str
+    file_path: str
+    relative_source: str
+    similar_files: list
+
 def extract_imports_with_line_numbers(file_path):
-    """Extract all import statements from a file with line numbers."""
+    """
+    Extract all import statements from a file with line numbers.
+    
+    Returns (import_path, line_num) pairs; the source line itself is only
+    read back for imports that turn out to be missing.
+    """
     imports = []
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
-        for line_num, line in enumerate(lines, 1):
-            # Match various import patterns
-            # import ... from './path' or '../path'
-            match1 = re.search(r"import\s+(?:.*?)\s+from\s+['\"]([./].*?)['\"]", line)
-            # import './path' or '../path'
-            match2 = re.search(r"import\s+['\"]([./].*?)['\"]", line)
-            # require('./path') or require('../path')
-            match3 = re.search(r"require\s*\(\s*['\"]([./].*?)['\"]", line)
-            # export ... from './path' or '../path'
-            match4 = re.search(r"export\s+(?:.*?)\s+from\s+['\"]([./].*?)['\"]", line)
+        content = Path(file_path).read_text(encoding='utf-8', errors='ignore')
+        
+        if not has_import_token(content):
+            return imports
             
-            for match in [match1, match2, match3, match4]:
-                if match:
-                    imports.append({
-                        'import_path': match.group(1),
-                        'line_num': line_num,
-                        'line': line.strip(),
-                        'file_path': file_path
-                    })
+        # Line numbers are counted incrementally from the previous match so
+        # the whole file is only walked once for newlines
+        line_num, counted_to = 1, 0
+        for match in IMPORT_RE.finditer(content):
+            start = match.start()
+            line_num += content.count('\n', counted_to, start)
+            counted_to = start
+            imports.append((match.group(match.lastgroup), line_num))
                 
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
     
     return imports
 
+@functools.lru_cache(maxsize=None)
+def dir_entries(directory):
+    """Names in directory, listed once and cached for the lifetime of the script.
+    
+    Extension probing becomes a set lookup instead of a stat call per
+    candidate path.
+    """
+    try:
+        return frozenset(os.listdir(directory))
+    except OSError:
+        return frozenset()
+
 def resolve_import_path(import_path, source_file):
     """Resolve relative import path to absolute path."""
-    source_dir = os.path.dirname(source_file)
-    
+    return _resolve_from_dir(import_path, os.path.dirname(source_file))
+
+@functools.lru_cache(maxsize=None)
+def _resolve_from_dir(import_path, source_dir):
     # Handle import path without extension
     resolved_path = os.path.normpath(os.path.join(source_dir, import_path))
+    parent_entries = dir_entries(os.path.dirname(resolved_path))
+    base = os.path.basename(resolved_path)
     
     # Check with various extensions
-    extensions = ['', '.js', '.jsx', '.ts', '.tsx', '.json', '.css', '.scss', '.module.css', '.module.scss']
+    for ext in RESOLVE_EXTS:
+        if base + ext in parent_entries:
+            return resolved_path + ext
     
-    for ext in extensions:
-        test_path = resolved_path + ext
-        if os.path.exists(test_path):
-            return test_path
-            
-        # Also check if it's a directory with index file
-        if os.path.isdir(resolved_path):
-            for index_ext in ['.js', '.jsx', '.ts', '.tsx']:
-                index_path = os.path.join(resolved_path, f'index{index_ext}')
-                if os.path.exists(index_path):
-                    return index_path
+    # Also check if it's a directory with index file
+    index_entries = dir_entries(resolved_path)
+    for index_file in INDEX_FILES:
+        if index_file in index_entries:
+            return os.path.join(resolved_path, index_file)
     
     return None
 
-def find_similar_files(filename, search_dir):
+def build_file_index(js_files, relpath):
+    """Map each lowercased file name to its paths, made relative by relpath."""
+    file_index = defaultdict(list)
+    for file_path in js_files:
+        file_index[os.path.basename(file_path).lower()].append(relpath(file_path))
+    return file_index
+
+def trigrams(text):
+    """All three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def build_trigram_index(file_index):
+    """
+    Map each trigram to the file_index names containing it.
+    
+    Any name containing a query string of three or more characters contains
+    all of its trigrams, so intersecting their posting sets narrows the
+    substring search to a handful of candidates.
+    """
+    trigram_index = defaultdict(set)
+    for name in file_index:
+        for trigram in trigrams(name):
+            trigram_index[trigram].add(name)
+    return trigram_index
+
+def find_similar_files(filename, file_index, trigram_index):
     """Find files with similar names in the project."""
     similar = []
-    basename = os.path.basename(filename).split('.')[0]
+    basename = os.path.basename(filename).split('.')[0].lower()
     
-    for root, dirs, files in os.walk(search_dir):
-        for file in files:
-            if basename.lower() in file.lower() and file.endswith(('.js', '.jsx', '.ts', '.tsx')):
-                similar.append(os.path.relpath(os.path.join(root, file), search_dir))
+    query = trigrams(basename)
+    if query:
+        postings = sorted((trigram_index.get(t, set()) for t in query), key=len)
+        candidates = set.intersection(*postings)
+    else:
+        # Too short to have a trigram; fall back to a scan of every name
+        candidates = file_index
+    
+    for name in sorted(candidates):
+        if basename in name:
+            similar.extend(file_index[name])
     
     return similar
 
+def iter_source_files(root):
+    """Yield JS/TS source files under root, pruning SKIP_DIRS.
+
+    Uses os.scandir so directory detection comes from the cached d_type of
+    each entry rather than an extra stat per file, as os.walk would do.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(JS_EXTS):
+                        yield entry.path
+        except OSError as e:
+            print(f"Error scanning {directory}: {e}")
+
+def make_relpath(base_dir):
+    """
+    Build a relpath function for files found under base_dir.
+    
+    Walked paths all start with base_dir, so the common prefix is sliced off
+    instead of normalizing both paths on every os.path.relpath call.
+    """
+    prefix = os.path.join(base_dir, '')
+    
+    def relpath(path):
+        if path.startswith(prefix):
+            return path[len(prefix):]
+        return os.path.relpath(path, base_dir)
+    
+    return relpath
+
 def main():
     frontend_src = "/Users/vishalbharti/Downloads/StickForStats_Migration/new_project/frontend/src"
     missing_imports = []
     
     # Find all JS/JSX/TS/TSX files
-    js_files = []
-    for root, dirs, files in os.walk(frontend_src):
-        for file in files:
-            if file.endswith(('.js', '.jsx', '.ts', '.tsx')):
-                js_files.append(os.path.join(root, file))
+    js_files = list(iter_source_files(frontend_src))
+    relpath = make_relpath(frontend_src)
+    
+    # Index file names once; similar-file lookups are answered from it
+    file_index = build_file_index(js_files, relpath)
+    trigram_index = build_trigram_index(file_index)
+    similar_cache = {}
     
     print(f"Checking {len(js_files)} JavaScript/TypeScript files...")
     print("=" * 80)
     
-    # Check each file
-    for file_path in js_files:
-        imports = extract_imports_with_line_numbers(file_path)
-        
-        for import_info in imports:
-            import_path = import_info['import_path']
-            resolved = resolve_import_path(import_path, file_path)
-            if resolved is None:
-                relative_source = os.path.relpath(file_path, frontend_src)
-                import_info['relative_source'] = relative_source
+    # Extract imports in worker processes; resolution stays in this process so
+    # the resolver caches and file index are shared across every file
+    with ProcessPoolExecutor() as executor:
+        imports_by_file = executor.map(extract_imports_with_line_numbers, js_files, chunksize=64)
+        for file_path, imports in zip(js_files, imports_by_file):
+            for import_path, line_num in imports:
+                resolved = resolve_import_path(import_path, file_path)
+                if resolved is not None:
+                    continue
                 
                 # Try to find similar files
                 target_file = os.path.basename(import_path)
                 if '/' in import_path:
                     target_file = import_path.split('/')[-1]
                     
-                similar_files = find_similar_files(target_file, frontend_src)
-                import_info['similar_files'] = similar_files
+                if target_file not in similar_cache:
+                    similar_cache[target_file] = find_similar_files(target_file, file_index, trigram_index)
                 
-                missing_imports.append(import_info)
+                missing_imports.append(ImportInfo(
+                    import_path=import_path,
+                    line_num=line_num,
+                    line=linecache.getline(file_path, line_num).strip(),
+                    file_path=file_path,
+                    relative_source=relpath(file_path),
+                    similar_files=similar_cache[target_file],
+                ))
     
     # Display results
     if missing_imports:
@@ -113,25 +243,27 @@ def main():
         # Group by source file
         by_file = {}
         for item in missing_imports:
-            source = item['relative_source']
+            source = item.relative_source
             if source not in by_file:
                 by_file[source] = []
             by_file[source].append(item)
         
-        # Display grouped results with suggestions
+        # Display grouped results with suggestions, buffered into one write
+        out = []
         for source_file in sorted(by_file.keys()):
-            print(f"\n{'='*80}")
-            print(f"File: {source_file}")
-            print(f"{'='*80}")
+            out.append(f"\n{'='*80}\n")
+            out.append(f"File: {source_file}\n")
+            out.append(f"{'='*80}\n")
             
             for import_item in by_file[source_file]:
-                print(f"\nLine {import_item['line_num']}: {import_item['line']}")
-                print(f"Missing: {import_item['import_path']}")
+                out.append(f"\nLine {import_item.line_num}: {import_item.line}\n")
+                out.append(f"Missing: {import_item.import_path}\n")
                 
-                if import_item['similar_files']:
-                    print(f"Possible alternatives found:")
-                    for alt in import_item['similar_files'][:5]:  # Show top 5
-                        print(f"  - {alt}")
+                if import_item.similar_files:
+                    out.append("Possible alternatives found:\n")
+                    for alt in import_item.similar_files[:5]:  # Show top 5
+                        out.append(f"  - {alt}\n")
+        sys.stdout.write("".join(out))
         
         print(f"\n\n{'='*80}")
         print(f"Summary:")
@@ -1,86 +1,154 @@
 #!/usr/bin/env python3
+import functools
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# All relative import forms fused into one alternation so each file is scanned
+# once; exactly one named group captures the path for any given match.
+IMPORT_RE = re.compile(
+    # import ... from './path' or '../path'
+    r"import\s+(?:.*?)\s+from\s+['\"](?P<import_from>[./].*?)['\"]"
+    # import './path' or '../path'
+    r"|import\s+['\"](?P<import_bare>[./].*?)['\"]"
+    # require('./path') or require('../path')
+    r"|require\s*\(\s*['\"](?P<require>[./].*?)['\"]"
+    # export ... from './path' or '../path'
+    r"|export\s+(?:.*?)\s+from\s+['\"](?P<export_from>[./].*?)['\"]"
+)
+
+# Source files scanned for imports
+JS_EXTS = ('.js', '.jsx', '.ts', '.tsx')
+# Suffixes tried, in order, when resolving an import path
+RESOLVE_EXTS = ('', '.js', '.jsx', '.ts', '.tsx', '.json', '.css', '.scss', '.module.css', '.module.scss')
+# Directory index files tried when an import points at a folder
+INDEX_FILES = tuple(f'index{ext}' for ext in JS_EXTS)
+
+# Dependency, VCS and build output directories never hold project sources
+SKIP_DIRS = frozenset({'node_modules', '.git', 'build', 'dist', '.next', 'coverage', '__pycache__'})
+
+# Every IMPORT_RE alternative starts with one of these literals
+IMPORT_TOKENS = ('import', 'require', 'export')
+
+def has_import_token(text):
+    """Cheap substring check that rules out text IMPORT_RE cannot match."""
+    return any(token in text for token in IMPORT_TOKENS)
+
 def extract_imports(file_path):
     """Extract all import statements from a file."""
     imports = []
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # Match various import patterns
-        # import ... from './path' or '../path'
-        pattern1 = r"import\s+(?:.*?)\s+from\s+['\"]([./].*?)['\"]"
-        # import './path' or '../path'
-        pattern2 = r"import\s+['\"]([./].*?)['\"]"
-        # require('./path') or require('../path')
-        pattern3 = r"require\s*\(\s*['\"]([./].*?)['\"]"
-        # export ... from './path' or '../path'
-        pattern4 = r"export\s+(?:.*?)\s+from\s+['\"]([./].*?)['\"]"
+        content = Path(file_path).read_text(encoding='utf-8', errors='ignore')
         
-        for pattern in [pattern1, pattern2, pattern3, pattern4]:
-            matches = re.findall(pattern, content, re.MULTILINE)
-            for match in matches:
-                imports.append((match, file_path))
+        if not has_import_token(content):
+            return imports
+            
+        for match in IMPORT_RE.finditer(content):
+            imports.append((match.group(match.lastgroup), file_path))
                 
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
     
     return imports
 
+@functools.lru_cache(maxsize=None)
+def dir_entries(directory):
+    """Names in directory, listed once and cached for the lifetime of the script.
+    
+    Extension probing becomes a set lookup instead of a stat call per
+    candidate path.
+    """
+    try:
+        return frozenset(os.listdir(directory))
+    except OSError:
+        return frozenset()
+
 def resolve_import_path(import_path, source_file):
     """Resolve relative import path to absolute path."""
-    source_dir = os.path.dirname(source_file)
-    
+    return _resolve_from_dir(import_path, os.path.dirname(source_file))
+
+@functools.lru_cache(maxsize=None)
+def _resolve_from_dir(import_path, source_dir):
     # Handle import path without extension
     resolved_path = os.path.normpath(os.path.join(source_dir, import_path))
+    parent_entries = dir_entries(os.path.dirname(resolved_path))
+    base = os.path.basename(resolved_path)
     
     # Check with various extensions
-    extensions = ['', '.js', '.jsx', '.ts', '.tsx', '.json', '.css', '.scss', '.module.css', '.module.scss']
+    for ext in RESOLVE_EXTS:
+        if base + ext in parent_entries:
+            return resolved_path + ext
     
-    for ext in extensions:
-        test_path = resolved_path + ext
-        if os.path.exists(test_path):
-            return test_path
-            
-        # Also check if it's a directory with index file
-        if os.path.isdir(resolved_path):
-            for index_ext in ['.js', '.jsx', '.ts', '.tsx']:
-                index_path = os.path.join(resolved_path, f'index{index_ext}')
-                if os.path.exists(index_path):
-                    return index_path
+    # Also check if it's a directory with index file
+    index_entries = dir_entries(resolved_path)
+    for index_file in INDEX_FILES:
+        if index_file in index_entries:
+            return os.path.join(resolved_path, index_file)
     
     return None
 
+def iter_source_files(root):
+    """Yield JS/TS source files under root, pruning SKIP_DIRS.
+
+    Uses os.scandir so directory detection comes from the cached d_type of
+    each entry rather than an extra stat per file, as os.walk would do.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(JS_EXTS):
+                        yield entry.path
+        except OSError as e:
+            print(f"Error scanning {directory}: {e}")
+
+def make_relpath(base_dir):
+    """
+    Build a relpath function for files found under base_dir.
+    
+    Walked paths all start with base_dir, so the common prefix is sliced off
+    instead of normalizing both paths on every os.path.relpath call.
+    """
+    prefix = os.path.join(base_dir, '')
+    
+    def relpath(path):
+        if path.startswith(prefix):
+            return path[len(prefix):]
+        return os.path.relpath(path, base_dir)
+    
+    return relpath
+
 def main():
     frontend_src = "/Users/vishalbharti/Downloads/StickForStats_Migration/new_project/frontend/src"
     missing_imports = []
     
     # Find all JS/JSX/TS/TSX files
-    js_files = []
-    for root, dirs, files in os.walk(frontend_src):
-        for file in files:
-            if file.endswith(('.js', '.jsx', '.ts', '.tsx')):
-                js_files.append(os.path.join(root, file))
+    js_files = list(iter_source_files(frontend_src))
+    relpath = make_relpath(frontend_src)
     
     print(f"Checking {len(js_files)} JavaScript/TypeScript files...")
     print("=" * 80)
     
-    # Check each file
-    for file_path in js_files:
-        imports = extract_imports(file_path)
-        
-        for import_path, source_file in imports:
-            resolved = resolve_import_path(import_path, source_file)
-            if resolved is None:
-                relative_source = os.path.relpath(source_file, frontend_src)
-                missing_imports.append({
-                    'source_file': relative_source,
-                    'import_path': import_path,
-                    'full_source': source_file
-                })
+    # Extract imports in worker processes; resolution stays in this process so
+    # the resolver caches are shared across every file
+    with ProcessPoolExecutor() as executor:
+        for imports in executor.map(extract_imports, js_files, chunksize=64):
+            for import_path, source_file in imports:
+                resolved = resolve_import_path(import_path, source_file)
+                if resolved is None:
+                    relative_source = relpath(source_file)
+                    missing_imports.append({
+                        'source_file': relative_source,
+                        'import_path': import_path,
+                        'full_source': source_file
+                    })
     
     # Group by source file and display results
     if missing_imports:
@@ -94,11 +162,13 @@ def main():
                 by_file[source] = []
             by_file[source].append(item['import_path'])
         
-        # Display grouped results
+        # Display grouped results, buffered into one write
+        out = []
         for source_file in sorted(by_file.keys()):
-            print(f"\n{source_file}:")
+            out.append(f"\n{source_file}:\n")
             for import_path in sorted(set(by_file[source_file])):
-                print(f"  - Missing: {import_path}")
+                out.append(f"  - Missing: {import_path}\n")
+        sys.stdout.write("".join(out))
         
         print(f"\n\nTotal missing imports: {len(missing_imports)}")
         print(f"Files with missing imports: {len(by_file)}")
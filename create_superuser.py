@@ -5,14 +5,14 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'stickforstats.settings')
 django.setup()
 
-from stickforstats.mainapp.models.user import User
+from django.core.management import call_command
 
-# Create superuser if it doesn't exist
 try:
-    if not User.objects.filter(username='admin').exists():
-        User.objects.create_superuser('admin', 'admin@example.com', 'admin123')
-        print("Superuser 'admin' created successfully!")
-    else:
-        print("Superuser 'admin' already exists.")
+    call_command(
+        'user_ops', 'create',
+        '--email', 'admin@example.com',
+        '--username', 'admin',
+        '--password', 'admin123',
+    )
 except Exception as e:
     print(f"Error creating superuser: {e}")
\ No newline at end of file
@@ -3,6 +3,7 @@
 Module Validation Debug Script
 """
 
+import functools
 import os
 import sys
 import importlib
@@ -25,6 +26,38 @@ def setup_django():
         django.setup()
         logger.info("Django environment initialized")
 
+def iter_py_files(root):
+    """Yield the .py files under root using a single os.scandir traversal."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        yield entry.path
+        except OSError as e:
+            logger.warning(f"Error scanning {directory}: {str(e)}")
+
+@functools.lru_cache(maxsize=None)
+def index_app_py_files():
+    """
+    Walk every stickforstats app once, on the first lookup that needs it.
+    
+    Returns:
+        Dict mapping each stickforstats app config to a dict of its .py file
+        paths keyed by lowercase basename
+    """
+    index = {}
+    for app_config in apps.get_app_configs():
+        if app_config.name.startswith('stickforstats.'):
+            by_name = index[app_config] = {}
+            for file_path in iter_py_files(app_config.path):
+                by_name.setdefault(os.path.basename(file_path).lower(), []).append(file_path)
+    return index
+
 def debug_module_validation(module_name):
     """
     Debug validation for a specific module.
@@ -59,15 +92,14 @@ def debug_module_validation(module_name):
             logger.error(f"Failed to import API namespace: {str(e)}")
             # Try to find the correct namespace
             possible_api_paths = []
-            for app_config in apps.get_app_configs():
+            for app_config, py_files in index_app_py_files().items():
                 if app_config.name.startswith(f'stickforstats.{module_name}'):
-                    for root, dirs, files in os.walk(app_config.path):
-                        for file in files:
-                            if file == 'urls.py' and 'api' in root:
-                                rel_path = os.path.relpath(os.path.join(root, file), 
-                                                           os.path.dirname(app_config.path))
-                                module_path = f"{app_config.name}.{rel_path.replace('/', '.').replace('.py', '')}"
-                                possible_api_paths.append(module_path)
+                    for file_path in py_files.get('urls.py', []):
+                        if 'api' in os.path.dirname(file_path):
+                            rel_path = os.path.relpath(file_path, 
+                                                       os.path.dirname(app_config.path))
+                            module_path = f"{app_config.name}.{rel_path.replace('/', '.').replace('.py', '')}"
+                            possible_api_paths.append(module_path)
             
             if possible_api_paths:
                 logger.info(f"Possible API namespaces found: {possible_api_paths}")
@@ -87,26 +119,31 @@ def debug_module_validation(module_name):
                 logger.error(f"Failed to load service {service_name}: {str(e)}")
                 # Try to find the correct service class
                 class_found = False
-                for app_config in apps.get_app_configs():
+                for app_config, py_files in index_app_py_files().items():
                     if app_config.name.startswith(f'stickforstats.{module_name}'):
-                        for root, dirs, files in os.walk(app_config.path):
-                            for file in files:
-                                if file.endswith('.py') and class_name.lower() in file.lower():
-                                    logger.info(f"Possible service file found: {os.path.join(root, file)}")
-                                    try:
-                                        rel_path = os.path.relpath(os.path.join(root, file), 
-                                                                 os.path.dirname(app_config.path))
-                                        module_path = f"{app_config.name}.{rel_path.replace('/', '.').replace('.py', '')}"
-                                        test_module = importlib.import_module(module_path)
-                                        
-                                        # Check for similar class names
-                                        for attr_name in dir(test_module):
-                                            if attr_name.lower() == class_name.lower() or \
-                                               (class_name.lower() in attr_name.lower() and 'service' in attr_name.lower()):
-                                                logger.info(f"Possible service class found: {module_path}.{attr_name}")
-                                                class_found = True
-                                    except Exception as e:
-                                        logger.warning(f"Error checking possible service file: {str(e)}")
+                        # Substring match, so test each distinct basename once
+                        matches = [
+                            file_path
+                            for file_name, file_paths in py_files.items()
+                            if class_name.lower() in file_name
+                            for file_path in file_paths
+                        ]
+                        for file_path in matches:
+                            logger.info(f"Possible service file found: {file_path}")
+                            try:
+                                rel_path = os.path.relpath(file_path, 
+                                                         os.path.dirname(app_config.path))
+                                module_path = f"{app_config.name}.{rel_path.replace('/', '.').replace('.py', '')}"
+                                test_module = importlib.import_module(module_path)
+                                    
+                                # Check for similar class names
+                                for attr_name in dir(test_module):
+                                    if attr_name.lower() == class_name.lower() or \
+                                       (class_name.lower() in attr_name.lower() and 'service' in attr_name.lower()):
+                                        logger.info(f"Possible service class found: {module_path}.{attr_name}")
+                                        class_found = True
+                            except Exception as e:
+                                logger.warning(f"Error checking possible service file: {str(e)}")
                 
                 if not class_found:
                     logger.warning(f"No possible service class found for {service_name}")
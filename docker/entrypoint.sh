@@ -40,6 +40,15 @@ collect_static() {
     fi
 }
 
+# Write out the core API routes so workers skip router introspection
+generate_urls() {
+    echo "Generating API URL patterns..."
+    if ! python manage.py dump_urls; then
+        >&2 echo "Failed to generate API URL patterns"
+        exit 1
+    fi
+}
+
 # Create cache tables if needed
 create_cache_tables() {
     echo "Creating cache tables..."
@@ -66,6 +75,9 @@ main() {
     # Create cache tables
     create_cache_tables
     
+    # Generate API URL patterns
+    generate_urls
+    
     # Register modules (if available)
     if [ -f "register_modules.py" ]; then
         echo "Registering modules..."
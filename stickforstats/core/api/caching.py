@@ -0,0 +1,72 @@
+"""
+Response caching for the core API viewsets.
+
+list and retrieve responses are cached per user. Every key embeds the user's
+cache generation, and any successful write through the API moves that
+generation on, so earlier entries are never read again and simply expire.
+This works on every cache backend, unlike pattern deletes, which only
+django-redis provides. Writes made outside the API (tasks, services) move the
+generation on through the model signal receivers in stickforstats.core.signals.
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+
+def _generation_key(user_id):
+    return f"drf:{user_id}:generation"
+
+
+def invalidate_user_response_cache(user_id):
+    """Drop every cached API response of the given user."""
+    cache.set(_generation_key(user_id), time.time_ns(), None)
+
+
+class CachedResponseMixin:
+    """Cache list/retrieve response data per user and invalidate it on writes."""
+    cache_timeout = 60 * 5
+
+    def _cache_generation(self):
+        key = _generation_key(self.request.user.pk)
+        generation = cache.get(key)
+        if generation is None:
+            # add() keeps a generation set concurrently by another worker
+            cache.add(key, time.time_ns(), None)
+            generation = cache.get(key, 0)
+        return generation
+
+    def invalidate_response_cache(self):
+        """Drop every cached response of the current user."""
+        invalidate_user_response_cache(self.request.user.pk)
+
+    def _response_cache_key(self, request):
+        path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+        return (f"drf:{request.user.pk}:{self._cache_generation()}:"
+                f"{self.basename}:{self.action}:{request.accepted_renderer.format}:{path}")
+
+    def _cached_response(self, handler, request, *args, **kwargs):
+        key = self._response_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, self.cache_timeout)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if (request.method not in SAFE_METHODS and response.status_code < 400
+                and request.user.is_authenticated):
+            self.invalidate_response_cache()
+        return super().finalize_response(request, response, *args, **kwargs)
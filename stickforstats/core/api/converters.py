@@ -0,0 +1,20 @@
+"""
+Path converters for the core API routes.
+"""
+
+
+class LookupConverter:
+    """
+    Match a router lookup value: any characters except '/' and '.'.
+
+    DefaultRouter's default lookup regex is [^/.]+; path()'s str converter
+    would also accept dots, so e.g. datasets/abc.json/ would resolve to a
+    detail route.
+    """
+    regex = '[^/.]+'
+
+    def to_python(self, value):
+        return value
+
+    def to_url(self, value):
+        return value
@@ -0,0 +1,17 @@
+"""
+Pagination classes for the core API.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Newest-first cursor pagination.
+
+    Page-number pagination runs a SELECT COUNT(*) over the user's rows on every
+    list request and an ever larger OFFSET for deep pages. A cursor seeks on
+    created_at instead, so each page costs the same however many rows exist.
+    Responses carry next/previous links but no count.
+    """
+    ordering = '-created_at'
@@ -0,0 +1,80 @@
+"""
+Renderers for the StickForStats API.
+"""
+
+import json
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.Fragment, which embeds already-serialized JSON, was added in 3.9
+ORJSON_FRAGMENT_AVAILABLE = ORJSON_AVAILABLE and hasattr(orjson, 'Fragment')
+
+
+class RawJSON:
+    """
+    JSON text to be emitted verbatim by the API renderers.
+
+    Lets serializers pass stored JSON straight through instead of decoding it
+    into Python objects only for the renderer to encode it again.
+    """
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+
+class RawJSONEncoder(JSONEncoder):
+    """DRF's JSONEncoder, decoding RawJSON values it cannot embed directly."""
+
+    def default(self, obj):
+        if isinstance(obj, RawJSON):
+            return json.loads(obj.text)
+        return super().default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    orjson serializes dicts, lists, UUIDs, datetimes and numpy arrays in C and
+    returns bytes directly. Anything it does not handle natively (Decimal,
+    lazy translation strings, querysets, ...) goes through DRF's JSONEncoder
+    so output matches JSONRenderer. Falls back to JSONRenderer when orjson is
+    not installed, and per response when orjson rejects a dict key. RawJSON
+    values are embedded as orjson Fragments without being parsed.
+    """
+    encoder_class = RawJSONEncoder
+    _default_encoder = RawJSONEncoder()
+
+    def _default(self, obj):
+        if ORJSON_FRAGMENT_AVAILABLE and isinstance(obj, RawJSON):
+            return orjson.Fragment(obj.text)
+        return self._default_encoder.default(obj)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not ORJSON_AVAILABLE:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b''
+
+        # Non-str keys (ints from value_counts(), int-indexed series dicts)
+        # are stringified as json.dumps does
+        option = orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            return orjson.dumps(data, default=self._default, option=option)
+        except TypeError:
+            # Keys orjson rejects even so, e.g. numpy scalars, which the
+            # stdlib encoder accepts when they subclass float
+            return super().render(data, accepted_media_type, renderer_context)
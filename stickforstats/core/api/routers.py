@@ -0,0 +1,25 @@
+"""
+Router for the core API viewsets.
+
+urls.py only falls back to building URLs from this router when
+_generated_urls.py is missing; `manage.py dump_urls` writes that file from
+the same registrations.
+"""
+
+from rest_framework.routers import SimpleRouter
+
+from .views import (
+    DatasetViewSet, AnalysisViewSet, VisualizationViewSet,
+    ReportViewSet, WorkflowViewSet, GuidanceViewSet, UserPreferenceViewSet
+)
+
+# SimpleRouter skips DefaultRouter's API root view and .json format-suffix
+# variants, which roughly halves the patterns the resolver walks
+router = SimpleRouter(trailing_slash=True)
+router.register(r'datasets', DatasetViewSet, basename='dataset')
+router.register(r'analyses', AnalysisViewSet, basename='analysis')
+router.register(r'visualizations', VisualizationViewSet, basename='visualization')
+router.register(r'reports', ReportViewSet, basename='report')
+router.register(r'workflows', WorkflowViewSet, basename='workflow')
+router.register(r'guidance', GuidanceViewSet, basename='guidance')
+router.register(r'preferences', UserPreferenceViewSet, basename='preference')
@@ -0,0 +1,183 @@
+"""
+Request schemas for the statistical analysis endpoints.
+
+The /statistics/* endpoints validate every POST body. msgspec decodes and
+validates JSON in a single C pass against these Struct definitions, far
+cheaper than instantiating and running a DRF Serializer per request. The
+matching *RequestSerializer classes in serializers.py stay the reference
+schema: they are used for OpenAPI generation, for non-JSON request bodies
+and whenever msgspec is not installed.
+"""
+
+import re
+import uuid
+from typing import Annotated, Literal, Union
+
+from rest_framework.exceptions import ErrorDetail, ParseError, ValidationError
+
+from .serializers import (
+    CORRELATION_METHOD_CHOICES, REGRESSION_TYPE_CHOICES, CLUSTERING_METHOD_CHOICES,
+    TIME_SERIES_ANALYSIS_CHOICES, BAYESIAN_ANALYSIS_CHOICES
+)
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+# msgspec reports the failing location as a JSON path, e.g. "at `$.method`"
+_ERROR_PATH_RE = re.compile(r"at `\$\.(\w+)")
+_MISSING_FIELD_RE = re.compile(r"missing required field `(\w+)`")
+_BLANK_ERROR = ErrorDetail('This field may not be blank.', code='blank')
+
+
+if MSGSPEC_AVAILABLE:
+    UNSET = msgspec.UNSET
+
+    # DRF's CharField rejects blank strings unless allow_blank=True
+    NonBlankStr = Annotated[str, msgspec.Meta(min_length=1)]
+
+    class StatisticalTestRequest(msgspec.Struct, frozen=True):
+        """Schema for general statistical test requests."""
+        dataset_id: uuid.UUID
+        test_type: Annotated[str, msgspec.Meta(min_length=1, max_length=100)]
+        parameters: dict = {}
+        variables: Union[list[NonBlankStr], msgspec.UnsetType] = UNSET
+        groups: Union[str, None, msgspec.UnsetType] = UNSET
+        dependent_var: Union[str, None, msgspec.UnsetType] = UNSET
+        independent_vars: Union[list[NonBlankStr], msgspec.UnsetType] = UNSET
+        alpha: float = 0.05
+
+    class DescriptiveStatsRequest(msgspec.Struct, frozen=True):
+        """Schema for descriptive statistics requests."""
+        dataset_id: uuid.UUID
+        variables: list[NonBlankStr]
+        include_quartiles: bool = True
+        include_normality: bool = True
+        include_histogram: bool = True
+
+    class CorrelationAnalysisRequest(msgspec.Struct, frozen=True):
+        """Schema for correlation analysis requests."""
+        dataset_id: uuid.UUID
+        variables: list[NonBlankStr]
+        method: Literal[CORRELATION_METHOD_CHOICES] = 'pearson'
+        include_p_values: bool = True
+
+    class RegressionAnalysisRequest(msgspec.Struct, frozen=True):
+        """Schema for regression analysis requests."""
+        dataset_id: uuid.UUID
+        dependent_var: NonBlankStr
+        independent_vars: list[NonBlankStr]
+        regression_type: Literal[REGRESSION_TYPE_CHOICES] = 'linear'
+        include_diagnostics: bool = True
+
+    class ClusteringAnalysisRequest(msgspec.Struct, frozen=True):
+        """Schema for clustering analysis requests."""
+        dataset_id: uuid.UUID
+        variables: list[NonBlankStr]
+        method: Literal[CLUSTERING_METHOD_CHOICES] = 'kmeans'
+        n_clusters: int = 3
+        standardize: bool = True
+
+    class TimeSeriesAnalysisRequest(msgspec.Struct, frozen=True):
+        """Schema for time series analysis requests."""
+        dataset_id: uuid.UUID
+        time_var: NonBlankStr
+        value_var: NonBlankStr
+        frequency: Union[str, None, msgspec.UnsetType] = UNSET
+        analysis_type: Literal[TIME_SERIES_ANALYSIS_CHOICES] = 'decomposition'
+        forecast_periods: int = 10
+
+    class BayesianAnalysisRequest(msgspec.Struct, frozen=True):
+        """Schema for Bayesian analysis requests."""
+        dataset_id: uuid.UUID
+        analysis_type: Literal[BAYESIAN_ANALYSIS_CHOICES] = 'inference'
+        parameters: dict = {}
+        iterations: int = 1000
+        tune: int = 500
+        chains: int = 2
+else:
+    StatisticalTestRequest = None
+    DescriptiveStatsRequest = None
+    CorrelationAnalysisRequest = None
+    RegressionAnalysisRequest = None
+    ClusteringAnalysisRequest = None
+    TimeSeriesAnalysisRequest = None
+    BayesianAnalysisRequest = None
+
+
+def _validation_error(exc):
+    """Convert a msgspec.ValidationError into DRF's field-keyed error shape."""
+    message = str(exc)
+    missing = _MISSING_FIELD_RE.search(message)
+    if missing:
+        return ValidationError({missing.group(1): ['This field is required.']})
+    path = _ERROR_PATH_RE.search(message)
+    if path:
+        return ValidationError({path.group(1): [message]})
+    return ValidationError({'non_field_errors': [message]})
+
+
+def validate_request(request, schema, serializer_class):
+    """
+    Validate a request body against a msgspec schema.
+
+    Args:
+        request: DRF request for the endpoint
+        schema: msgspec Struct describing the body, or None
+        serializer_class: Equivalent DRF serializer used as the fallback
+
+    Returns:
+        Dict of validated data; optional fields that were not sent are omitted,
+        matching Serializer.validated_data
+
+    Raises:
+        ParseError: If the body is not valid JSON
+        ValidationError: If the body does not match the schema
+    """
+    if schema is None or request.content_type.split(';')[0].strip() != 'application/json':
+        serializer = serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+    try:
+        data = msgspec.json.decode(request.body, type=schema, strict=False)
+    except msgspec.ValidationError as exc:
+        raise _validation_error(exc)
+    except msgspec.DecodeError as exc:
+        raise ParseError(f'JSON parse error - {exc}')
+
+    validated = {
+        name: getattr(data, name)
+        for name in data.__struct_fields__
+        if getattr(data, name) is not UNSET
+    }
+    _trim_strings(validated)
+    return validated
+
+
+def _trim_strings(validated):
+    """
+    Trim string fields and list items in place, rejecting blank ones.
+
+    The request serializers use CharFields without allow_blank, which strip
+    surrounding whitespace and then refuse empty strings; msgspec only sees
+    the raw length, so the same rule is applied after decoding.
+    """
+    errors = {}
+    for name, value in validated.items():
+        if isinstance(value, str):
+            value = validated[name] = value.strip()
+            if not value:
+                errors[name] = [_BLANK_ERROR]
+        elif isinstance(value, list) and any(isinstance(item, str) for item in value):
+            items = validated[name] = [
+                item.strip() if isinstance(item, str) else item for item in value
+            ]
+            blank = {index: [_BLANK_ERROR] for index, item in enumerate(items) if item == ''}
+            if blank:
+                errors[name] = blank
+    if errors:
+        raise ValidationError(errors)
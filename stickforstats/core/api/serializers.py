@@ -1,183 +1,523 @@
+import copy
+import functools
+import re
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
 from rest_framework import serializers
+from rest_framework.fields import get_error_detail
+from rest_framework.validators import ProhibitSurrogateCharactersValidator
 from django.contrib.auth import get_user_model
-from ..models import Analysis
-from stickforstats.mainapp.models.analysis import Dataset, Visualization
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import ProhibitNullCharactersValidator
+from django.db import transaction
+from django.db.models import TextField
+from django.db.models.functions import Cast
+from django.utils.functional import cached_property
+from stickforstats.mainapp.models.analysis import (
+    AnalysisResult, AnalysisSession, Dataset, Visualization
+)
 from stickforstats.mainapp.models.workflow import Workflow, WorkflowStep
+from stickforstats.mainapp.models.user import UserProfile
+from .renderers import RawJSON
 
 # Define placeholder models for backward compatibility
 # These will be replaced with proper implementations as needed
+@dataclass(slots=True, frozen=True)
 class DataValidationResult:
-    pass
+    id: Optional[uuid.UUID] = None
+    dataset: Optional[uuid.UUID] = None
+    validation_type: str = ''
+    created_at: Optional[datetime] = None
+    is_valid: bool = False
+    validation_messages: list = field(default_factory=list)
 
+@dataclass(slots=True, frozen=True)
 class Report:
-    pass
+    id: Optional[uuid.UUID] = None
+    user: Optional[int] = None
+    name: str = ''
+    description: str = ''
+    report_type: str = ''
+    created_at: Optional[datetime] = None
+    analyses: list = field(default_factory=list)
+    file_path: str = ''
+    parameters: dict = field(default_factory=dict)
 
+@dataclass(slots=True, frozen=True)
 class GuidanceRecommendation:
-    pass
+    id: Optional[uuid.UUID] = None
+    user: Optional[int] = None
+    created_at: Optional[datetime] = None
+    context_data: dict = field(default_factory=dict)
+    recommendation_type: str = ''
+    recommendation: dict = field(default_factory=dict)
+    applied: bool = False
 
+@dataclass(slots=True, frozen=True)
 class UserPreference:
-    pass
+    id: Optional[uuid.UUID] = None
+    user: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    preferences: dict = field(default_factory=dict)
 
 User = get_user_model()
 
-class UserSerializer(serializers.ModelSerializer):
+# Choice sets for the request serializers, shared with the msgspec schemas
+REPORT_FORMAT_CHOICES = ('pdf', 'html', 'docx')
+CORRELATION_METHOD_CHOICES = ('pearson', 'spearman', 'kendall', 'point_biserial')
+REGRESSION_TYPE_CHOICES = ('linear', 'multiple', 'polynomial', 'logistic', 'ridge', 'lasso')
+CLUSTERING_METHOD_CHOICES = ('kmeans', 'hierarchical', 'dbscan', 'gaussian_mixture')
+TIME_SERIES_ANALYSIS_CHOICES = ('decomposition', 'trend', 'seasonality', 'forecast')
+BAYESIAN_ANALYSIS_CHOICES = ('inference', 'regression', 'hierarchical', 'ab_testing')
+
+
+@functools.lru_cache(maxsize=None)
+def _build_choice_maps(choices):
+    """Build ChoiceField's lookup dicts once per choices tuple."""
+    field = serializers.ChoiceField(choices=choices)
+    return field.grouped_choices, field._choices, field.choice_strings_to_values
+
+
+class CachedChoiceField(serializers.ChoiceField):
+    """
+    ChoiceField that shares its lookup dicts between instances.
+
+    ChoiceField rebuilds grouped_choices, the flattened choices and the
+    string-to-value map every time choices is assigned, which happens again
+    for each copy of the field a serializer binds. For the immutable choice
+    tuples above the maps are built once and shared; they are only ever read.
+    """
+
+    def _set_choices(self, choices):
+        if not isinstance(choices, tuple):
+            super()._set_choices(choices)
+            return
+        self.grouped_choices, self._choices, self.choice_strings_to_values = (
+            _build_choice_maps(choices)
+        )
+
+    choices = property(serializers.ChoiceField._get_choices, _set_choices)
+
+
+# Hex UUID with optional hyphens, braces or urn prefix, as uuid.UUID accepts
+_UUID_RE = re.compile(
+    r'\A(?:urn:uuid:)?\{?[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?'
+    r'[0-9a-f]{4}-?[0-9a-f]{12}\}?\Z',
+    re.IGNORECASE
+)
+
+
+class FastUUIDField(serializers.UUIDField):
+    """
+    UUIDField that screens string input with a compiled regex.
+
+    Malformed strings are rejected by the C regex engine instead of by
+    uuid.UUID raising ValueError, and any string the pattern accepts is known
+    to parse. Non-string input (UUID instances, ints) takes the stock path.
+    """
+
+    def to_internal_value(self, data):
+        if not isinstance(data, str):
+            return super().to_internal_value(data)
+        if not _UUID_RE.match(data):
+            self.fail('invalid', value=data)
+        return uuid.UUID(data)
+
+
+class FastCharField(serializers.CharField):
+    """
+    CharField that applies its built-in checks inline.
+
+    CharField appends length, null character and surrogate validators, each
+    run as a separate Python call per value. Here the length checks are plain
+    len() comparisons, the null check is a substring test and the surrogate
+    scan is skipped for ASCII strings, which cannot contain surrogates; other
+    strings are screened with a single UTF-8 encode. Validators passed in by
+    the caller still run as usual.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Drop the validators CharField.__init__ appended after the caller's
+        appended = 2 + (self.max_length is not None) + (self.min_length is not None)
+        self.validators = self.validators[:-appended]
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if self.max_length is not None and len(value) > self.max_length:
+            self.fail('max_length', max_length=self.max_length)
+        if self.min_length is not None and len(value) < self.min_length:
+            self.fail('min_length', min_length=self.min_length)
+        if '\x00' in value:
+            self._reject(ProhibitNullCharactersValidator(), value)
+        if not value.isascii():
+            try:
+                value.encode('utf-8')
+            except UnicodeEncodeError:
+                self._reject(ProhibitSurrogateCharactersValidator(), value)
+        return value
+
+    def _reject(self, validator, value):
+        """Raise the error the stock validator reports for value."""
+        try:
+            validator(value)
+        except DjangoValidationError as exc:
+            raise serializers.ValidationError(get_error_detail(exc))
+
+
+class SharedChildListField(serializers.ListField):
+    """
+    ListField that shares one child field instance across all its copies.
+
+    ListField deep-copies and rebinds its child for every serializer
+    instance. The child fields passed here keep no per-request state and
+    never read their parent, so a single module-level instance, bound once,
+    serves every list. Only child and allow_empty are supported.
+    """
+
+    def __init__(self, *, child, allow_empty=True, **kwargs):
+        # ListField.__init__ would rebind the child and reject it as already
+        # bound, so its two relevant assignments are done here instead
+        self.child = child
+        self.allow_empty = allow_empty
+        self.max_length = None
+        self.min_length = None
+        serializers.Field.__init__(self, **kwargs)
+
+    def __deepcopy__(self, memo):
+        memo[id(self.child)] = self.child
+        return super().__deepcopy__(memo)
+
+
+def _shared_child(field):
+    """Bind a child field once for use with SharedChildListField."""
+    field.bind(field_name='', parent=None)
+    return field
+
+
+_CHAR_CHILD = _shared_child(FastCharField())
+_UUID_CHILD = _shared_child(FastUUIDField())
+
+
+def with_json_text(queryset, *field_names):
+    """
+    Fetch JSON columns as their text for RawJSONField passthrough.
+
+    Each field is annotated as <name>_text and deferred, so the database
+    driver never decodes it into Python objects.
+    """
+    return queryset.annotate(**{
+        f'{name}_text': Cast(name, output_field=TextField()) for name in field_names
+    }).defer(*field_names)
+
+
+def json_or_raw(instance, field_name):
+    """
+    Return a JSON field as RawJSON when with_json_text fetched its text.
+
+    The text is only used while the field is still deferred; once the field
+    is assigned, e.g. by a serializer update, the annotation is stale.
+    """
+    text = getattr(instance, f'{field_name}_text', None)
+    if text is not None and field_name in instance.get_deferred_fields():
+        return RawJSON(text)
+    return getattr(instance, field_name)
+
+
+class RawJSONField(serializers.JSONField):
+    """
+    JSONField that emits the stored JSON text verbatim on output.
+
+    When the instance comes from a with_json_text queryset the column's text
+    is wrapped in RawJSON, which the API renderers embed without parsing, so
+    large figure specs skip both the decode and the re-encode. Otherwise it
+    behaves like JSONField.
+    """
+
+    def get_attribute(self, instance):
+        return json_or_raw(instance, self.source)
+
+    def to_representation(self, value):
+        if isinstance(value, RawJSON):
+            return value
+        return super().to_representation(value)
+
+
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields and validators once per class.
+
+    ModelSerializer introspects the model's _meta and constructs every field
+    on each instantiation, although Meta never changes. The unbound fields are
+    cached on first use and each instance gets a deep copy, which replays the
+    cheap Field.__deepcopy__ instead of model introspection. A shallow copy is
+    not enough: list and nested fields bind their child in __init__.
+
+    The readable and writable field lists are also kept per instance. DRF
+    recomputes them from fields on every to_representation/to_internal_value
+    call, i.e. once per row when the serializer is a list child.
+    """
+    _fields_cache = {}
+    _validators_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return copy.deepcopy(self._fields_cache[cls])
+
+    def get_validators(self):
+        cls = type(self)
+        if cls not in self._validators_cache:
+            self._validators_cache[cls] = super().get_validators()
+        return list(self._validators_cache[cls])
+
+    @cached_property
+    def _readable_fields(self):
+        return tuple(f for f in self.fields.values() if not f.write_only)
+
+    @cached_property
+    def _writable_fields(self):
+        return tuple(f for f in self.fields.values() if not f.read_only)
+
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for User objects."""
     class Meta:
         model = User
-        fields = ['id', 'username', 'email', 'first_name', 'last_name', 'date_joined']
-        read_only_fields = ['id', 'date_joined']
+        fields = ('id', 'username', 'email', 'first_name', 'last_name', 'date_joined')
+        read_only_fields = ('id', 'date_joined')
 
-class DatasetSerializer(serializers.ModelSerializer):
+class DatasetSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Dataset objects."""
     class Meta:
         model = Dataset
-        fields = ['id', 'user', 'name', 'description', 'file', 'file_type',
+        fields = ('id', 'user', 'name', 'description', 'file', 'file_type',
                  'created_at', 'updated_at', 'has_header', 'delimiter',
-                 'row_count', 'column_count', 'columns_info']
-        read_only_fields = ['id', 'created_at', 'updated_at']
+                 'row_count', 'column_count', 'columns_info')
+        read_only_fields = ('id', 'created_at', 'updated_at')
 
-class DataValidationResultSerializer(serializers.ModelSerializer):
+class DataValidationResultSerializer(serializers.Serializer):
     """Serializer for DataValidationResult objects."""
-    class Meta:
-        model = DataValidationResult
-        fields = ['id', 'dataset', 'validation_type', 'created_at', 
-                 'is_valid', 'validation_messages']
-        read_only_fields = ['id', 'created_at']
+    id = serializers.UUIDField(read_only=True)
+    dataset = serializers.UUIDField()
+    validation_type = FastCharField()
+    created_at = serializers.DateTimeField(read_only=True)
+    is_valid = serializers.BooleanField()
+    validation_messages = serializers.ListField(default=list)
 
-class VisualizationSerializer(serializers.ModelSerializer):
+class VisualizationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Visualization objects."""
+    figure_data = RawJSONField()
+    
     class Meta:
         model = Visualization
-        fields = ['id', 'analysis', 'title', 'description', 'visualization_type',
-                 'created_at', 'updated_at', 'parameters', 'figure_data', 'image_path']
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        fields = ('id', 'analysis_result', 'title', 'description', 'visualization_type',
+                 'created_at', 'figure_data', 'figure_layout')
+        read_only_fields = ('id', 'created_at')
 
-class AnalysisSerializer(serializers.ModelSerializer):
-    """Serializer for Analysis objects."""
-    visualizations = VisualizationSerializer(many=True, read_only=True)
+class AnalysisSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Serializer for AnalysisSession objects."""
+    visualizations = serializers.SerializerMethodField()
     
     class Meta:
-        model = Analysis
-        fields = ['id', 'user', 'name', 'description', 'analysis_type',
-                 'created_at', 'updated_at', 'parameters', 'results', 
-                 'metadata', 'visualizations']
-        read_only_fields = ['id', 'created_at', 'updated_at']
-
-class AnalysisCreateSerializer(serializers.ModelSerializer):
-    """Serializer for creating Analysis objects."""
-    visualizations = serializers.ListField(
-        child=serializers.DictField(), 
-        required=False,
-        write_only=True
-    )
+        model = AnalysisSession
+        fields = ('id', 'user', 'dataset', 'name', 'description', 'module', 'status',
+                 'configuration', 'created_at', 'updated_at', 'completed_at',
+                 'visualizations')
+        read_only_fields = ('id', 'user', 'created_at', 'updated_at', 'completed_at')
     
+    def get_visualizations(self, obj):
+        """
+        Return the visualizations of every result in the analysis as plain dicts.
+        
+        Building the dicts directly skips binding and running a nested
+        serializer per visualization. AnalysisViewSet prefetches
+        results__visualizations so this does not query per row.
+        """
+        return [
+            {
+                'id': viz.id,
+                'analysis_result': viz.analysis_result_id,
+                'title': viz.title,
+                'description': viz.description,
+                'visualization_type': viz.visualization_type,
+                'created_at': viz.created_at,
+                'figure_data': json_or_raw(viz, 'figure_data'),
+                'figure_layout': viz.figure_layout,
+            }
+            for result in obj.results.all()
+            for viz in result.visualizations.all()
+        ]
+
+class AnalysisVisualizationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Serializer for the visualizations submitted with a new analysis."""
     class Meta:
-        model = Analysis
-        fields = ['id', 'user', 'name', 'description', 'analysis_type',
-                 'parameters', 'results', 'metadata', 'visualizations']
-        read_only_fields = ['id']
+        model = Visualization
+        fields = ('title', 'description', 'visualization_type', 'figure_data',
+                 'figure_layout')
+
+class AnalysisCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Serializer for creating AnalysisSession objects with their visualizations."""
+    visualizations = AnalysisVisualizationSerializer(many=True, required=False, write_only=True)
+    
+    class Meta:
+        model = AnalysisSession
+        fields = ('id', 'user', 'dataset', 'name', 'description', 'module',
+                 'configuration', 'visualizations')
+        read_only_fields = ('id', 'user')
     
     def create(self, validated_data):
         visualizations_data = validated_data.pop('visualizations', [])
-        analysis = Analysis.objects.create(**validated_data)
-        
-        # Create visualizations for the analysis
-        for viz_data in visualizations_data:
-            Visualization.objects.create(analysis=analysis, **viz_data)
+        with transaction.atomic():
+            session = AnalysisSession.objects.create(**validated_data)
+            
+            if visualizations_data:
+                # Visualizations hang off a result, so submitted ones get one
+                # result for the session, then go in a single INSERT batch
+                result = AnalysisResult.objects.create(
+                    session=session, name=session.name, analysis_type=session.module
+                )
+                Visualization.objects.bulk_create(
+                    [Visualization(analysis_result=result, **viz_data)
+                     for viz_data in visualizations_data],
+                    batch_size=500
+                )
         
-        return analysis
+        return session
 
-class ReportSerializer(serializers.ModelSerializer):
+class ReportSerializer(serializers.Serializer):
     """Serializer for Report objects."""
-    class Meta:
-        model = Report
-        fields = ['id', 'user', 'name', 'description', 'report_type',
-                 'created_at', 'analyses', 'file_path', 'parameters']
-        read_only_fields = ['id', 'created_at']
+    id = serializers.UUIDField(read_only=True)
+    user = serializers.IntegerField(allow_null=True, required=False)
+    name = FastCharField(max_length=255)
+    description = FastCharField(required=False, allow_blank=True)
+    report_type = FastCharField()
+    created_at = serializers.DateTimeField(read_only=True)
+    analyses = SharedChildListField(child=_UUID_CHILD, default=list)
+    file_path = FastCharField(required=False, allow_blank=True)
+    parameters = serializers.DictField(default=dict)
 
-class WorkflowSerializer(serializers.ModelSerializer):
+class WorkflowSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Workflow objects."""
     class Meta:
         model = Workflow
-        fields = ['id', 'user', 'name', 'description', 'created_at',
-                 'updated_at', 'dataset', 'steps', 'status']
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        fields = ('id', 'user', 'name', 'description', 'created_at',
+                 'updated_at', 'dataset', 'steps', 'status')
+        read_only_fields = ('id', 'created_at', 'updated_at')
 
-class GuidanceRecommendationSerializer(serializers.ModelSerializer):
-    """Serializer for GuidanceRecommendation objects."""
+class WorkflowStepSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Serializer for the steps submitted with a new workflow."""
     class Meta:
-        model = GuidanceRecommendation
-        fields = ['id', 'user', 'created_at', 'context_data', 
-                 'recommendation_type', 'recommendation', 'applied']
-        read_only_fields = ['id', 'created_at']
+        model = WorkflowStep
+        fields = ('name', 'description', 'step_type', 'order', 'configuration',
+                 'is_required', 'timeout_seconds')
+
+class WorkflowCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Serializer for creating Workflow objects together with their steps."""
+    steps = WorkflowStepSerializer(many=True, required=False, write_only=True)
+    
+    class Meta:
+        model = Workflow
+        fields = ('id', 'user', 'name', 'description', 'created_at',
+                 'updated_at', 'dataset', 'steps', 'status')
+        read_only_fields = ('id', 'created_at', 'updated_at')
+    
+    def create(self, validated_data):
+        steps_data = validated_data.pop('steps', [])
+        with transaction.atomic():
+            workflow = Workflow.objects.create(**validated_data)
+            
+            # Create the steps in a single INSERT batch, numbered in submitted order
+            WorkflowStep.objects.bulk_create(
+                [WorkflowStep(workflow=workflow, **{'order': index, **step_data})
+                 for index, step_data in enumerate(steps_data)],
+                batch_size=500
+            )
+        
+        return workflow
+
+class GuidanceRecommendationSerializer(serializers.Serializer):
+    """Serializer for GuidanceRecommendation objects."""
+    id = serializers.UUIDField(read_only=True)
+    user = serializers.IntegerField(allow_null=True, required=False)
+    created_at = serializers.DateTimeField(read_only=True)
+    context_data = serializers.DictField(default=dict)
+    recommendation_type = FastCharField()
+    recommendation = serializers.DictField(default=dict)
+    applied = serializers.BooleanField(default=False)
 
-class UserPreferenceSerializer(serializers.ModelSerializer):
+class UserPreferenceSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for UserPreference objects."""
     class Meta:
-        model = UserPreference
-        fields = ['id', 'user', 'created_at', 'updated_at', 'preferences']
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        # The preference fields live on the user's profile
+        model = UserProfile
+        fields = ('id', 'user', 'created_at', 'updated_at', 'preferences')
+        read_only_fields = ('id', 'created_at', 'updated_at')
 
 # Specialized serializers for specific operations
 
 class DataUploadSerializer(serializers.Serializer):
     """Serializer for data upload operations."""
     file = serializers.FileField()
-    name = serializers.CharField(max_length=255)
-    description = serializers.CharField(required=False, allow_blank=True)
+    name = FastCharField(max_length=255)
+    description = FastCharField(required=False, allow_blank=True)
     validate = serializers.BooleanField(default=True)
 
 class AnalysisRequestSerializer(serializers.Serializer):
     """Serializer for analysis requests."""
-    dataset_id = serializers.UUIDField()
-    analysis_type = serializers.CharField(max_length=100)
+    dataset_id = FastUUIDField()
+    analysis_type = FastCharField(max_length=100)
     parameters = serializers.DictField(default=dict)
-    name = serializers.CharField(max_length=255)
-    description = serializers.CharField(required=False, allow_blank=True)
+    name = FastCharField(max_length=255)
+    description = FastCharField(required=False, allow_blank=True)
 
 class ReportGenerationSerializer(serializers.Serializer):
     """Serializer for report generation requests."""
-    analysis_ids = serializers.ListField(child=serializers.UUIDField())
-    title = serializers.CharField(max_length=255)
-    description = serializers.CharField(required=False, allow_blank=True)
-    report_format = serializers.ChoiceField(choices=['pdf', 'html', 'docx'], default='pdf')
+    analysis_ids = SharedChildListField(child=_UUID_CHILD)
+    title = FastCharField(max_length=255)
+    description = FastCharField(required=False, allow_blank=True)
+    report_format = CachedChoiceField(choices=REPORT_FORMAT_CHOICES, default='pdf')
     include_visualizations = serializers.BooleanField(default=True)
     include_raw_data = serializers.BooleanField(default=False)
 
 class GuidanceRequestSerializer(serializers.Serializer):
     """Serializer for guidance requests."""
-    dataset_id = serializers.UUIDField()
+    dataset_id = FastUUIDField()
     user_goals = serializers.DictField(required=False, default=dict)
 
 # Statistical Analysis Serializers
 
 class StatisticalTestRequestSerializer(serializers.Serializer):
     """Serializer for general statistical test requests."""
-    dataset_id = serializers.UUIDField()
-    test_type = serializers.CharField(max_length=100)
+    dataset_id = FastUUIDField()
+    test_type = FastCharField(max_length=100)
     parameters = serializers.DictField(default=dict)
 
     # Common test parameters
-    variables = serializers.ListField(child=serializers.CharField(), required=False)
-    groups = serializers.CharField(required=False, allow_null=True)
-    dependent_var = serializers.CharField(required=False, allow_null=True)
-    independent_vars = serializers.ListField(child=serializers.CharField(), required=False)
+    variables = SharedChildListField(child=_CHAR_CHILD, required=False)
+    groups = FastCharField(required=False, allow_null=True)
+    dependent_var = FastCharField(required=False, allow_null=True)
+    independent_vars = SharedChildListField(child=_CHAR_CHILD, required=False)
     alpha = serializers.FloatField(default=0.05, required=False)
 
 class DescriptiveStatsRequestSerializer(serializers.Serializer):
     """Serializer for descriptive statistics requests."""
-    dataset_id = serializers.UUIDField()
-    variables = serializers.ListField(child=serializers.CharField())
+    dataset_id = FastUUIDField()
+    variables = SharedChildListField(child=_CHAR_CHILD)
     include_quartiles = serializers.BooleanField(default=True, required=False)
     include_normality = serializers.BooleanField(default=True, required=False)
     include_histogram = serializers.BooleanField(default=True, required=False)
 
 class CorrelationAnalysisRequestSerializer(serializers.Serializer):
     """Serializer for correlation analysis requests."""
-    dataset_id = serializers.UUIDField()
-    variables = serializers.ListField(child=serializers.CharField())
-    method = serializers.ChoiceField(
-        choices=['pearson', 'spearman', 'kendall', 'point_biserial'],
+    dataset_id = FastUUIDField()
+    variables = SharedChildListField(child=_CHAR_CHILD)
+    method = CachedChoiceField(
+        choices=CORRELATION_METHOD_CHOICES,
         default='pearson',
         required=False
     )
@@ -185,11 +525,11 @@ class CorrelationAnalysisRequestSerializer(serializers.Serializer):
 
 class RegressionAnalysisRequestSerializer(serializers.Serializer):
     """Serializer for regression analysis requests."""
-    dataset_id = serializers.UUIDField()
-    dependent_var = serializers.CharField()
-    independent_vars = serializers.ListField(child=serializers.CharField())
-    regression_type = serializers.ChoiceField(
-        choices=['linear', 'multiple', 'polynomial', 'logistic', 'ridge', 'lasso'],
+    dataset_id = FastUUIDField()
+    dependent_var = FastCharField()
+    independent_vars = SharedChildListField(child=_CHAR_CHILD)
+    regression_type = CachedChoiceField(
+        choices=REGRESSION_TYPE_CHOICES,
         default='linear',
         required=False
     )
@@ -197,10 +537,10 @@ class RegressionAnalysisRequestSerializer(serializers.Serializer):
 
 class ClusteringAnalysisRequestSerializer(serializers.Serializer):
     """Serializer for clustering analysis requests."""
-    dataset_id = serializers.UUIDField()
-    variables = serializers.ListField(child=serializers.CharField())
-    method = serializers.ChoiceField(
-        choices=['kmeans', 'hierarchical', 'dbscan', 'gaussian_mixture'],
+    dataset_id = FastUUIDField()
+    variables = SharedChildListField(child=_CHAR_CHILD)
+    method = CachedChoiceField(
+        choices=CLUSTERING_METHOD_CHOICES,
         default='kmeans',
         required=False
     )
@@ -209,12 +549,12 @@ class ClusteringAnalysisRequestSerializer(serializers.Serializer):
 
 class TimeSeriesAnalysisRequestSerializer(serializers.Serializer):
     """Serializer for time series analysis requests."""
-    dataset_id = serializers.UUIDField()
-    time_var = serializers.CharField()
-    value_var = serializers.CharField()
-    frequency = serializers.CharField(required=False, allow_null=True)
-    analysis_type = serializers.ChoiceField(
-        choices=['decomposition', 'trend', 'seasonality', 'forecast'],
+    dataset_id = FastUUIDField()
+    time_var = FastCharField()
+    value_var = FastCharField()
+    frequency = FastCharField(required=False, allow_null=True)
+    analysis_type = CachedChoiceField(
+        choices=TIME_SERIES_ANALYSIS_CHOICES,
         default='decomposition',
         required=False
     )
@@ -222,9 +562,9 @@ class TimeSeriesAnalysisRequestSerializer(serializers.Serializer):
 
 class BayesianAnalysisRequestSerializer(serializers.Serializer):
     """Serializer for Bayesian analysis requests."""
-    dataset_id = serializers.UUIDField()
-    analysis_type = serializers.ChoiceField(
-        choices=['inference', 'regression', 'hierarchical', 'ab_testing'],
+    dataset_id = FastUUIDField()
+    analysis_type = CachedChoiceField(
+        choices=BAYESIAN_ANALYSIS_CHOICES,
         default='inference'
     )
     parameters = serializers.DictField(default=dict)
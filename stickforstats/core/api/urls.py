@@ -1,9 +1,7 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
-from rest_framework.authtoken import views as token_views
+from rest_framework.authtoken.views import obtain_auth_token
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from .views import (
-    DatasetViewSet, AnalysisViewSet, VisualizationViewSet,
-    ReportViewSet, WorkflowViewSet, GuidanceViewSet, UserPreferenceViewSet,
     StatisticalTestView, DescriptiveStatsView, CorrelationAnalysisView,
     RegressionAnalysisView, TimeSeriesAnalysisView, BayesianAnalysisView,
     ModuleStatusView, ValidateModulesView, TroubleshootModuleView
@@ -13,33 +11,35 @@ from .auth_views import (
 )
 from .advanced_stats_mock import mock_models_list, mock_analysis
 
-router = DefaultRouter()
-router.register(r'datasets', DatasetViewSet, basename='dataset')
-router.register(r'analyses', AnalysisViewSet, basename='analysis')
-router.register(r'visualizations', VisualizationViewSet, basename='visualization')
-router.register(r'reports', ReportViewSet, basename='report')
-router.register(r'workflows', WorkflowViewSet, basename='workflow')
-router.register(r'guidance', GuidanceViewSet, basename='guidance')
-router.register(r'preferences', UserPreferenceViewSet, basename='preference')
-
-urlpatterns = [
-    path('', include(router.urls)),
+# Viewset routes are written out ahead of time by `manage.py dump_urls`, so
+# the router does not introspect every viewset when this module is imported
+try:
+    from ._generated_urls import router_urls
+except ImportError:
+    from .routers import router
+    router_urls = router.urls
 
+urlpatterns = router_urls + [
     # Authentication endpoints
     path('auth/register/', RegisterView.as_view(), name='api_register'),
     path('auth/login/', LoginView.as_view(), name='api_login'),
     path('auth/logout/', LogoutView.as_view(), name='api_logout'),
     path('auth/profile/', UserProfileView.as_view(), name='api_profile'),
     path('auth/change-password/', ChangePasswordView.as_view(), name='api_change_password'),
-    path('auth/token/', token_views.obtain_auth_token, name='api_token_auth'),  # Keep for backward compatibility
+    path('auth/token/', TokenObtainPairView.as_view(), name='api_token_auth'),
+    path('auth/token/refresh/', TokenRefreshView.as_view(), name='api_token_refresh'),
+    # DRF tokens for clients that send `Authorization: Token <key>`
+    path('auth/authtoken/', obtain_auth_token, name='api_authtoken'),
 
-    # Statistical Analysis API endpoints
-    path('statistics/test/', StatisticalTestView.as_view(), name='statistical_test'),
-    path('statistics/descriptive/', DescriptiveStatsView.as_view(), name='descriptive_stats'),
-    path('statistics/correlation/', CorrelationAnalysisView.as_view(), name='correlation_analysis'),
-    path('statistics/regression/', RegressionAnalysisView.as_view(), name='regression_analysis'),
-    path('statistics/time-series/', TimeSeriesAnalysisView.as_view(), name='time_series_analysis'),
-    path('statistics/bayesian/', BayesianAnalysisView.as_view(), name='bayesian_analysis'),
+    # Statistical Analysis API endpoints, grouped so other paths skip them on one prefix check
+    path('statistics/', include([
+        path('test/', StatisticalTestView.as_view(), name='statistical_test'),
+        path('descriptive/', DescriptiveStatsView.as_view(), name='descriptive_stats'),
+        path('correlation/', CorrelationAnalysisView.as_view(), name='correlation_analysis'),
+        path('regression/', RegressionAnalysisView.as_view(), name='regression_analysis'),
+        path('time-series/', TimeSeriesAnalysisView.as_view(), name='time_series_analysis'),
+        path('bayesian/', BayesianAnalysisView.as_view(), name='bayesian_analysis'),
+    ])),
 
     # Module Integration API endpoints
     path('modules/status/', ModuleStatusView.as_view(), name='module_status'),
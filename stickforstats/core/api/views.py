@@ -1,32 +1,42 @@
 
 # Module Integration API Views
 import logging
+import os
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
-from django.contrib.auth import get_user_model
+from rest_framework.parsers import MultiPartParser
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
 from django.shortcuts import get_object_or_404
 from django.db import transaction
+from django.db.models import Prefetch
 
 from ..registry import get_registry
 from ..module_integration import generate_integration_report, troubleshoot_module, get_integrator
-from stickforstats.mainapp.models.analysis import Dataset, AnalysisSession, AnalysisResult, Visualization
+from stickforstats.mainapp.models.analysis import Dataset, AnalysisSession, Visualization
 from stickforstats.mainapp.models.workflow import Workflow, WorkflowStep
 from stickforstats.mainapp.models.user import UserProfile
 
 from .serializers import (
     UserSerializer, DatasetSerializer, AnalysisSerializer,
     AnalysisCreateSerializer, VisualizationSerializer, ReportSerializer,
-    WorkflowSerializer, GuidanceRecommendationSerializer, UserPreferenceSerializer,
+    WorkflowSerializer, WorkflowCreateSerializer, GuidanceRecommendationSerializer, UserPreferenceSerializer,
     DataUploadSerializer, AnalysisRequestSerializer, ReportGenerationSerializer,
     GuidanceRequestSerializer, StatisticalTestRequestSerializer,
     DescriptiveStatsRequestSerializer, CorrelationAnalysisRequestSerializer,
     RegressionAnalysisRequestSerializer, TimeSeriesAnalysisRequestSerializer,
-    BayesianAnalysisRequestSerializer
+    BayesianAnalysisRequestSerializer, with_json_text
+)
+from .caching import CachedResponseMixin
+from .mixins import EagerLoadingMixin, FastListMixin
+from .pagination import CreatedAtCursorPagination
+from .schemas import (
+    validate_request, StatisticalTestRequest, DescriptiveStatsRequest,
+    CorrelationAnalysisRequest, RegressionAnalysisRequest,
+    TimeSeriesAnalysisRequest, BayesianAnalysisRequest
 )
 
-User = get_user_model()
 logger = logging.getLogger(__name__)
 
 class ModuleStatusView(APIView):
@@ -48,11 +58,11 @@ class ModuleStatusView(APIView):
             
             # Return more details if requested
             if request.query_params.get('detailed', '').lower() == 'true':
-                response_data['module_details'] = modules
+                response_data['module_details'] = dict(modules)
             
             return Response(response_data)
         except Exception as e:
-            logger.error(f"Error retrieving module status: {str(e)}")
+            logger.error("Error retrieving module status: %s", e)
             return Response(
                 {'error': f"Error retrieving module status: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -66,12 +76,12 @@ class ValidateModulesView(APIView):
     def get(self, request):
         """Validate all modules and return results."""
         try:
-            # Generate validation report
-            report = generate_integration_report()
-            
             # Format response based on verbosity level
             verbosity = request.query_params.get('verbosity', 'standard')
             
+            # Generate validation report; only the detailed view lists service checks
+            report = generate_integration_report(deep=verbosity == 'detailed')
+            
             if verbosity == 'minimal':
                 response_data = {
                     'status': report['status'],
@@ -92,7 +102,7 @@ class ValidateModulesView(APIView):
             
             return Response(response_data)
         except Exception as e:
-            logger.error(f"Error validating modules: {str(e)}")
+            logger.error("Error validating modules: %s", e)
             return Response(
                 {'error': f"Error validating modules: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -117,7 +127,7 @@ class TroubleshootModuleView(APIView):
 
             return Response(results)
         except Exception as e:
-            logger.error(f"Error troubleshooting module {module_name}: {str(e)}")
+            logger.error("Error troubleshooting module %s: %s", module_name, e)
             return Response(
                 {'error': f"Error troubleshooting module: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -125,10 +135,19 @@ class TroubleshootModuleView(APIView):
 
 
 # ViewSets for core models
-class DatasetViewSet(viewsets.ModelViewSet):
+class DatasetViewSet(CachedResponseMixin, FastListMixin, viewsets.ModelViewSet):
     """ViewSet for the Dataset model."""
     serializer_class = DatasetSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+
+    # File extensions accepted by the upload action
+    UPLOAD_FILE_TYPES = {
+        '.csv': 'csv',
+        '.xlsx': 'excel',
+        '.xls': 'excel',
+        '.json': 'json',
+    }
 
     def get_queryset(self):
         """Return datasets for the current user."""
@@ -138,6 +157,49 @@ class DatasetViewSet(viewsets.ModelViewSet):
         """Create a new dataset."""
         serializer.save(user=self.request.user)
 
+    def initialize_request(self, request, *args, **kwargs):
+        """Spool uploads straight to a temporary file for the upload action."""
+        if self.action_map.get(request.method.lower()) == 'upload':
+            # Must be set before anything reads the body, including CSRF checks
+            request.upload_handlers = [TemporaryFileUploadHandler(request)]
+        return super().initialize_request(request, *args, **kwargs)
+
+    @action(detail=False, methods=['post'], parser_classes=[MultiPartParser])
+    def upload(self, request):
+        """Upload a data file and profile it without loading it into memory."""
+        from ..services.dataset_service import DatasetService
+
+        serializer = DataUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data['file']
+
+        file_type = self.UPLOAD_FILE_TYPES.get(
+            os.path.splitext(upload.name)[1].lower(), 'other'
+        )
+        profile = {}
+        if file_type == 'csv' and serializer.validated_data['validate']:
+            source = (upload.temporary_file_path()
+                      if hasattr(upload, 'temporary_file_path') else upload)
+            try:
+                profile = DatasetService().profile_csv(source)
+            except Exception as e:
+                return Response(
+                    {'error': f"Unable to parse CSV file: {str(e)}"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            upload.seek(0)
+
+        dataset = Dataset.objects.create(
+            user=request.user,
+            name=serializer.validated_data['name'],
+            description=serializer.validated_data.get('description', ''),
+            file=upload,
+            file_type=file_type,
+            size_bytes=upload.size,
+            **profile
+        )
+        return Response(DatasetSerializer(dataset).data, status=status.HTTP_201_CREATED)
+
     @action(detail=True, methods=['post'])
     def validate(self, request, pk=None):
         """Validate the dataset."""
@@ -153,9 +215,19 @@ class DatasetViewSet(viewsets.ModelViewSet):
         return Response({'preview': 'Sample data would be here'})
 
 
-class AnalysisViewSet(viewsets.ModelViewSet):
+class AnalysisViewSet(CachedResponseMixin, EagerLoadingMixin, viewsets.ModelViewSet):
     """ViewSet for the Analysis model."""
+    queryset = AnalysisSession.objects.all()
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+    prefetch_related_fields = (
+        Prefetch(
+            'results__visualizations',
+            queryset=with_json_text(Visualization.objects.all(), 'figure_data')
+        ),
+    )
+    # results only counts rows, so it skips the visualization prefetch
+    skip_eager_loading_actions = ('results',)
 
     def get_serializer_class(self):
         """Return the appropriate serializer class."""
@@ -165,7 +237,7 @@ class AnalysisViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return analyses for the current user."""
-        return AnalysisSession.objects.filter(user=self.request.user)
+        return super().get_queryset().filter(user=self.request.user)
 
     def perform_create(self, serializer):
         """Create a new analysis."""
@@ -175,23 +247,25 @@ class AnalysisViewSet(viewsets.ModelViewSet):
     def results(self, request, pk=None):
         """Get results for an analysis."""
         analysis = self.get_object()
-        results = AnalysisResult.objects.filter(session=analysis)
         # Customize response as needed
         return Response({
-            'count': results.count(),
+            'count': analysis.results.count(),
             'results': 'Results would be serialized here'
         })
 
 
-class VisualizationViewSet(viewsets.ModelViewSet):
+class VisualizationViewSet(CachedResponseMixin, EagerLoadingMixin, viewsets.ModelViewSet):
     """ViewSet for the Visualization model."""
+    queryset = Visualization.objects.all()
     serializer_class = VisualizationSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         """Return visualizations for the current user's analyses."""
-        user_analyses = AnalysisResult.objects.filter(session__user=self.request.user)
-        return Visualization.objects.filter(analysis_result__in=user_analyses)
+        return with_json_text(
+            super().get_queryset().filter(analysis_result__session__user=self.request.user),
+            'figure_data'
+        )
 
     @action(detail=True, methods=['get'])
     def download(self, request, pk=None):
@@ -235,14 +309,26 @@ class ReportViewSet(viewsets.ViewSet):
         return Response({'export_status': 'initiated'})
 
 
-class WorkflowViewSet(viewsets.ModelViewSet):
+class WorkflowViewSet(CachedResponseMixin, EagerLoadingMixin, viewsets.ModelViewSet):
     """ViewSet for the Workflow model."""
-    serializer_class = WorkflowSerializer
+    queryset = Workflow.objects.all()
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+    # The serializer lists step ids; fetch them for the whole page at once
+    prefetch_related_fields = (
+        Prefetch('steps', queryset=WorkflowStep.objects.order_by('order')),
+    )
+    skip_eager_loading_actions = ('steps',)
+
+    def get_serializer_class(self):
+        """Return the appropriate serializer class."""
+        if self.action == 'create':
+            return WorkflowCreateSerializer
+        return WorkflowSerializer
 
     def get_queryset(self):
         """Return workflows for the current user."""
-        return Workflow.objects.filter(user=self.request.user)
+        return super().get_queryset().filter(user=self.request.user)
 
     def perform_create(self, serializer):
         """Create a new workflow."""
@@ -259,10 +345,9 @@ class WorkflowViewSet(viewsets.ModelViewSet):
     def steps(self, request, pk=None):
         """Get steps for a workflow."""
         workflow = self.get_object()
-        steps = WorkflowStep.objects.filter(workflow=workflow).order_by('order')
         # Serialize and return steps
         return Response({
-            'count': steps.count(),
+            'count': workflow.steps.count(),
             'steps': 'Steps would be serialized here'
         })
 
@@ -300,7 +385,7 @@ class GuidanceViewSet(viewsets.ViewSet):
         })
 
 
-class UserPreferenceViewSet(viewsets.ModelViewSet):
+class UserPreferenceViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """ViewSet for the UserPreference model."""
     serializer_class = UserPreferenceSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -311,19 +396,27 @@ class UserPreferenceViewSet(viewsets.ModelViewSet):
 
 
 # API Views for statistical operations
-class StatisticalTestView(APIView):
+class DatasetAccessMixin:
+    """Look up the requesting user's dataset for the statistical views."""
+
+    def get_dataset(self, request, dataset_id):
+        """Return the user's dataset with this id, or None if there is none."""
+        return Dataset.objects.filter(
+            id=dataset_id, user=request.user
+        ).only('id', 'name').first()
+
+
+class StatisticalTestView(DatasetAccessMixin, APIView):
     """API view for running statistical tests."""
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
         """Run a statistical test."""
-        serializer = StatisticalTestRequestSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        validated_data = validate_request(request, StatisticalTestRequest, StatisticalTestRequestSerializer)
 
         # Get dataset
-        try:
-            dataset = Dataset.objects.get(id=serializer.validated_data['dataset_id'], user=request.user)
-        except Dataset.DoesNotExist:
+        dataset = self.get_dataset(request, validated_data['dataset_id'])
+        if dataset is None:
             return Response(
                 {'error': 'Dataset not found or not accessible'},
                 status=status.HTTP_404_NOT_FOUND
@@ -333,24 +426,22 @@ class StatisticalTestView(APIView):
 
         return Response({
             'status': 'test_completed',
-            'test_type': serializer.validated_data['test_type'],
+            'test_type': validated_data['test_type'],
             'results': 'Test results would be here'
         })
 
 
-class DescriptiveStatsView(APIView):
+class DescriptiveStatsView(DatasetAccessMixin, APIView):
     """API view for generating descriptive statistics."""
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
         """Generate descriptive statistics."""
-        serializer = DescriptiveStatsRequestSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        validated_data = validate_request(request, DescriptiveStatsRequest, DescriptiveStatsRequestSerializer)
 
         # Get dataset
-        try:
-            dataset = Dataset.objects.get(id=serializer.validated_data['dataset_id'], user=request.user)
-        except Dataset.DoesNotExist:
+        dataset = self.get_dataset(request, validated_data['dataset_id'])
+        if dataset is None:
             return Response(
                 {'error': 'Dataset not found or not accessible'},
                 status=status.HTTP_404_NOT_FOUND
@@ -360,24 +451,22 @@ class DescriptiveStatsView(APIView):
 
         return Response({
             'dataset_name': dataset.name,
-            'variables': serializer.validated_data['variables'],
+            'variables': validated_data['variables'],
             'statistics': 'Statistics would be here'
         })
 
 
-class CorrelationAnalysisView(APIView):
+class CorrelationAnalysisView(DatasetAccessMixin, APIView):
     """API view for running correlation analysis."""
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
         """Run correlation analysis."""
-        serializer = CorrelationAnalysisRequestSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        validated_data = validate_request(request, CorrelationAnalysisRequest, CorrelationAnalysisRequestSerializer)
 
         # Get dataset
-        try:
-            dataset = Dataset.objects.get(id=serializer.validated_data['dataset_id'], user=request.user)
-        except Dataset.DoesNotExist:
+        dataset = self.get_dataset(request, validated_data['dataset_id'])
+        if dataset is None:
             return Response(
                 {'error': 'Dataset not found or not accessible'},
                 status=status.HTTP_404_NOT_FOUND
@@ -386,24 +475,22 @@ class CorrelationAnalysisView(APIView):
         # Implement correlation analysis logic here
 
         return Response({
-            'method': serializer.validated_data['method'],
+            'method': validated_data['method'],
             'results': 'Correlation results would be here'
         })
 
 
-class RegressionAnalysisView(APIView):
+class RegressionAnalysisView(DatasetAccessMixin, APIView):
     """API view for running regression analysis."""
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
         """Run regression analysis."""
-        serializer = RegressionAnalysisRequestSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        validated_data = validate_request(request, RegressionAnalysisRequest, RegressionAnalysisRequestSerializer)
 
         # Get dataset
-        try:
-            dataset = Dataset.objects.get(id=serializer.validated_data['dataset_id'], user=request.user)
-        except Dataset.DoesNotExist:
+        dataset = self.get_dataset(request, validated_data['dataset_id'])
+        if dataset is None:
             return Response(
                 {'error': 'Dataset not found or not accessible'},
                 status=status.HTTP_404_NOT_FOUND
@@ -412,25 +499,23 @@ class RegressionAnalysisView(APIView):
         # Implement regression analysis logic here
 
         return Response({
-            'regression_type': serializer.validated_data['regression_type'],
+            'regression_type': validated_data['regression_type'],
             'model_summary': 'Model summary would be here',
             'coefficients': 'Coefficients would be here'
         })
 
 
-class TimeSeriesAnalysisView(APIView):
+class TimeSeriesAnalysisView(DatasetAccessMixin, APIView):
     """API view for running time series analysis."""
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
         """Run time series analysis."""
-        serializer = TimeSeriesAnalysisRequestSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        validated_data = validate_request(request, TimeSeriesAnalysisRequest, TimeSeriesAnalysisRequestSerializer)
 
         # Get dataset
-        try:
-            dataset = Dataset.objects.get(id=serializer.validated_data['dataset_id'], user=request.user)
-        except Dataset.DoesNotExist:
+        dataset = self.get_dataset(request, validated_data['dataset_id'])
+        if dataset is None:
             return Response(
                 {'error': 'Dataset not found or not accessible'},
                 status=status.HTTP_404_NOT_FOUND
@@ -439,24 +524,22 @@ class TimeSeriesAnalysisView(APIView):
         # Implement time series analysis logic here
 
         return Response({
-            'analysis_type': serializer.validated_data['analysis_type'],
+            'analysis_type': validated_data['analysis_type'],
             'results': 'Time series results would be here'
         })
 
 
-class BayesianAnalysisView(APIView):
+class BayesianAnalysisView(DatasetAccessMixin, APIView):
     """API view for running Bayesian analysis."""
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
         """Run Bayesian analysis."""
-        serializer = BayesianAnalysisRequestSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        validated_data = validate_request(request, BayesianAnalysisRequest, BayesianAnalysisRequestSerializer)
 
         # Get dataset
-        try:
-            dataset = Dataset.objects.get(id=serializer.validated_data['dataset_id'], user=request.user)
-        except Dataset.DoesNotExist:
+        dataset = self.get_dataset(request, validated_data['dataset_id'])
+        if dataset is None:
             return Response(
                 {'error': 'Dataset not found or not accessible'},
                 status=status.HTTP_404_NOT_FOUND
@@ -465,7 +548,7 @@ class BayesianAnalysisView(APIView):
         # Implement Bayesian analysis logic here
 
         return Response({
-            'analysis_type': serializer.validated_data['analysis_type'],
+            'analysis_type': validated_data['analysis_type'],
             'model_summary': 'Model summary would be here',
             'posterior_samples': 'Posterior samples would be here'
         })
\ No newline at end of file
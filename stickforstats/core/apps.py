@@ -22,6 +22,9 @@ class CoreConfig(AppConfig):
         """
         from .registry import register_module
         
+        # Import signals so API response caches follow out-of-band writes
+        import stickforstats.core.signals
+        
         # Initialize the module registry
         try:
             # Register core module
@@ -34,20 +37,36 @@ class CoreConfig(AppConfig):
             # Auto-discover and register other modules
             from django.apps import apps
             import importlib
+            import importlib.util
+            
+            registry = get_registry()
+            candidates = [
+                app_config for app_config in apps.get_app_configs()
+                if app_config.name.startswith('stickforstats.') and app_config.name != 'stickforstats.core'
+            ]
+            
+            for app_config in candidates:
+                module_name = app_config.name.split('.')[-1]
+                # Look the module up first so apps without one skip the ImportError
+                if importlib.util.find_spec(f"{app_config.name}.module_info") is None:
+                    logger.warning(f"No module_info.py found for {module_name}")
+                    continue
+                try:
+                    # Import module_info and register the module
+                    module_info = importlib.import_module(f"{app_config.name}.module_info")
+                    if hasattr(module_info, 'register') and callable(module_info.register):
+                        module_info.register(registry)
+                        logger.info(f"Module {module_name} registered automatically")
+                except Exception as e:
+                    logger.error(f"Error registering module {module_name}: {str(e)}")
+            
+            # Reports built before registration finished are stale
+            from .module_integration import clear_integration_report_cache, get_integrator
+            clear_integration_report_cache()
             
-            for app_config in apps.get_app_configs():
-                if app_config.name.startswith('stickforstats.') and app_config.name != 'stickforstats.core':
-                    module_name = app_config.name.split('.')[-1]
-                    try:
-                        # Try to import module_info and register the module
-                        module_info = importlib.import_module(f"{app_config.name}.module_info")
-                        if hasattr(module_info, 'register') and callable(module_info.register):
-                            module_info.register(get_registry())
-                            logger.info(f"Module {module_name} registered automatically")
-                    except ImportError:
-                        logger.warning(f"No module_info.py found for {module_name}")
-                    except Exception as e:
-                        logger.error(f"Error registering module {module_name}: {str(e)}")
+            # Warm sys.modules so the first validation doesn't pay for the imports
+            preloaded = get_integrator().preload_modules()
+            logger.info(f"Preloaded {preloaded} module API namespaces and services")
         
         except Exception as e:
             logger.error(f"Error during module registration: {str(e)}")
\ No newline at end of file
@@ -4,19 +4,67 @@ WebSocket consumers for core application functionality.
 This module provides WebSocket consumers for real-time updates and notifications.
 """
 
+import asyncio
 import json
 import logging
+import time
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
-from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Case, IntegerField, Value, When
+
+from .models import AnalysisSession
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Statuses that only change when a session is re-run
+TERMINAL_ANALYSIS_STATUSES = frozenset({'completed', 'failed'})
+# Seconds a polled non-terminal status is reused; tasks may write the
+# session status without pushing an event
+ANALYSIS_STATUS_TTL = 2
+
+
+if ORJSON_AVAILABLE:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers stay the same
+    def _json_dumps(payload):
+        return orjson.dumps(payload).decode()
+
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Seconds one user's pending notifications are shared between their sockets
+PENDING_NOTIFICATIONS_TTL = 5
+
+
+def pending_notifications_key(user_id):
+    """Cache key of a user's pending notification snapshot."""
+    return f"pending_notifs:{user_id}"
+
+
+def invalidate_pending_notifications(user_id):
+    """Drop a user's cached pending notifications after they change."""
+    cache.delete(pending_notifications_key(user_id))
+
 
 class NotificationConsumer(AsyncWebsocketConsumer):
     """WebSocket consumer for user notifications."""
     
+    # Seconds to collect mark_read messages before writing them in one UPDATE
+    MARK_READ_DELAY = 0.05
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending_read_ids = set()
+        self._flush_task = None
+    
     async def connect(self):
         """Handle WebSocket connection."""
         # Get user from scope (requires AuthMiddlewareStack)
@@ -27,6 +75,10 @@ class NotificationConsumer(AsyncWebsocketConsumer):
             await self.close()
             return
         
+        # Resolve the model once per connection rather than once per message
+        from stickforstats.core.models import Notification
+        self.notification_model = Notification
+        
         # Create group name for this user's notifications
         self.notification_group_name = f"notifications_{self.user.id}"
         
@@ -44,6 +96,12 @@ class NotificationConsumer(AsyncWebsocketConsumer):
     
     async def disconnect(self, close_code):
         """Handle WebSocket disconnection."""
+        # Write out read receipts still waiting for the batch delay
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush_read_notifications()
+        
         # Leave group
         if hasattr(self, 'notification_group_name'):
             await self.channel_layer.group_discard(
@@ -54,71 +112,86 @@ class NotificationConsumer(AsyncWebsocketConsumer):
     async def receive(self, text_data):
         """Handle received messages from WebSocket."""
         try:
-            data = json.loads(text_data)
+            data = _json_loads(text_data)
             message_type = data.get('type')
             
             if message_type == 'mark_read':
                 # Mark notification as read
                 notification_id = data.get('notification_id')
                 if notification_id:
-                    await self.mark_notification_read(notification_id)
+                    self._pending_read_ids.add(notification_id)
+                    if self._flush_task is None:
+                        self._flush_task = asyncio.create_task(self._flush_soon())
                     
             elif message_type == 'request_notifications':
                 # Client requests notifications
                 await self.send_pending_notifications()
                 
         except json.JSONDecodeError:
-            logger.error(f"Received invalid JSON: {text_data}")
+            logger.error("Received invalid JSON: %s", text_data)
         except Exception as e:
-            logger.error(f"Error handling message: {str(e)}")
+            logger.error("Error handling message: %s", e)
     
     @database_sync_to_async
     def get_pending_notifications(self):
         """Get pending notifications for the user."""
-        from stickforstats.core.models import Notification
-        try:
-            # Get unread notifications
-            notifications = Notification.objects.filter(
+        def fetch():
+            # Get unread notifications as dicts of just the sent columns
+            notifications = list(self.notification_model.objects.filter(
                 user=self.user,
                 read=False
-            ).order_by('-created_at')[:10]
+            ).order_by('-created_at').values(
+                'id', 'title', 'message', 'notification_type',
+                'related_object_type', 'related_object_id', 'created_at'
+            )[:10])
             
-            return [
-                {
-                    'id': str(notif.id),
-                    'title': notif.title,
-                    'message': notif.message,
-                    'notification_type': notif.notification_type,
-                    'related_object_type': notif.related_object_type,
-                    'related_object_id': notif.related_object_id,
-                    'created_at': notif.created_at.isoformat()
-                }
-                for notif in notifications
-            ]
+            for notif in notifications:
+                notif['id'] = str(notif['id'])
+                notif['created_at'] = notif['created_at'].isoformat()
+            return notifications
+        
+        try:
+            # Tabs connecting together share one query
+            return cache.get_or_set(
+                pending_notifications_key(self.user.id), fetch, PENDING_NOTIFICATIONS_TTL
+            )
         except Exception as e:
-            logger.error(f"Error getting notifications: {str(e)}")
+            logger.error("Error getting notifications: %s", e)
             return []
     
     @database_sync_to_async
-    def mark_notification_read(self, notification_id):
-        """Mark a notification as read."""
-        from stickforstats.core.models import Notification
+    def mark_notifications_read(self, notification_ids):
+        """Mark notifications as read, returning how many were updated."""
         try:
-            notification = Notification.objects.get(id=notification_id, user=self.user)
-            notification.read = True
-            notification.save()
-            return True
-        except Notification.DoesNotExist:
-            return False
+            # One UPDATE of the read column; matches nothing for other users' ids
+            updated = self.notification_model.objects.filter(
+                id__in=notification_ids, user=self.user
+            ).update(read=True)
+            if updated:
+                invalidate_pending_notifications(self.user.id)
+            return updated
         except Exception as e:
-            logger.error(f"Error marking notification read: {str(e)}")
-            return False
+            logger.error("Error marking notifications read: %s", e)
+            return 0
+    
+    async def _flush_soon(self):
+        """Wait for a burst of mark_read messages to end, then write them."""
+        await asyncio.sleep(self.MARK_READ_DELAY)
+        self._flush_task = None
+        await self.flush_read_notifications()
+    
+    async def flush_read_notifications(self):
+        """Mark every queued notification id as read in one UPDATE."""
+        if not self._pending_read_ids:
+            return 0
+        notification_ids, self._pending_read_ids = self._pending_read_ids, set()
+        return await self.mark_notifications_read(list(notification_ids))
     
     async def send_pending_notifications(self):
         """Send pending notifications to the client."""
         notifications = await self.get_pending_notifications()
         
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=_json_dumps({
             'type': 'notifications',
             'notifications': notifications
         }))
@@ -126,14 +199,26 @@ class NotificationConsumer(AsyncWebsocketConsumer):
     async def notification(self, event):
         """Handle notification event from channel layer."""
         # Send notification to WebSocket
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=_json_dumps({
             'type': 'notification',
             'notification': event['notification']
         }))
 
 
 class AnalysisProgressConsumer(AsyncWebsocketConsumer):
-    """WebSocket consumer for analysis progress updates."""
+    """
+    WebSocket consumer for analysis progress updates.
+    
+    Workers push progress_update and analysis_complete events to the user's
+    group. A request_status poll is answered from the last status read for
+    that session. Completed and failed statuses are kept until a push for the
+    session arrives; other statuses are read again after
+    ANALYSIS_STATUS_TTL seconds, since not every status write is pushed.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._session_statuses = {}
     
     async def connect(self):
         """Handle WebSocket connection."""
@@ -169,7 +254,7 @@ class AnalysisProgressConsumer(AsyncWebsocketConsumer):
     async def receive(self, text_data):
         """Handle received messages from WebSocket."""
         try:
-            data = json.loads(text_data)
+            data = _json_loads(text_data)
             message_type = data.get('type')
             
             if message_type == 'request_status':
@@ -178,51 +263,68 @@ class AnalysisProgressConsumer(AsyncWebsocketConsumer):
                 if session_id:
                     await self.send_analysis_status(session_id)
         except json.JSONDecodeError:
-            logger.error(f"Received invalid JSON: {text_data}")
+            logger.error("Received invalid JSON: %s", text_data)
         except Exception as e:
-            logger.error(f"Error handling message: {str(e)}")
+            logger.error("Error handling message: %s", e)
     
     @database_sync_to_async
     def get_analysis_status(self, session_id):
         """Get status of a specific analysis session."""
-        from stickforstats.core.models import AnalysisSession
         try:
-            session = AnalysisSession.objects.get(id=session_id, user=self.user)
+            session = AnalysisSession.objects.filter(id=session_id, user=self.user).annotate(
+                progress=Case(
+                    When(status='completed', then=Value(100)),
+                    When(status='failed', then=Value(0)),
+                    default=Value(50),
+                    output_field=IntegerField()
+                )
+            ).values('id', 'status', 'progress', 'name', 'updated_at').first()
+            if session is None:
+                return {'error': 'Analysis session not found'}
             return {
-                'session_id': str(session.id),
-                'status': session.status,
-                'progress': 100 if session.status == 'completed' else 
-                            0 if session.status == 'failed' else 50,
-                'name': session.name,
-                'updated_at': session.updated_at.isoformat()
+                'session_id': str(session['id']),
+                'status': session['status'],
+                'progress': session['progress'],
+                'name': session['name'],
+                'updated_at': session['updated_at'].isoformat()
             }
-        except AnalysisSession.DoesNotExist:
-            return {'error': 'Analysis session not found'}
         except Exception as e:
-            logger.error(f"Error getting analysis status: {str(e)}")
+            logger.error("Error getting analysis status: %s", e)
             return {'error': str(e)}
     
     async def send_analysis_status(self, session_id):
         """Send analysis status to the client."""
-        status = await self.get_analysis_status(session_id)
+        status, expires_at = self._session_statuses.get(str(session_id), (None, None))
+        if status is None or (expires_at is not None and time.monotonic() >= expires_at):
+            status = await self.get_analysis_status(session_id)
+            if 'error' not in status:
+                if status['status'] in TERMINAL_ANALYSIS_STATUSES:
+                    expires_at = None
+                else:
+                    expires_at = time.monotonic() + ANALYSIS_STATUS_TTL
+                self._session_statuses[str(session_id)] = (status, expires_at)
         
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=_json_dumps({
             'type': 'analysis_status',
             'data': status
         }))
     
     async def progress_update(self, event):
         """Handle progress update event from channel layer."""
+        self._session_statuses.pop(str(event['data'].get('session_id')), None)
+        
         # Send progress update to WebSocket
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=_json_dumps({
             'type': 'progress_update',
             'data': event['data']
         }))
     
     async def analysis_complete(self, event):
         """Handle analysis complete event from channel layer."""
+        self._session_statuses.pop(str(event['data'].get('session_id')), None)
+        
         # Send completion notification to WebSocket
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=_json_dumps({
             'type': 'analysis_complete',
             'data': event['data']
         }))
\ No newline at end of file
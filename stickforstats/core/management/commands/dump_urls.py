@@ -0,0 +1,113 @@
+"""
+Write the core API router's URL patterns out as Python source.
+
+The generated module lists one path() per route, each with the viewset's
+as_view() call spelled out, so stickforstats.core.api.urls can import a flat
+pattern list instead of having the router introspect every viewset on start-up.
+Run it on deploy, after any change to the registered viewsets or their actions.
+
+Usage:
+    python manage.py dump_urls [--output path/to/_generated_urls.py]
+"""
+
+import os
+import re
+
+from django.core.management.base import BaseCommand
+
+import stickforstats.core.api as core_api
+
+# Router lookup groups, replaced by the lookup converter, which matches the
+# same [^/.]+ values
+LOOKUP_RE = re.compile(r'\(\?P<(\w+)>\[\^/\.\]\+\)')
+
+HEADER = '''"""
+Core API viewset routes.
+
+Generated by `python manage.py dump_urls` from stickforstats.core.api.routers;
+do not edit by hand.
+"""
+
+'''
+
+
+class SourceWriter:
+    """Render values as Python source, collecting the imports they need."""
+
+    def __init__(self):
+        self.imports = {}
+
+    def name(self, module, name):
+        self.imports.setdefault(module, set()).add(name)
+        return name
+
+    def reference(self, obj):
+        return self.name(obj.__module__, obj.__qualname__)
+
+    def value(self, obj):
+        if isinstance(obj, type):
+            return self.reference(obj)
+        if isinstance(obj, (list, tuple)):
+            items = ', '.join(self.value(item) for item in obj)
+            return f'[{items}]' if isinstance(obj, list) else f'({items},)'
+        if isinstance(obj, dict):
+            items = ', '.join(f'{self.value(k)}: {self.value(v)}' for k, v in obj.items())
+            return f'{{{items}}}'
+        return repr(obj)
+
+    def import_lines(self):
+        return [
+            f"from {module} import {', '.join(sorted(names))}"
+            for module, names in sorted(self.imports.items())
+        ]
+
+
+def render_pattern(pattern, writer):
+    """Return the source of one router URL pattern."""
+    regex = pattern.pattern.regex.pattern
+    route = LOOKUP_RE.sub(r'<lookup:\1>', regex.lstrip('^').rstrip('$'))
+    if re.search(r'[\\()\[\]^$*+?|]', route):
+        func = writer.name('django.urls', 're_path')
+        route = regex
+    else:
+        func = writer.name('django.urls', 'path')
+        if '<lookup:' in route:
+            writer.name('django.urls', 'register_converter')
+            writer.name('stickforstats.core.api.converters', 'LookupConverter')
+
+    callback = pattern.callback
+    view = f'{writer.reference(callback.cls)}.as_view({writer.value(callback.actions)}'
+    for key, value in callback.initkwargs.items():
+        view += f', {key}={writer.value(value)}'
+    view += ')'
+    return f'    {func}({route!r}, {view}, name={pattern.name!r}),'
+
+
+class Command(BaseCommand):
+    help = 'Write the core API router URL patterns to a generated urls module'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=os.path.join(os.path.dirname(core_api.__file__), '_generated_urls.py'),
+            help='File to write (default: stickforstats/core/api/_generated_urls.py)'
+        )
+
+    def handle(self, *args, **options):
+        from stickforstats.core.api.routers import router
+
+        writer = SourceWriter()
+        lines = [render_pattern(pattern, writer) for pattern in router.urls]
+
+        source = HEADER + '\n'.join(writer.import_lines()) + '\n\n'
+        if 'stickforstats.core.api.converters' in writer.imports:
+            source += "register_converter(LookupConverter, 'lookup')\n\n"
+        source += 'router_urls = [\n'
+        source += '\n'.join(lines) + '\n]\n'
+
+        with open(options['output'], 'w') as f:
+            f.write(source)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {len(lines)} URL patterns to {options['output']}"
+        ))
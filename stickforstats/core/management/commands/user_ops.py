@@ -0,0 +1,123 @@
+"""
+User administration commands.
+
+Bundles the standalone user helper scripts (check_users.py,
+create_new_user.py, create_superuser.py, create_token.py) into one
+management command; those scripts are thin wrappers around it. Run several
+user operations through `python manage.py user_ops ...` so a batch pays for
+Django start-up once instead of once per script.
+
+Usage:
+    python manage.py user_ops list
+    python manage.py user_ops create --email a@b.c --username a --password x [--token]
+    python manage.py user_ops token --email a@b.c [--jwt]
+
+Tokens are DRF auth tokens, sent as `Authorization: Token <key>`; with
+--jwt the token operation prints a SimpleJWT access/refresh pair instead,
+as auth/token/ returns, for `Authorization: Bearer <access>`.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+
+class Command(BaseCommand):
+    help = 'List users, create superusers and issue API tokens'
+
+    def add_arguments(self, parser):
+        subparsers = parser.add_subparsers(dest='operation', required=True)
+
+        subparsers.add_parser('list', help='List all users and the active user model')
+
+        create_parser = subparsers.add_parser(
+            'create', help='Create a superuser unless one with the email or username already exists'
+        )
+        create_parser.add_argument('--email', required=True)
+        create_parser.add_argument('--username', required=True)
+        create_parser.add_argument('--password', required=True)
+        create_parser.add_argument(
+            '--token', action='store_true', help='Also get or create an API token for the user'
+        )
+
+        token_parser = subparsers.add_parser('token', help='Get or create an API token for a user')
+        token_parser.add_argument('--email', required=True)
+        token_parser.add_argument(
+            '--jwt', action='store_true', help='Print a JWT access/refresh pair instead'
+        )
+
+    def handle(self, *args, **options):
+        operation = options['operation']
+        if operation == 'list':
+            self.list_users()
+        elif operation == 'create':
+            user = self.create_superuser(options['email'], options['username'], options['password'])
+            if options['token']:
+                self.issue_token(user)
+        elif operation == 'token':
+            user = get_user_model().objects.filter(email=options['email']).first()
+            if user is None:
+                raise CommandError(f"User with email {options['email']} not found.")
+            if options['jwt']:
+                self.issue_jwt(user)
+            else:
+                self.issue_token(user)
+
+    def list_users(self):
+        """Print every user followed by details of the active user model."""
+        User = get_user_model()
+
+        try:
+            self.stdout.write(f"Total users: {User.objects.count()}")
+            users = User.objects.values_list('username', 'email', 'id')
+            for username, email, user_id in users.iterator(chunk_size=2000):
+                self.stdout.write(f"User: {username}, Email: {email}, ID: {user_id}")
+        except Exception as e:
+            # The model details below still help diagnose a broken user table
+            self.stderr.write(f"Error listing users: {e}")
+
+        self.stdout.write(f"\nUser model: {User.__name__}")
+        self.stdout.write(f"User model table: {User._meta.db_table}")
+        self.stdout.write(f"User model app label: {User._meta.app_label}")
+        self.stdout.write(f"User model module: {User.__module__}")
+
+    def create_superuser(self, email, username, password):
+        """
+        Create a superuser, reusing an existing account with the same email
+        or username.
+
+        Returns:
+            The existing or newly created user
+        """
+        User = get_user_model()
+
+        user = User.objects.filter(Q(email=email) | Q(username=username)).first()
+        if user is not None:
+            self.stdout.write(f"User {user.username} already exists with email {user.email}")
+            return user
+
+        user = User.objects.create_superuser(email=email, username=username, password=password)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created new superuser with username: {user.username}, email: {user.email}"
+            )
+        )
+        return user
+
+    def issue_token(self, user):
+        """Get or create the DRF auth token for user and print it."""
+        from rest_framework.authtoken.models import Token
+
+        token, created = Token.objects.get_or_create(user=user)
+        if created:
+            self.stdout.write(f"Token created for user '{user.username}': {token.key}")
+        else:
+            self.stdout.write(f"Token already exists for user '{user.username}': {token.key}")
+
+    def issue_jwt(self, user):
+        """Print a new JWT access/refresh pair for user."""
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        refresh = RefreshToken.for_user(user)
+        self.stdout.write(f"Access token for user '{user.username}': {refresh.access_token}")
+        self.stdout.write(f"Refresh token for user '{user.username}': {refresh}")
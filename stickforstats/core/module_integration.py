@@ -6,10 +6,13 @@ and all statistical analysis modules. It coordinates module discovery, initializ
 and provides troubleshooting tools.
 """
 
+import functools
 import importlib
 import logging
 import inspect
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable
 from django.conf import settings
@@ -19,6 +22,32 @@ from .registry import ModuleRegistry, get_registry
 
 logger = logging.getLogger(__name__)
 
+# How long a generated integration report is served before being rebuilt
+REPORT_CACHE_SECONDS = 30
+
+# Package prefix shared by every StickForStats app
+MODULE_PREFIX = 'stickforstats.'
+
+# Marks a service path in services_map that failed to resolve
+_UNRESOLVED = object()
+
+# Threads used to import API namespaces and service modules during validation
+IMPORT_WORKERS = 8
+
+
+def _import_or_error(module_path: str) -> Any:
+    """Import module_path, returning the exception instead of raising it."""
+    try:
+        return importlib.import_module(module_path)
+    except Exception as e:
+        return e
+
+
+@functools.lru_cache(maxsize=None)
+def _is_singleton(cls: type) -> bool:
+    """Whether cls exposes a callable get_instance(); cached per class."""
+    return callable(getattr(cls, 'get_instance', None))
+
 class ModuleIntegration:
     """
     Module integration manager for StickForStats application.
@@ -42,13 +71,49 @@ class ModuleIntegration:
         'stickforstats.education'
     ]
     
+    # Registry names of the modules above, in the same order
+    REQUIRED_SHORT_NAMES = tuple(name.rpartition('.')[2] for name in REQUIRED_MODULES)
+    OPTIONAL_SHORT_NAMES = tuple(name.rpartition('.')[2] for name in OPTIONAL_MODULES)
+    
+    __slots__ = (
+        'registry', 'modules_status', 'api_endpoints', 'dependencies_graph',
+        'services_map', '_reverse_deps', '_validated_version', '_app_config_index'
+    )
+    
     def __init__(self):
         """Initialize the module integration manager."""
         self.registry = get_registry()
         self.modules_status = {}
         self.api_endpoints = {}
         self.dependencies_graph = {}
+        # Module name -> modules that depend on it, built with dependencies_graph
+        self._reverse_deps = {}
         self.services_map = {}
+        # Registry version modules_status was computed for
+        self._validated_version = None
+        self._app_config_index = None
+    
+    def invalidate(self) -> None:
+        """Forget cached validation results and failed service lookups."""
+        self._validated_version = None
+        self.services_map = {
+            path: service for path, service in self.services_map.items()
+            if service is not _UNRESOLVED
+        }
+    
+    def _get_app_config_index(self) -> Dict[str, Any]:
+        """
+        Map each installed app's last name segment to its app config.
+        
+        Built once; the set of installed apps does not change after start-up.
+        Where two apps share a last segment, the first installed one wins.
+        """
+        if self._app_config_index is None:
+            index = {}
+            for app_config in apps.get_app_configs():
+                index.setdefault(app_config.name.rpartition('.')[2], app_config)
+            self._app_config_index = index
+        return self._app_config_index
     
     def discover_modules(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -58,20 +123,113 @@ class ModuleIntegration:
             Dictionary of module information
         """
         discovered_modules = {}
+        registered_modules = self.registry.get_all_modules()
         
         # Check for installed apps
         for app_config in apps.get_app_configs():
-            if app_config.name.startswith('stickforstats.'):
-                module_name = app_config.name.split('.')[-1]
+            if app_config.name.startswith(MODULE_PREFIX):
+                module_name = app_config.name.rpartition('.')[2]
                 discovered_modules[module_name] = {
                     'app_config': app_config,
                     'name': module_name,
-                    'is_registered': module_name in self.registry.get_all_modules(),
+                    'is_registered': module_name in registered_modules,
                     'status': 'discovered'
                 }
         
         return discovered_modules
     
+    def validate_modules_lightweight(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Check that modules are installed and registered, without importing them.
+        
+        Unlike validate_modules, API namespaces and services are not imported;
+        a registered module counts as valid.
+        
+        Returns:
+            Dictionary of validation results with status, is_required and message
+        """
+        validation_results = {}
+        discovered_modules = self.discover_modules()
+        
+        for short_names, is_required in ((self.REQUIRED_SHORT_NAMES, True),
+                                         (self.OPTIONAL_SHORT_NAMES, False)):
+            kind = 'Required' if is_required else 'Optional'
+            for short_name in short_names:
+                if short_name not in discovered_modules:
+                    if is_required:
+                        validation_results[short_name] = {
+                            'status': 'missing',
+                            'is_required': True,
+                            'message': f"Required module {short_name} is missing"
+                        }
+                elif not self.registry.get_module(short_name):
+                    validation_results[short_name] = {
+                        'status': 'not_registered',
+                        'is_required': is_required,
+                        'message': f"{kind} module {short_name} is not registered with the registry"
+                    }
+                else:
+                    validation_results[short_name] = {
+                        'status': 'valid',
+                        'is_required': is_required,
+                        'message': f"{kind} module {short_name} is registered"
+                    }
+        
+        return validation_results
+    
+    def _import_validation_modules(self, discovered_modules: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Import the API namespaces and service modules of the required modules.
+        
+        Args:
+            discovered_modules: Installed modules, as returned by discover_modules()
+        
+        Returns:
+            Dictionary mapping each module path to the imported module or the
+            exception raised while importing it
+        """
+        module_paths = set()
+        for short_name in self.REQUIRED_SHORT_NAMES:
+            module_info = self.registry.get_module(short_name)
+            if short_name not in discovered_modules or not module_info:
+                continue
+            if module_info.get('api_namespace'):
+                module_paths.add(module_info['api_namespace'])
+            for service_info in module_info['services'].values():
+                service_path = service_info.get('service')
+                if service_path and '.' in service_path:
+                    module_paths.add(service_path.rsplit('.', 1)[0])
+        
+        imported = {}
+        if module_paths:
+            with ThreadPoolExecutor(max_workers=IMPORT_WORKERS) as executor:
+                imported = dict(zip(module_paths, executor.map(_import_or_error, module_paths)))
+            # Concurrent imports of modules that import each other can fail
+            # spuriously (e.g. import-lock deadlock detection); retry those serially
+            for module_path, result in imported.items():
+                if isinstance(result, Exception):
+                    imported[module_path] = _import_or_error(module_path)
+        return imported
+    
+    def preload_modules(self) -> int:
+        """
+        Import the modules validate_modules checks, ahead of the first validation.
+        
+        Called once the registry is populated at start-up, so validation later
+        finds them in sys.modules. Nothing is imported in development mode,
+        where validation skips the imports too.
+        
+        Returns:
+            Number of modules imported successfully
+        """
+        if getattr(settings, 'DEBUG', False):
+            return 0
+        imported = self._import_validation_modules(self.discover_modules())
+        for module_path, result in imported.items():
+            if isinstance(result, Exception):
+                logger.warning("Could not preload %s: %s", module_path, result)
+        return sum(not isinstance(result, Exception) for result in imported.values())
+    
     def validate_modules(self) -> Dict[str, Dict[str, Any]]:
         """
         Validate all discovered modules for proper integration.
@@ -83,15 +241,31 @@ class ModuleIntegration:
         - Service availability
         - Dependency resolution
         
+        Results are cached until the registry changes or invalidate() is
+        called; the returned dict is shared and must not be modified.
+        
         Returns:
             Dictionary of validation results
         """
+        registry_version = self.registry.version
+        if self._validated_version == registry_version:
+            return self.modules_status
+        
         validation_results = {}
         discovered_modules = self.discover_modules()
         
+        # DEVELOPMENT MODE: More lenient validation for development
+        # In development, we consider a module valid if it's registered, regardless of API and service status
+        is_development = getattr(settings, 'DEBUG', False)
+        
+        # Import every API namespace and service module up front, in parallel;
+        # the imports are independent and mostly wait on the filesystem
+        imported = {}
+        if not is_development:
+            imported = self._import_validation_modules(discovered_modules)
+        
         # Check required modules
-        for module_name in self.REQUIRED_MODULES:
-            short_name = module_name.split('.')[-1]
+        for short_name in self.REQUIRED_SHORT_NAMES:
             if short_name not in discovered_modules:
                 validation_results[short_name] = {
                     'status': 'missing',
@@ -108,10 +282,6 @@ class ModuleIntegration:
                         'message': f"Required module {short_name} is not registered with the registry"
                     }
                 else:
-                    # DEVELOPMENT MODE: More lenient validation for development
-                    # In development, we consider a module valid if it's registered, regardless of API and service status
-                    is_development = getattr(settings, 'DEBUG', False)
-                    
                     if is_development:
                         status = 'valid'
                         api_status = 'dev_mode_skipped'
@@ -128,18 +298,18 @@ class ModuleIntegration:
                         # Check API endpoints
                         api_namespace = module_info.get('api_namespace')
                         if api_namespace:
-                            try:
-                                importlib.import_module(api_namespace)
-                                api_status = 'available'
-                            except ImportError:
+                            api_module = imported[api_namespace]
+                            if isinstance(api_module, ImportError):
                                 api_status = 'import_error'
-                            except Exception as e:
-                                api_status = f'error: {str(e)}'
+                            elif isinstance(api_module, Exception):
+                                api_status = f'error: {str(api_module)}'
+                            else:
+                                api_status = 'available'
                         else:
                             api_status = 'not_specified'
                         
                         # Check services
-                        services = module_info.get('services', {})
+                        services = module_info['services']
                         services_status = {}
                         
                         for service_name, service_info in services.items():
@@ -147,10 +317,12 @@ class ModuleIntegration:
                             if service_path:
                                 try:
                                     module_path, class_name = service_path.rsplit('.', 1)
-                                    module = importlib.import_module(module_path)
+                                    module = imported[module_path]
+                                    if isinstance(module, Exception):
+                                        raise module
                                     service_class = getattr(module, class_name)
                                     # Check if it has a get_instance method (singleton)
-                                    has_singleton = hasattr(service_class, 'get_instance')
+                                    has_singleton = _is_singleton(service_class)
                                     services_status[service_name] = {
                                         'status': 'available',
                                         'has_singleton': has_singleton
@@ -180,8 +352,7 @@ class ModuleIntegration:
                         }
         
         # Check optional modules
-        for module_name in self.OPTIONAL_MODULES:
-            short_name = module_name.split('.')[-1]
+        for short_name in self.OPTIONAL_SHORT_NAMES:
             if short_name in discovered_modules:
                 # Check if registered
                 module_info = self.registry.get_module(short_name)
@@ -201,24 +372,29 @@ class ModuleIntegration:
                     }
         
         self.modules_status = validation_results
+        self._validated_version = registry_version
         return validation_results
     
-    def initialize_modules(self) -> Dict[str, str]:
+    def initialize_modules(self, modules_status: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, str]:
         """
         Initialize all validated modules.
         
         This ensures all modules are properly set up and ready to use.
         
+        Args:
+            modules_status: Validation results to act on; defaults to validate_modules()
+        
         Returns:
             Dictionary of module initialization status
         """
         initialization_results = {}
         
         # Validate modules first
-        self.validate_modules()
+        if modules_status is None:
+            modules_status = self.validate_modules()
         
         # Initialize only valid modules
-        for module_name, status in self.modules_status.items():
+        for module_name, status in modules_status.items():
             if status['status'] == 'valid':
                 try:
                     # Get module info
@@ -258,10 +434,16 @@ class ModuleIntegration:
         
         for module_name, module_info in modules.items():
             # Get direct dependencies
-            deps = module_info.get('dependencies', [])
+            deps = module_info['dependencies']
             dependencies[module_name] = deps
         
+        reverse_deps = {}
+        for module_name, deps in dependencies.items():
+            for dep in deps:
+                reverse_deps.setdefault(dep, []).append(module_name)
+        
         self.dependencies_graph = dependencies
+        self._reverse_deps = reverse_deps
         return dependencies
     
     def resolve_service(self, service_path: str) -> Optional[Any]:
@@ -271,11 +453,15 @@ class ModuleIntegration:
         Args:
             service_path: Fully qualified path to the service class
             
+        Failures are remembered too, so a broken path is only imported and
+        logged once until invalidate() is called.
+        
         Returns:
             The service instance or class, or None if it couldn't be resolved
         """
-        if service_path in self.services_map:
-            return self.services_map[service_path]
+        service = self.services_map.get(service_path)
+        if service is not None:
+            return None if service is _UNRESOLVED else service
         
         try:
             module_path, class_name = service_path.rsplit('.', 1)
@@ -283,7 +469,7 @@ class ModuleIntegration:
             service_class = getattr(module, class_name)
             
             # Check if it's a singleton with get_instance method
-            if hasattr(service_class, 'get_instance') and callable(service_class.get_instance):
+            if _is_singleton(service_class):
                 service = service_class.get_instance()
             else:
                 service = service_class
@@ -292,6 +478,7 @@ class ModuleIntegration:
             return service
         except Exception as e:
             logger.error(f"Error resolving service {service_path}: {str(e)}")
+            self.services_map[service_path] = _UNRESOLVED
             return None
     
     def get_module_services(self, module_name: str) -> Dict[str, Any]:
@@ -310,7 +497,7 @@ class ModuleIntegration:
         if not module_info:
             return services
         
-        for service_name, service_info in module_info.get('services', {}).items():
+        for service_name, service_info in module_info['services'].items():
             service_path = service_info.get('service')
             if service_path:
                 service = self.resolve_service(service_path)
@@ -329,35 +516,35 @@ class ModuleIntegration:
         Returns:
             Service instance or None if no service provides the capability
         """
-        # Get all modules
-        modules = self.registry.get_all_modules()
-        
-        for module_name, module_info in modules.items():
-            # Check if module provides this capability
-            if capability in module_info.get('capabilities', []):
-                # Find service for this capability
-                services = module_info.get('services', {})
-                for service_name, service_info in services.items():
-                    if capability in service_info.get('capabilities', []) or service_name == capability:
-                        service_path = service_info.get('service')
-                        if service_path:
-                            return self.resolve_service(service_path)
+        service_paths = self.registry.get_capability_services(capability)
+        if service_paths:
+            return self.resolve_service(service_paths[0])
         
         return None
     
-    def generate_integration_report(self) -> Dict[str, Any]:
+    def generate_integration_report(self, deep: bool = False) -> Dict[str, Any]:
         """
         Generate a comprehensive integration report.
         
+        Args:
+            deep: Import every API namespace and service to validate modules,
+                instead of only checking that they are registered
+        
         Returns:
             Dictionary with integration status information
         """
+        if deep or self._validated_version == self.registry.version:
+            # Full results that are still current cost nothing to reuse
+            modules = self.validate_modules()
+        else:
+            modules = self.validate_modules_lightweight()
+        
         report = {
-            'modules': self.validate_modules(),
+            'modules': modules,
             'dependencies': self.build_dependencies_graph(),
-            'initialization': self.initialize_modules(),
+            'initialization': self.initialize_modules(modules),
             'registry_status': bool(self.registry.get_all_modules()),
-            'timestamp': str(datetime.now())
+            'timestamp': datetime.now().isoformat(timespec='seconds')
         }
         
         # Overall status
@@ -398,26 +585,20 @@ class ModuleIntegration:
         }
         
         # Check if module is in Django apps
-        for app_config in apps.get_app_configs():
-            if app_config.name == f'stickforstats.{module_name}' or app_config.name.endswith(f'.{module_name}'):
-                results['app_config'] = {
-                    'name': app_config.name,
-                    'models': list(app_config.get_models()),
-                    'path': app_config.path
-                }
-                break
+        app_config = self._get_app_config_index().get(module_name)
+        if app_config is not None:
+            results['app_config'] = {
+                'name': app_config.name,
+                'models': list(app_config.get_models()),
+                'path': app_config.path
+            }
         
-        # Get validation status
-        if module_name in self.modules_status:
-            results['validation'] = self.modules_status[module_name]
-        else:
-            # Validate modules if not already done
-            self.validate_modules()
-            results['validation'] = self.modules_status.get(module_name)
+        # Get validation status; only validates if the registry changed since
+        results['validation'] = self.validate_modules().get(module_name)
         
         # Get services
         if results['registry_info']:
-            for service_name, service_info in results['registry_info'].get('services', {}).items():
+            for service_name, service_info in results['registry_info']['services'].items():
                 service_path = service_info.get('service')
                 if service_path:
                     try:
@@ -426,7 +607,9 @@ class ModuleIntegration:
                             results['services'][service_name] = {
                                 'status': 'available',
                                 'service_path': service_path,
-                                'is_singleton': hasattr(service, 'get_instance') and callable(service.get_instance)
+                                'is_singleton': _is_singleton(
+                                    service if isinstance(service, type) else type(service)
+                                )
                             }
                         else:
                             results['services'][service_name] = {
@@ -455,12 +638,10 @@ class ModuleIntegration:
         
         # Get dependencies
         if results['registry_info']:
-            results['dependencies'] = results['registry_info'].get('dependencies', [])
+            results['dependencies'] = results['registry_info']['dependencies']
         
         # Find modules that depend on this one
-        for dep_module, deps in self.dependencies_graph.items():
-            if module_name in deps:
-                results['dependent_modules'].append(dep_module)
+        results['dependent_modules'] = list(self._reverse_deps.get(module_name, ()))
         
         return results
 
@@ -480,9 +661,28 @@ def initialize_modules() -> Dict[str, str]:
     """Initialize all modules."""
     return module_integrator.initialize_modules()
 
-def generate_integration_report() -> Dict[str, Any]:
-    """Generate a comprehensive integration report."""
-    return module_integrator.generate_integration_report()
+@functools.lru_cache(maxsize=2)
+def _cached_integration_report(deep: bool, registry_version: int, bucket: int) -> Dict[str, Any]:
+    """Build the integration report; a new registry version or bucket rebuilds it."""
+    return module_integrator.generate_integration_report(deep=deep)
+
+def generate_integration_report(deep: bool = False) -> Dict[str, Any]:
+    """
+    Generate a comprehensive integration report.
+
+    The report is reused for up to REPORT_CACHE_SECONDS, and rebuilt as soon
+    as another module registers. Its timestamp is the time it was built.
+    Callers share the returned dict and must not modify it.
+    """
+    return _cached_integration_report(
+        deep,
+        module_integrator.registry.version,
+        int(time.monotonic() // REPORT_CACHE_SECONDS)
+    )
+
+def clear_integration_report_cache() -> None:
+    """Drop the cached integration reports so the next call rebuilds them."""
+    _cached_integration_report.cache_clear()
 
 def troubleshoot_module(module_name: str) -> Dict[str, Any]:
     """Troubleshoot a specific module."""
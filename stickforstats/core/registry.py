@@ -3,28 +3,81 @@ Simplified Module Registry System for minimal testing
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+# Keys every registered module_info is guaranteed to have, with their defaults
+MODULE_INFO_DEFAULTS = (
+    ('services', dict),
+    ('dependencies', list),
+    ('capabilities', list),
+)
+
 class ModuleRegistry:
     """Simplified registry for StickForStats modules."""
 
+    __slots__ = ('modules', '_modules_view', 'version', '_capability_index', '_capability_index_version')
+
     def __init__(self):
         self.modules = {}
+        # Live read-only view handed out by get_all_modules
+        self._modules_view = MappingProxyType(self.modules)
+        # Bumped on every registration so dependents can tell when to recompute
+        self.version = 0
+        self._capability_index = {}
+        self._capability_index_version = None
 
     def register_module(self, module_name: str, module_info: Dict[str, Any]) -> None:
-        """Register a new module with the registry."""
+        """
+        Register a new module with the registry.
+
+        Missing services/dependencies/capabilities are filled in on a copy,
+        so readers can index them directly.
+        """
+        missing = [(key, factory) for key, factory in MODULE_INFO_DEFAULTS
+                   if key not in module_info]
+        if missing:
+            module_info = {**module_info, **{key: factory() for key, factory in missing}}
         self.modules[module_name] = module_info
+        self.version += 1
         logger.info(f"Module {module_name} registered")
 
     def get_module(self, module_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific module."""
         return self.modules.get(module_name)
 
-    def get_all_modules(self) -> Dict[str, Dict[str, Any]]:
-        """Get information about all registered modules."""
-        return self.modules
+    def get_all_modules(self) -> Mapping[str, Dict[str, Any]]:
+        """
+        Get information about all registered modules.
+
+        The result is a read-only view that reflects later registrations.
+        """
+        return self._modules_view
+
+    def get_capability_services(self, capability: str) -> List[str]:
+        """
+        Get the paths of services providing a capability, in registration order.
+
+        A module's service provides a capability the module declares if the
+        service lists it too or is named after it. The index is rebuilt after
+        any registration.
+        """
+        if self._capability_index_version != self.version:
+            index = {}
+            for module_info in self.modules.values():
+                services = module_info['services']
+                for module_capability in module_info['capabilities']:
+                    for service_name, service_info in services.items():
+                        service_path = service_info.get('service')
+                        if service_path and (
+                                module_capability in service_info.get('capabilities', [])
+                                or service_name == module_capability):
+                            index.setdefault(module_capability, []).append(service_path)
+            self._capability_index = index
+            self._capability_index_version = self.version
+        return self._capability_index.get(capability, [])
 
 # Create singleton instance
 registry = ModuleRegistry()
@@ -47,16 +100,21 @@ def get_module(module_name: str) -> Optional[Dict[str, Any]]:
     """Get information about a specific module."""
     return registry.get_module(module_name)
 
-def get_all_modules() -> Dict[str, Dict[str, Any]]:
+def get_all_modules() -> Mapping[str, Dict[str, Any]]:
     """Get information about all registered modules."""
     return registry.get_all_modules()
 
-# Import module_integration here to avoid circular import
+# Resolved on first use; module_integration imports this module
+_integrator = None
+
 def get_integrator():
     """Get the module integrator singleton instance."""
-    # Dynamic import to avoid circular import
-    from .module_integration import module_integrator
-    return module_integrator
+    global _integrator
+    if _integrator is None:
+        # Deferred import to avoid circular import
+        from .module_integration import module_integrator
+        _integrator = module_integrator
+    return _integrator
 
 # Export module_registry for backward compatibility
 module_registry = registry
\ No newline at end of file
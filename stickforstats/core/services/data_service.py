@@ -5,7 +5,12 @@ This module provides a central service for data operations across all modules.
 It handles dataset transformations, caching, and cross-module data sharing.
 """
 
+import ast
+import functools
+import importlib
+import io
 import logging
+import operator
 import pandas as pd
 import numpy as np
 import json
@@ -18,13 +23,181 @@ from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
 from django.utils import timezone
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from ..models import Dataset, Analysis
 from ...core.registry import get_registry
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Rows converted and written at a time when saving a dataset to a file
+WRITE_BATCH_ROWS = 64_000
+
+# Row predicates of filter transformations, by operator name
+_FILTER_OPERATORS = {
+    'equals': operator.eq,
+    'not_equals': operator.ne,
+    'greater_than': operator.gt,
+    'less_than': operator.lt,
+    'contains': lambda column, value: column.astype(str).str.contains(str(value)),
+    'in': lambda column, value: column.isin(value),
+}
+
+# Syntax allowed in custom transformation expressions: column names, constants,
+# arithmetic, comparisons and boolean logic. No calls, attributes, subscripts
+# or pandas '@' references, so an expression can only compute over columns
+_CUSTOM_EXPR_NODES = (
+    ast.Module, ast.Expr, ast.Assign, ast.Name, ast.Load, ast.Store, ast.Constant,
+    ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.UAdd, ast.USub, ast.Not, ast.Invert, ast.And, ast.Or, ast.BitAnd, ast.BitOr,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+# Threads used to run module compatibility checkers
+CHECKER_WORKERS = 8
+
+# Schema metadata key listing the string columns written as categoricals,
+# as [position, original dtype] pairs, so loading restores their dtype
+CATEGORIZED_COLUMNS_KEY = b'stickforstats:categorized_columns'
+
+# Datasets with more rows or bytes than this are saved to a file instead of JSON
+FILE_STORAGE_MIN_ROWS = 1000
+FILE_STORAGE_MIN_BYTES = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_callable(path: str) -> Any:
+    """Import the function or class at a dotted path; cached per path."""
+    module_name, _, attr_name = path.rpartition('.')
+    return getattr(importlib.import_module(module_name), attr_name)
+
+
+def _run_compatibility_checker(checker_path: str, df: pd.DataFrame) -> Any:
+    """Run a module's compatibility checker, returning any exception instead of raising it."""
+    try:
+        return _resolve_callable(checker_path)(df)
+    except Exception as e:
+        return e
+
+
+if ORJSON_AVAILABLE:
+    # Serializes numpy scalars natively; column names need not be strings
+    def _dumps_summary(summary: Dict[str, Any]) -> bytes:
+        return orjson.dumps(
+            summary, default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    
+    _loads_summary = orjson.loads
+else:
+    def _dumps_summary(summary: Dict[str, Any]) -> str:
+        return json.dumps(summary, default=str)
+    
+    _loads_summary = json.loads
+
+
+def _validate_custom_expr(expr: str, columns: pd.Index) -> None:
+    """
+    Check that a custom transformation expression only computes over columns.
+    
+    Accepts one expression, or one assignment to a single column name, built
+    from _CUSTOM_EXPR_NODES. Every other name must be an existing column.
+    
+    Raises:
+        ValueError: If the expression uses anything else
+    """
+    try:
+        tree = ast.parse(expr, mode='exec')
+    except SyntaxError as e:
+        raise ValueError(f"Invalid custom expression: {expr}") from e
+    
+    if len(tree.body) != 1:
+        raise ValueError(f"Custom expression must be a single expression or assignment: {expr}")
+    statement = tree.body[0]
+    target = None
+    if isinstance(statement, ast.Assign):
+        if len(statement.targets) != 1 or not isinstance(statement.targets[0], ast.Name):
+            raise ValueError(f"Custom expression must assign a single column: {expr}")
+        target = statement.targets[0]
+    
+    column_names = {str(column) for column in columns}
+    for node in ast.walk(tree):
+        if not isinstance(node, _CUSTOM_EXPR_NODES):
+            raise ValueError(
+                f"Custom expression may not use {type(node).__name__}: {expr}"
+            )
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float, str, bool, type(None))):
+            raise ValueError(f"Unsupported constant in custom expression: {expr}")
+        if isinstance(node, ast.Name) and node is not target and node.id not in column_names:
+            raise ValueError(f"Unknown column in custom expression: {node.id}")
+
+
+def _serialize_df(df: pd.DataFrame) -> Union[bytes, str]:
+    """
+    Serialize a DataFrame for the cache.
+    
+    Frames are written as an Arrow IPC stream, which keeps dtypes and is read
+    back without parsing. Frames Arrow can't represent (e.g. object columns of
+    mixed types), or any frame when pyarrow is missing, fall back to JSON.
+    """
+    if PYARROW_AVAILABLE:
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.ArrowException, TypeError, ValueError):
+            pass
+        else:
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return sink.getvalue().to_pybytes()
+    return df.to_json()
+
+def _deserialize_df(data: Union[bytes, str]) -> pd.DataFrame:
+    """Rebuild a DataFrame cached by _serialize_df."""
+    if isinstance(data, bytes):
+        table = pa.ipc.open_stream(data).read_all()
+        return table.to_pandas(self_destruct=True)
+    return pd.read_json(io.StringIO(data))
+
+def _deserialize_df_head(data: bytes, rows: int) -> Tuple[pd.DataFrame, int]:
+    """
+    Rebuild the first rows of a DataFrame cached as an Arrow stream.
+    
+    Batches are read from the buffer without copying; only the first rows
+    are converted to pandas. The index is not restored.
+    
+    Returns:
+        Tuple of (first rows, total row count)
+    """
+    reader = pa.ipc.open_stream(data)
+    head_batches = []
+    remaining = rows
+    total_rows = 0
+    for batch in reader:
+        total_rows += batch.num_rows
+        if remaining > 0:
+            head_batches.append(batch.slice(0, remaining))
+            remaining -= min(remaining, batch.num_rows)
+    head = pa.Table.from_batches(head_batches, schema=reader.schema).to_pandas()
+    return head.reset_index(drop=True), total_rows
+
 class DataService:
     """
     Service for managing datasets and data operations.
@@ -41,6 +214,12 @@ class DataService:
         self.registry = get_registry()
         self.cache_timeout = getattr(settings, 'DATA_CACHE_TIMEOUT', 3600)  # 1 hour default
         self.temp_dir = getattr(settings, 'DATA_TEMP_DIR', 'temp')
+        # 'feather' (LZ4) is fastest to reload; 'parquet' (ZSTD) is smaller on disk
+        self.storage_format = getattr(settings, 'DATA_STORAGE_FORMAT', 'feather')
+        # Module name -> its data transformations (None if not registered),
+        # valid for one registry version
+        self._module_transformations = {}
+        self._module_transformations_version = None
     
     def load_dataset(self, dataset_id: str, module: Optional[str] = None) -> pd.DataFrame:
         """
@@ -55,34 +234,48 @@ class DataService:
         """
         try:
             # Check cache first
-            cache_key = f"dataset_{dataset_id}"
-            if module:
-                cache_key += f"_{module}"
-            
+            cache_key = self._dataset_cache_key(dataset_id, module)
             cached_data = cache.get(cache_key)
             if cached_data is not None:
                 logger.debug(f"Cache hit for dataset {dataset_id}")
-                return pd.read_json(cached_data)
+                return _deserialize_df(cached_data)
             
             # Load dataset
             dataset = Dataset.objects.get(id=dataset_id)
+            return self._load_dataset_data(dataset, module, cache_key)
             
-            # Load data
-            if dataset.file:
-                df = self._load_from_file(dataset.file.path)
-            elif dataset.data_json:
-                df = pd.read_json(dataset.data_json)
-            else:
-                raise ValueError(f"Dataset {dataset_id} has no data")
+        except Dataset.DoesNotExist:
+            logger.error(f"Dataset {dataset_id} not found")
+            raise
+        except Exception as e:
+            logger.error(f"Error loading dataset {dataset_id}: {str(e)}")
+            raise
+    
+    def _load_dataset_and_row(self, dataset_id: str,
+                              module: Optional[str] = None) -> Tuple[pd.DataFrame, Dataset]:
+        """
+        Load a dataset's DataFrame together with its Dataset row.
+        
+        For callers that need the row anyway: the row is fetched once and the
+        data comes from the cache when possible, as in load_dataset.
+        
+        Args:
+            dataset_id: The ID of the dataset to load
+            module: Optional module name for module-specific transformations
             
-            # Apply transformations if module is specified
-            if module:
-                df = self._apply_module_transformations(df, module)
+        Returns:
+            Tuple of (DataFrame, Dataset)
+        """
+        try:
+            dataset = Dataset.objects.get(id=dataset_id)
             
-            # Cache results
-            cache.set(cache_key, df.to_json(), self.cache_timeout)
+            cache_key = self._dataset_cache_key(dataset_id, module)
+            cached_data = cache.get(cache_key)
+            if cached_data is not None:
+                logger.debug(f"Cache hit for dataset {dataset_id}")
+                return _deserialize_df(cached_data), dataset
             
-            return df
+            return self._load_dataset_data(dataset, module, cache_key), dataset
             
         except Dataset.DoesNotExist:
             logger.error(f"Dataset {dataset_id} not found")
@@ -91,6 +284,42 @@ class DataService:
             logger.error(f"Error loading dataset {dataset_id}: {str(e)}")
             raise
     
+    def _dataset_cache_key(self, dataset_id: str, module: Optional[str] = None) -> str:
+        """Cache key of a loaded dataset, per module transformation."""
+        cache_key = f"dataset_{dataset_id}"
+        if module:
+            cache_key += f"_{module}"
+        return cache_key
+    
+    def _load_dataset_data(self, dataset: Dataset, module: Optional[str], cache_key: str) -> pd.DataFrame:
+        """
+        Read a dataset's data from storage and cache it.
+        
+        Args:
+            dataset: The Dataset row
+            module: Optional module name for module-specific transformations
+            cache_key: Key to cache the loaded DataFrame under
+            
+        Returns:
+            The loaded DataFrame
+        """
+        # Load data
+        if dataset.file:
+            df = self._load_from_file(dataset.file.path)
+        elif dataset.data_json:
+            df = pd.read_json(io.StringIO(dataset.data_json))
+        else:
+            raise ValueError(f"Dataset {dataset.id} has no data")
+        
+        # Apply transformations if module is specified
+        if module:
+            df = self._apply_module_transformations(df, module)
+        
+        # Cache results
+        cache.set(cache_key, _serialize_df(df), self.cache_timeout)
+        
+        return df
+    
     def save_dataset(self, 
                      df: pd.DataFrame, 
                      name: str, 
@@ -145,7 +374,7 @@ class DataService:
             dataset.schema = self._generate_schema(df)
             
             # Save data
-            if len(df) > 1000 or df.memory_usage(deep=True).sum() > 1024 * 1024:  # > 1MB
+            if self._needs_file_storage(df):
                 # Save to file for large datasets
                 file_path = self._save_to_file(df, name)
                 dataset.file = file_path
@@ -165,6 +394,22 @@ class DataService:
             logger.error(f"Error saving dataset {name}: {str(e)}")
             raise
     
+    def _needs_file_storage(self, df: pd.DataFrame) -> bool:
+        """
+        Whether a DataFrame is too large to store as JSON on the dataset row.
+        
+        The shallow memory_usage is exact for numeric and datetime columns;
+        the deep one, which walks every Python object, only runs when there
+        are object-like columns whose contents it leaves out.
+        """
+        if len(df) > FILE_STORAGE_MIN_ROWS:
+            return True
+        if df.memory_usage(deep=False).sum() > FILE_STORAGE_MIN_BYTES:
+            return True
+        if not any(dtype.kind == 'O' for dtype in df.dtypes):
+            return False
+        return df.memory_usage(deep=True).sum() > FILE_STORAGE_MIN_BYTES
+    
     def transform_dataset(self, 
                          dataset_id: str, 
                          transformations: List[Dict[str, Any]],
@@ -184,8 +429,7 @@ class DataService:
         """
         try:
             # Load original dataset
-            df = self.load_dataset(dataset_id)
-            original_dataset = Dataset.objects.get(id=dataset_id)
+            df, original_dataset = self._load_dataset_and_row(dataset_id)
             
             # Apply transformations
             transformed_df = self._apply_transformations(df, transformations)
@@ -228,54 +472,60 @@ class DataService:
             cache_key = f"dataset_summary_{dataset_id}"
             cached_summary = cache.get(cache_key)
             if cached_summary is not None:
-                return json.loads(cached_summary)
+                return _loads_summary(cached_summary)
             
             # Load dataset
             df = self.load_dataset(dataset_id)
             
+            # Missing counts for every column in one pass
+            missing = df.isnull().sum()
+            
             # Generate summary
             summary = {
                 'shape': df.shape,
                 'dtypes': {col: str(dtype) for col, dtype in df.dtypes.items()},
-                'missing_values': df.isnull().sum().to_dict(),
+                'missing_values': missing.to_dict(),
                 'numeric_columns': {},
                 'categorical_columns': {},
                 'date_columns': {}
             }
             
-            # Numeric column summaries
-            numeric_cols = df.select_dtypes(include=['number']).columns
-            for col in numeric_cols:
-                summary['numeric_columns'][col] = {
-                    'min': float(df[col].min()) if not pd.isna(df[col].min()) else None,
-                    'max': float(df[col].max()) if not pd.isna(df[col].max()) else None,
-                    'mean': float(df[col].mean()) if not pd.isna(df[col].mean()) else None,
-                    'median': float(df[col].median()) if not pd.isna(df[col].median()) else None,
-                    'std': float(df[col].std()) if not pd.isna(df[col].std()) else None,
-                    'missing': int(df[col].isnull().sum())
-                }
+            # Numeric column summaries, all reductions in one agg call
+            numeric_df = df.select_dtypes(include=['number'])
+            if len(numeric_df.columns):
+                numeric_stats = numeric_df.agg(['min', 'max', 'mean', 'median', 'std'])
+                for col, col_stats in numeric_stats.items():
+                    summary['numeric_columns'][col] = {
+                        stat: None if pd.isna(value) else float(value)
+                        for stat, value in col_stats.items()
+                    }
+                    summary['numeric_columns'][col]['missing'] = int(missing[col])
             
             # Categorical column summaries
             cat_cols = df.select_dtypes(include=['object', 'category']).columns
             for col in cat_cols:
+                # value_counts drops missing values, so its non-zero counts give
+                # nunique() (categoricals list unused categories with a zero count)
                 value_counts = df[col].value_counts()
                 summary['categorical_columns'][col] = {
-                    'unique_values': int(df[col].nunique()),
+                    'unique_values': int(np.count_nonzero(value_counts.to_numpy())),
                     'top_values': value_counts.head(5).to_dict(),
-                    'missing': int(df[col].isnull().sum())
+                    'missing': int(missing[col])
                 }
             
             # Date column summaries
-            date_cols = df.select_dtypes(include=['datetime']).columns
-            for col in date_cols:
-                summary['date_columns'][col] = {
-                    'min': df[col].min().isoformat() if not pd.isna(df[col].min()) else None,
-                    'max': df[col].max().isoformat() if not pd.isna(df[col].max()) else None,
-                    'missing': int(df[col].isnull().sum())
-                }
+            date_df = df.select_dtypes(include=['datetime'])
+            if len(date_df.columns):
+                date_min, date_max = date_df.min(), date_df.max()
+                for col in date_df.columns:
+                    summary['date_columns'][col] = {
+                        'min': None if pd.isna(date_min[col]) else date_min[col].isoformat(),
+                        'max': None if pd.isna(date_max[col]) else date_max[col].isoformat(),
+                        'missing': int(missing[col])
+                    }
             
             # Cache summary
-            cache.set(cache_key, json.dumps(summary, default=str), self.cache_timeout)
+            cache.set(cache_key, _dumps_summary(summary), self.cache_timeout)
             
             return summary
             
@@ -292,20 +542,24 @@ class DataService:
             rows: Number of rows to include in the preview
             
         Returns:
-            Dictionary containing dataset preview
+            Dictionary containing dataset preview; 'data' holds one list of
+            values per row, in the order of 'columns'
         """
         try:
-            # Load dataset
-            df = self.load_dataset(dataset_id)
-            
-            # Get preview
-            preview_df = df.head(rows)
+            # Decode only the first rows of a cached Arrow payload
+            cached_data = cache.get(self._dataset_cache_key(dataset_id))
+            if isinstance(cached_data, bytes):
+                preview_df, total_rows = _deserialize_df_head(cached_data, rows)
+            else:
+                # Load dataset
+                df = self.load_dataset(dataset_id)
+                preview_df, total_rows = df.head(rows), len(df)
             
             # Convert to JSON-serializable format
             preview = {
                 'columns': list(preview_df.columns),
-                'data': preview_df.to_dict(orient='records'),
-                'total_rows': len(df),
+                'data': preview_df.to_dict(orient='split', index=False)['data'],
+                'total_rows': total_rows,
                 'preview_rows': len(preview_df)
             }
             
@@ -329,38 +583,44 @@ class DataService:
         try:
             # Load the dataset
             df = self.load_dataset(dataset_id)
-            
-            # Get module-specific handlers
-            handlers = self.registry.get_data_handlers('dataset_conversion')
-            
-            # Find handler for target module
-            target_handler = None
-            for handler in handlers:
-                if handler['module'] == target_module:
-                    target_handler = handler['handler']
-                    break
-            
-            if not target_handler:
-                # Use default transformation if no specific handler
-                converted_df = self._apply_module_transformations(df, target_module)
-                metadata = {'conversion_type': 'default'}
-            else:
-                # Use module-specific handler
-                handler_parts = target_handler.split('.')
-                module_name = '.'.join(handler_parts[:-1])
-                function_name = handler_parts[-1]
-                
-                module = __import__(module_name, fromlist=[function_name])
-                handler_function = getattr(module, function_name)
-                
-                converted_df, metadata = handler_function(df)
-            
-            return converted_df, metadata
+            return self._convert_dataframe(df, target_module)
             
         except Exception as e:
             logger.error(f"Error converting dataset {dataset_id} for module {target_module}: {str(e)}")
             raise
     
+    def _convert_dataframe(self, df: pd.DataFrame, target_module: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Convert a loaded DataFrame for use in a specific module.
+        
+        Args:
+            df: The DataFrame to convert
+            target_module: The module to convert for
+            
+        Returns:
+            Tuple of (converted DataFrame, conversion metadata)
+        """
+        # Get module-specific handlers
+        handlers = self.registry.get_data_handlers('dataset_conversion')
+        
+        # Find handler for target module
+        target_handler = None
+        for handler in handlers:
+            if handler['module'] == target_module:
+                target_handler = handler['handler']
+                break
+        
+        if not target_handler:
+            # Use default transformation if no specific handler
+            converted_df = self._apply_module_transformations(df, target_module)
+            metadata = {'conversion_type': 'default'}
+        else:
+            # Use module-specific handler
+            handler_function = _resolve_callable(target_handler)
+            converted_df, metadata = handler_function(df)
+        
+        return converted_df, metadata
+    
     def get_compatible_modules(self, dataset_id: str) -> List[Dict[str, Any]]:
         """
         Get a list of modules compatible with a dataset.
@@ -378,36 +638,36 @@ class DataService:
             # Get all modules
             modules = self.registry.get_enabled_modules()
             
-            # Check compatibility with each module
+            # Modules that have a compatibility checker
+            checks = [
+                (module_name, module_info, module_info['metadata']['data_compatibility_checker'])
+                for module_name, module_info in modules.items()
+                if 'data_compatibility_checker' in module_info.get('metadata', {})
+            ]
+            
+            # Checkers are independent and only read df, so run them concurrently
+            results = []
+            if checks:
+                with ThreadPoolExecutor(max_workers=min(CHECKER_WORKERS, len(checks))) as executor:
+                    results = list(executor.map(
+                        lambda check: _run_compatibility_checker(check[2], df), checks
+                    ))
+            
+            # Check compatibility with each module, in registry order
             compatible_modules = []
             
-            for module_name, module_info in modules.items():
-                # Skip if module doesn't have a compatibility checker
-                if 'data_compatibility_checker' not in module_info.get('metadata', {}):
+            for (module_name, module_info, _), result in zip(checks, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Error checking compatibility for module {module_name}: {str(result)}")
                     continue
                 
-                # Get compatibility checker
-                checker_path = module_info['metadata']['data_compatibility_checker']
-                checker_parts = checker_path.split('.')
-                checker_module_name = '.'.join(checker_parts[:-1])
-                checker_function_name = checker_parts[-1]
-                
-                try:
-                    checker_module = __import__(checker_module_name, fromlist=[checker_function_name])
-                    checker_function = getattr(checker_module, checker_function_name)
-                    
-                    # Check compatibility
-                    is_compatible, compatibility_info = checker_function(df)
-                    
-                    if is_compatible:
-                        compatible_modules.append({
-                            'module_name': module_name,
-                            'module_info': module_info,
-                            'compatibility_info': compatibility_info
-                        })
-                        
-                except Exception as checker_error:
-                    logger.warning(f"Error checking compatibility for module {module_name}: {str(checker_error)}")
+                is_compatible, compatibility_info = result
+                if is_compatible:
+                    compatible_modules.append({
+                        'module_name': module_name,
+                        'module_info': module_info,
+                        'compatibility_info': compatibility_info
+                    })
             
             return compatible_modules
             
@@ -429,11 +689,9 @@ class DataService:
             Dictionary with sharing results
         """
         try:
-            # Convert dataset for target module
-            df, conversion_metadata = self.convert_for_module(dataset_id, target_module)
-            
-            # Get original dataset
-            original_dataset = Dataset.objects.get(id=dataset_id)
+            # Load the original dataset and convert it for the target module
+            original_df, original_dataset = self._load_dataset_and_row(dataset_id)
+            df, conversion_metadata = self._convert_dataframe(original_df, target_module)
             
             # Create new dataset for target module
             module_dataset = self.save_dataset(
@@ -474,6 +732,19 @@ class DataService:
             logger.error(f"Error sharing dataset {dataset_id} with module {target_module}: {str(e)}")
             raise
     
+    @staticmethod
+    def _csv_has_temporal_columns(file_path: str) -> bool:
+        """
+        Whether Arrow would type any CSV column as a date, time or timestamp.
+        
+        The default reader leaves those columns as strings, so such files
+        are read with it to keep the dtypes callers already see.
+        """
+        with pa_csv.open_csv(file_path) as reader:
+            return any(
+                pa.types.is_temporal(field.type) for field in reader.schema
+            )
+    
     def _load_from_file(self, file_path: str) -> pd.DataFrame:
         """
         Load a dataset from a file.
@@ -487,13 +758,28 @@ class DataService:
         file_ext = os.path.splitext(file_path)[1].lower()
         
         if file_ext == '.csv':
-            return pd.read_csv(file_path)
+            if PYARROW_AVAILABLE and not self._csv_has_temporal_columns(file_path):
+                # Arrow's reader parses on all cores; columns stay numpy-backed
+                return pd.read_csv(file_path, engine='pyarrow')
+            return pd.read_csv(file_path, low_memory=False)
         elif file_ext == '.xlsx' or file_ext == '.xls':
             return pd.read_excel(file_path)
         elif file_ext == '.json':
             return pd.read_json(file_path)
         elif file_ext == '.pkl' or file_ext == '.pickle':
             return pd.read_pickle(file_path)
+        elif file_ext in ('.parquet', '.feather') and PYARROW_AVAILABLE:
+            if file_ext == '.parquet':
+                table = pq.read_table(file_path)
+            else:
+                table = feather.read_table(file_path)
+            df = table.to_pandas()
+            # Columns _write_in_batches stored as categoricals go back to strings
+            categorized = (table.schema.metadata or {}).get(CATEGORIZED_COLUMNS_KEY)
+            if categorized:
+                df = df.astype({df.columns[position]: dtype
+                                for position, dtype in json.loads(categorized)})
+            return df
         elif file_ext == '.parquet':
             return pd.read_parquet(file_path)
         elif file_ext == '.feather':
@@ -515,18 +801,78 @@ class DataService:
         # Create safe filename
         safe_name = ''.join(c if c.isalnum() or c in ['.', '_', '-'] else '_' for c in name)
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{safe_name}_{timestamp}.parquet"
+        if self.storage_format not in ('feather', 'parquet'):
+            raise ValueError(f"Unsupported storage format: {self.storage_format}")
+        filename = f"{safe_name}_{timestamp}.{self.storage_format}"
         
         # Ensure temp directory exists
         os.makedirs(os.path.join(settings.MEDIA_ROOT, self.temp_dir), exist_ok=True)
         
-        # Save to parquet for efficiency
+        # Save in a binary columnar format; the index is not kept
         file_path = os.path.join(self.temp_dir, filename)
         full_path = os.path.join(settings.MEDIA_ROOT, file_path)
-        df.to_parquet(full_path, index=False)
+        if PYARROW_AVAILABLE:
+            self._write_in_batches(df, full_path)
+        elif self.storage_format == 'feather':
+            df.reset_index(drop=True).to_feather(full_path, compression='lz4')
+        else:
+            df.to_parquet(full_path, index=False, compression='zstd', compression_level=3)
         
         return file_path
     
+    def _write_in_batches(self, df: pd.DataFrame, full_path: str) -> None:
+        """
+        Write a DataFrame to a Feather or Parquet file WRITE_BATCH_ROWS rows at a time.
+        
+        Only one batch is converted to Arrow at once, so peak memory stays
+        close to the frame itself instead of the frame plus a full Arrow copy.
+        
+        Args:
+            df: The DataFrame to write
+            full_path: Destination file path
+        """
+        # Repeated strings are stored once per file, as a dictionary
+        categorized = self._low_cardinality_columns(df)
+        if categorized:
+            df = df.astype({df.columns[position]: 'category' for position, _ in categorized})
+        
+        # Infer types from the whole frame so every batch shares one schema
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        if categorized:
+            schema = schema.with_metadata({
+                **schema.metadata, CATEGORIZED_COLUMNS_KEY: json.dumps(categorized).encode()
+            })
+        
+        if self.storage_format == 'feather':
+            options = pa.ipc.IpcWriteOptions(compression='lz4')
+            writer = pa.ipc.new_file(full_path, schema, options=options)
+        else:
+            writer = pq.ParquetWriter(full_path, schema, compression='zstd', compression_level=3)
+        
+        with writer:
+            for start in range(0, len(df), WRITE_BATCH_ROWS):
+                batch = df.iloc[start:start + WRITE_BATCH_ROWS]
+                writer.write_batch(pa.RecordBatch.from_pandas(batch, schema=schema, preserve_index=False))
+    
+    def _low_cardinality_columns(self, df: pd.DataFrame) -> List[List[Any]]:
+        """
+        Find the string columns worth storing as categoricals.
+        
+        A column qualifies when it has fewer distinct values than the larger
+        of 100 and half its rows.
+        
+        Returns:
+            [position, dtype name] pairs of the qualifying columns
+        """
+        max_unique = max(100, len(df) // 2)
+        return [
+            [position, str(series.dtype)]
+            for position, (_, series) in enumerate(df.items())
+            if not isinstance(series.dtype, pd.CategoricalDtype)
+            and pd.api.types.is_string_dtype(series)
+            and series.nunique(dropna=False) < max_unique
+        ]
+    
     def _generate_schema(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Generate a schema for a DataFrame.
@@ -544,19 +890,22 @@ class DataService:
             'column_count': len(df.columns)
         }
         
-        for col in df.columns:
+        nullable = df.isna().any()
+        
+        for col, series in df.items():
             col_schema = {
                 'name': col,
-                'dtype': str(df[col].dtype),
-                'nullable': bool(df[col].isna().any())
+                'dtype': str(series.dtype),
+                'nullable': bool(nullable[col])
             }
             
             # Add more info based on dtype
-            if pd.api.types.is_numeric_dtype(df[col]):
-                col_schema['min'] = float(df[col].min()) if not pd.isna(df[col].min()) else None
-                col_schema['max'] = float(df[col].max()) if not pd.isna(df[col].max()) else None
-            elif pd.api.types.is_string_dtype(df[col]) or pd.api.types.is_categorical_dtype(df[col]):
-                col_schema['unique_count'] = df[col].nunique()
+            if pd.api.types.is_numeric_dtype(series):
+                col_min, col_max = series.min(), series.max()
+                col_schema['min'] = None if pd.isna(col_min) else float(col_min)
+                col_schema['max'] = None if pd.isna(col_max) else float(col_max)
+            elif pd.api.types.is_string_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype):
+                col_schema['unique_count'] = series.nunique()
             
             schema['columns'].append(col_schema)
         
@@ -572,9 +921,19 @@ class DataService:
         Returns:
             Hash string
         """
-        # Convert to string and hash
-        df_str = df.to_csv(index=False)
-        return hashlib.sha256(df_str.encode()).hexdigest()
+        # Hash the column layout, then pandas' vectorized per-row hashes, so no
+        # text conversion of the values is needed
+        digest = hashlib.sha256()
+        for col, dtype in df.dtypes.items():
+            digest.update(f"{col}:{dtype};".encode())
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        except TypeError:
+            # Unhashable cells such as lists or dicts: fall back to hashing the CSV text
+            digest.update(df.to_csv(index=False).encode())
+        else:
+            digest.update(np.ascontiguousarray(row_hashes).view(np.uint8))
+        return digest.hexdigest()
     
     def _apply_transformations(self, df: pd.DataFrame, transformations: List[Dict[str, Any]]) -> pd.DataFrame:
         """
@@ -588,29 +947,24 @@ class DataService:
             The transformed DataFrame
         """
         result_df = df.copy()
+        # Row mask of the consecutive filters seen since the last other transformation
+        filter_mask = None
         
         for transform in transformations:
             transform_type = transform.get('type')
             
             if transform_type == 'filter':
-                column = transform.get('column')
-                operator = transform.get('operator')
-                value = transform.get('value')
-                
-                if operator == 'equals':
-                    result_df = result_df[result_df[column] == value]
-                elif operator == 'not_equals':
-                    result_df = result_df[result_df[column] != value]
-                elif operator == 'greater_than':
-                    result_df = result_df[result_df[column] > value]
-                elif operator == 'less_than':
-                    result_df = result_df[result_df[column] < value]
-                elif operator == 'contains':
-                    result_df = result_df[result_df[column].astype(str).str.contains(str(value))]
-                elif operator == 'in':
-                    result_df = result_df[result_df[column].isin(value)]
-                
-            elif transform_type == 'select':
+                # Filters are combined and applied in one slice
+                mask = self._filter_mask(result_df, transform)
+                if mask is not None:
+                    filter_mask = mask if filter_mask is None else filter_mask & mask
+                continue
+            
+            if filter_mask is not None:
+                result_df = result_df[filter_mask]
+                filter_mask = None
+            
+            if transform_type == 'select':
                 columns = transform.get('columns', [])
                 result_df = result_df[columns]
                 
@@ -641,18 +995,47 @@ class DataService:
                 result_df[column] = result_df[column].astype(dtype)
                 
             elif transform_type == 'custom':
-                # Execute custom transformation defined as a Python expression
-                # This is potentially dangerous and should be used with caution
-                # Only enable for trusted environments
-                code = transform.get('code')
-                if code and getattr(settings, 'ALLOW_CUSTOM_TRANSFORMATIONS', False):
-                    # Use locals to capture the result
-                    local_vars = {'df': result_df, 'np': np, 'pd': pd}
-                    exec(code, {}, local_vars)
-                    result_df = local_vars['df']
+                # Evaluate an expression over the columns, e.g. "ratio = a / b" to add
+                # a column or "a > b" to keep matching rows. DataFrame.eval on its own
+                # can reach Python objects (through '@' references and attribute
+                # calls), so the expression is checked against a whitelist first and
+                # evaluated without access to any local or global variables
+                expr = transform.get('expr')
+                if transform.get('code'):
+                    logger.warning("Custom transformation 'code' is no longer executed; use 'expr'")
+                if expr and getattr(settings, 'ALLOW_CUSTOM_TRANSFORMATIONS', False):
+                    _validate_custom_expr(expr, result_df.columns)
+                    result = result_df.eval(expr, local_dict={}, global_dict={})
+                    if isinstance(result, pd.DataFrame):
+                        result_df = result
+                    elif isinstance(result, pd.Series) and pd.api.types.is_bool_dtype(result):
+                        result_df = result_df[result]
+                    else:
+                        raise ValueError(
+                            f"Custom expression must assign columns or select rows: {expr}"
+                        )
+        
+        if filter_mask is not None:
+            result_df = result_df[filter_mask]
         
         return result_df
     
+    def _filter_mask(self, df: pd.DataFrame, transform: Dict[str, Any]) -> Optional[pd.Series]:
+        """
+        Build the row mask of a filter transformation.
+        
+        Args:
+            df: The DataFrame to filter
+            transform: The filter operation
+            
+        Returns:
+            Boolean Series selecting the rows to keep, or None for an unknown operator
+        """
+        predicate = _FILTER_OPERATORS.get(transform.get('operator'))
+        if predicate is None:
+            return None
+        return predicate(df[transform.get('column')], transform.get('value'))
+    
     def _apply_module_transformations(self, df: pd.DataFrame, module: str) -> pd.DataFrame:
         """
         Apply module-specific transformations to a DataFrame.
@@ -664,20 +1047,28 @@ class DataService:
         Returns:
             The transformed DataFrame
         """
-        # Get module information
-        module_info = self.registry.get_module(module)
+        # Looked up in the registry once per registry version
+        if self._module_transformations_version != self.registry.version:
+            self._module_transformations = {}
+            self._module_transformations_version = self.registry.version
+        
+        if module not in self._module_transformations:
+            module_info = self.registry.get_module(module)
+            if not module_info:
+                transformations = None
+            else:
+                transformations = module_info.get('metadata', {}).get('data_transformations', [])
+            self._module_transformations[module] = transformations
         
-        if not module_info:
+        transformations = self._module_transformations[module]
+        if transformations is None:
             logger.warning(f"Module {module} not found in registry")
             return df
         
         # Check if module has data transformations
-        if 'data_transformations' not in module_info.get('metadata', {}):
+        if not transformations:
             return df
         
-        # Get transformations
-        transformations = module_info['metadata']['data_transformations']
-        
         # Apply transformations
         return self._apply_transformations(df, transformations)
 
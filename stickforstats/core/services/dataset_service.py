@@ -18,9 +18,19 @@ from dataclasses import dataclass
 
 from stickforstats.core.models import Dataset, User
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Bytes parsed per block when streaming a CSV upload
+CSV_BLOCK_SIZE = 1 << 20
+
 
 @dataclass
 class DatasetValidationResult:
@@ -278,6 +288,118 @@ class DatasetService:
             logger.error(f"Error reading dataset file: {str(e)}")
             return None
     
+    def profile_csv(
+        self,
+        source,
+        has_header: bool = True,
+        delimiter: str = ","
+    ) -> Dict[str, Any]:
+        """
+        Count the rows and type the columns of a CSV file in one streaming pass.
+        
+        The file is read block by block and never held in memory as a
+        DataFrame. Column types are inferred from the first block, and a
+        column with later values that don't fit its type is reported as
+        categorical.
+        
+        Args:
+            source: Path or binary file object of the CSV file
+            has_header: Whether the file has a header row
+            delimiter: Delimiter for CSV files
+        
+        Returns:
+            Dictionary with row_count, column_count and columns_info
+        """
+        if PYARROW_AVAILABLE:
+            # Infer the column types from the first block only
+            schema = self._open_csv(source, has_header, delimiter).schema
+            if hasattr(source, 'seek'):
+                source.seek(0)
+            # Read every column as text so a later block can't fail conversion,
+            # and retype columns whose values don't all cast to the inferred type
+            reader = self._open_csv(
+                source, has_header, delimiter,
+                column_types={field.name: pa.string() for field in schema}
+            )
+            typed_fields = {
+                i: field for i, field in enumerate(schema)
+                if not pa.types.is_string(field.type) and not pa.types.is_null(field.type)
+            }
+            demoted = set()
+            row_count = 0
+            for batch in reader:
+                row_count += batch.num_rows
+                for i, field in typed_fields.items():
+                    if i in demoted:
+                        continue
+                    try:
+                        batch.column(i).cast(field.type)
+                    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                        demoted.add(i)
+            columns_info = {
+                field.name: {
+                    'type': 'categorical' if i in demoted
+                    else self._arrow_column_type(field.type)
+                }
+                for i, field in enumerate(schema)
+            }
+        else:
+            columns_info = None
+            row_count = 0
+            chunks = pd.read_csv(source, header=0 if has_header else None,
+                                 delimiter=delimiter, chunksize=100_000)
+            for chunk in chunks:
+                if columns_info is None:
+                    columns_info = {
+                        str(col): {'type': self._pandas_column_type(chunk[col])}
+                        for col in chunk.columns
+                    }
+                row_count += len(chunk)
+            columns_info = columns_info or {}
+        
+        return {
+            'row_count': row_count,
+            'column_count': len(columns_info),
+            'columns_info': columns_info
+        }
+    
+    @staticmethod
+    def _open_csv(source, has_header: bool, delimiter: str, column_types=None):
+        """Open a streaming Arrow reader over a CSV file."""
+        return pa_csv.open_csv(
+            source,
+            read_options=pa_csv.ReadOptions(
+                block_size=CSV_BLOCK_SIZE,
+                autogenerate_column_names=not has_header
+            ),
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                strings_can_be_null=True
+            )
+        )
+    
+    @staticmethod
+    def _arrow_column_type(arrow_type) -> str:
+        """Map an Arrow type to the columns_info type names."""
+        if pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type) \
+                or pa.types.is_decimal(arrow_type):
+            return 'numeric'
+        if pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+            return 'datetime'
+        return 'categorical'
+    
+    @staticmethod
+    def _pandas_column_type(series: pd.Series) -> str:
+        """Map a pandas dtype to the columns_info type names."""
+        if pd.api.types.is_bool_dtype(series):
+            return 'categorical'
+        if pd.api.types.is_numeric_dtype(series):
+            return 'numeric'
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return 'datetime'
+        return 'categorical'
+    
     def _generate_metadata(
         self, 
         df: pd.DataFrame, 
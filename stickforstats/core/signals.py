@@ -0,0 +1,95 @@
+"""
+Signal handlers for the core application.
+
+Cached API responses (see stickforstats.core.api.caching) are only
+invalidated by writes through the API viewsets. Analyses, results,
+visualizations, workflows and datasets are also written by tasks and
+services, so any save or delete of these models drops the owner's cache.
+"""
+import threading
+
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from stickforstats.mainapp.models import (
+    AnalysisResult, AnalysisSession, Dataset, Visualization, Workflow, WorkflowStep
+)
+
+from .api.caching import invalidate_user_response_cache
+
+# Foreign key from each child model to the parent that leads to its owner
+_PARENT_FIELDS = {
+    AnalysisResult: 'session',
+    Visualization: 'analysis_result',
+    WorkflowStep: 'workflow',
+}
+# Owner lookups by parent ID for children whose parent isn't loaded
+_OWNER_LOOKUPS = {
+    AnalysisResult: (AnalysisSession, 'user_id'),
+    Visualization: (AnalysisResult, 'session__user_id'),
+    WorkflowStep: (Workflow, 'user_id'),
+}
+
+# Parents whose delete is in progress on this thread, as (model, pk). Their
+# own post_delete invalidates the owner, so their cascaded children skip the
+# owner lookup.
+_deleting = threading.local()
+
+
+def _deleting_parents():
+    if not hasattr(_deleting, 'parents'):
+        _deleting.parents = set()
+    return _deleting.parents
+
+
+def _owner_id(instance):
+    """Return the ID of the user whose API responses show instance."""
+    field_name = _PARENT_FIELDS.get(type(instance))
+    if field_name is None:
+        return instance.user_id
+    descriptor = getattr(type(instance), field_name)
+    # A parent loaded with or assigned to the instance needs no query
+    if descriptor.is_cached(instance):
+        return _owner_id(getattr(instance, field_name))
+    parent_model, owner_path = _OWNER_LOOKUPS[type(instance)]
+    return parent_model.objects.filter(
+        pk=getattr(instance, f'{field_name}_id')
+    ).values_list(owner_path, flat=True).first()
+
+
+@receiver(pre_delete, sender=AnalysisSession)
+@receiver(pre_delete, sender=AnalysisResult)
+@receiver(pre_delete, sender=Workflow)
+def mark_parent_deleting(sender, instance, **kwargs):
+    """Record a parent delete so its cascaded children skip invalidation."""
+    _deleting_parents().add((sender, instance.pk))
+
+
+@receiver(post_save, sender=Dataset)
+@receiver(post_save, sender=AnalysisSession)
+@receiver(post_save, sender=AnalysisResult)
+@receiver(post_save, sender=Visualization)
+@receiver(post_save, sender=Workflow)
+@receiver(post_save, sender=WorkflowStep)
+@receiver(post_delete, sender=Dataset)
+@receiver(post_delete, sender=AnalysisSession)
+@receiver(post_delete, sender=AnalysisResult)
+@receiver(post_delete, sender=Visualization)
+@receiver(post_delete, sender=Workflow)
+@receiver(post_delete, sender=WorkflowStep)
+def invalidate_owner_response_cache(sender, instance, **kwargs):
+    """
+    Drop the owner's cached API responses when one of their objects changes
+    """
+    parents = _deleting_parents()
+    if 'created' not in kwargs:
+        # post_delete: children are deleted before their parents
+        parents.discard((sender, instance.pk))
+        field_name = _PARENT_FIELDS.get(sender)
+        if field_name is not None:
+            parent_model = _OWNER_LOOKUPS[sender][0]
+            if (parent_model, getattr(instance, f'{field_name}_id')) in parents:
+                return
+    user_id = _owner_id(instance)
+    if user_id is not None:
+        invalidate_user_response_cache(user_id)
@@ -2,4 +2,4 @@
 Core tasks for StickForStats application.
 """
 
-from .notification_tasks import send_notification
\ No newline at end of file
+from .notification_tasks import send_notification, send_notification_sync
\ No newline at end of file
@@ -2,11 +2,21 @@
 Notification tasks for StickForStats application.
 """
 
+import atexit
 import logging
+import os
+import queue
+import threading
 
 logger = logging.getLogger(__name__)
 
-def send_notification(user_id, title, message, notification_type="info", related_object_type=None, related_object_id=None):
+# Notifications waiting for the background sender
+_notification_queue = queue.SimpleQueue()
+_worker_lock = threading.Lock()
+# Process the sender thread was started in; forked workers start their own
+_worker_pid = None
+
+def send_notification_sync(user_id, title, message, notification_type="info", related_object_type=None, related_object_id=None):
     """
     Send a notification to a user.
     
@@ -43,5 +53,64 @@ def send_notification(user_id, title, message, notification_type="info", related
         'type': notification_type
     }
 
-# Make delay a no-op method for compatibility with Celery-style task calls
-send_notification.delay = send_notification
\ No newline at end of file
+def _send_queued(kwargs):
+    """Send one queued notification; errors are logged, not raised."""
+    try:
+        send_notification_sync(**kwargs)
+    except Exception as e:
+        logger.error(f"Error sending notification to user {kwargs.get('user_id')}: {str(e)}")
+
+def _drain_queue():
+    """Send every notification still queued."""
+    while True:
+        try:
+            kwargs = _notification_queue.get_nowait()
+        except queue.Empty:
+            return
+        _send_queued(kwargs)
+
+def _run_worker():
+    """Wait for notifications and send them in the background."""
+    while True:
+        _send_queued(_notification_queue.get())
+
+def _ensure_worker():
+    """Start the sender thread in this process if it isn't running yet."""
+    global _worker_pid
+    if _worker_pid == os.getpid():
+        return
+    with _worker_lock:
+        if _worker_pid != os.getpid():
+            threading.Thread(target=_run_worker, name='notification-sender', daemon=True).start()
+            _worker_pid = os.getpid()
+
+def send_notification(user_id, title, message, notification_type="info", related_object_type=None, related_object_id=None):
+    """
+    Queue a notification to a user and return without waiting for it to be sent.
+    
+    Takes the same arguments as send_notification_sync, which a background
+    thread calls for each queued notification.
+    """
+    _notification_queue.put({
+        'user_id': user_id,
+        'title': title,
+        'message': message,
+        'notification_type': notification_type,
+        'related_object_type': related_object_type,
+        'related_object_id': related_object_id
+    })
+    _ensure_worker()
+
+    return {
+        'status': 'queued',
+        'user_id': user_id,
+        'title': title,
+        'message': message,
+        'type': notification_type
+    }
+
+# Celery-style task calls queue the notification as well
+send_notification.delay = send_notification
+
+# Send anything still queued when the process exits
+atexit.register(_drain_queue)
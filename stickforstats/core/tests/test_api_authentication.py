@@ -0,0 +1,49 @@
+"""Tests for cached JWT authentication."""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from stickforstats.core.api.authentication import (
+    CachedJWTAuthentication, _authenticate_token
+)
+
+User = get_user_model()
+
+
+class CachedJWTAuthenticationTest(TestCase):
+    """Test cases for CachedJWTAuthentication."""
+
+    def setUp(self):
+        _authenticate_token.cache_clear()
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create_user(
+            username='jwt', email='jwt@example.com', password='pass'
+        )
+        self.token = str(AccessToken.for_user(self.user))
+
+    def _authenticate(self, token):
+        request = self.factory.get('/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        return CachedJWTAuthentication().authenticate(request)
+
+    def test_repeat_requests_skip_database(self):
+        """Only the first request with a token loads the user."""
+        with self.assertNumQueries(1):
+            user, _ = self._authenticate(self.token)
+        with self.assertNumQueries(0):
+            repeat_user, _ = self._authenticate(self.token)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(repeat_user.pk, self.user.pk)
+        self.assertIsNot(user, repeat_user)
+
+    def test_invalid_token_rejected(self):
+        """Tampered tokens fail verification."""
+        with self.assertRaises(InvalidToken):
+            self._authenticate(self.token[:-2] + 'xx')
+
+    def test_other_schemes_ignored(self):
+        """Non-Bearer headers are left to the other authentication classes."""
+        request = self.factory.get('/', HTTP_AUTHORIZATION='Token abc')
+        self.assertIsNone(CachedJWTAuthentication().authenticate(request))
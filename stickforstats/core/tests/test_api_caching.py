@@ -0,0 +1,145 @@
+"""Tests for per-user API response caching."""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers, viewsets
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from stickforstats.core.api.caching import CachedResponseMixin
+from stickforstats.mainapp.models import AnalysisResult, AnalysisSession, Visualization
+
+User = get_user_model()
+
+
+class CountingViewSet(viewsets.ViewSet):
+    """Viewset that counts how often list actually runs."""
+    calls = 0
+
+    def list(self, request):
+        CountingViewSet.calls += 1
+        return Response({'calls': CountingViewSet.calls})
+
+    def create(self, request):
+        return Response({}, status=201)
+
+
+class CachedCountingViewSet(CachedResponseMixin, CountingViewSet):
+    pass
+
+
+class CachedResponseMixinTest(TestCase):
+    """Test cases for CachedResponseMixin."""
+
+    def setUp(self):
+        cache.clear()
+        CountingViewSet.calls = 0
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create_user(
+            username='cacher', email='cacher@example.com', password='pass'
+        )
+        self.other = User.objects.create_user(
+            username='other', email='other@example.com', password='pass'
+        )
+        self.list_view = CachedCountingViewSet.as_view({'get': 'list'}, basename='counting')
+        self.create_view = CachedCountingViewSet.as_view({'post': 'create'}, basename='counting')
+
+    def _get(self, user, path='/counting/'):
+        request = self.factory.get(path)
+        force_authenticate(request, user=user)
+        return self.list_view(request)
+
+    def test_list_served_from_cache(self):
+        """A repeated GET does not run the view again."""
+        self.assertEqual(self._get(self.user).data, {'calls': 1})
+        self.assertEqual(self._get(self.user).data, {'calls': 1})
+        self.assertEqual(CountingViewSet.calls, 1)
+
+    def test_cache_is_per_user_and_query(self):
+        """Users and query strings get separate entries."""
+        self._get(self.user)
+        self._get(self.other)
+        self._get(self.user, '/counting/?page=2')
+        self.assertEqual(CountingViewSet.calls, 3)
+
+    def test_write_invalidates(self):
+        """A successful write makes the next GET run the view again."""
+        self._get(self.user)
+        request = self.factory.post('/counting/', {}, format='json')
+        force_authenticate(request, user=self.user)
+        self.create_view(request)
+        self.assertEqual(self._get(self.user).data, {'calls': 2})
+
+
+class SessionStatusSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AnalysisSession
+        fields = ('id', 'status')
+
+
+class CachedSessionViewSet(CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
+    """Cached viewset over the analysis sessions of the current user."""
+    serializer_class = SessionStatusSerializer
+
+    def get_queryset(self):
+        return AnalysisSession.objects.filter(user=self.request.user)
+
+
+class OutOfBandInvalidationTest(TestCase):
+    """Test cases for invalidation by writes made outside the API."""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create_user(
+            username='owner', email='owner@example.com', password='pass'
+        )
+        self.session = AnalysisSession.objects.create(user=self.user, name='Run')
+        self.retrieve_view = CachedSessionViewSet.as_view({'get': 'retrieve'}, basename='session')
+
+    def _get_status(self):
+        request = self.factory.get(f'/sessions/{self.session.pk}/')
+        force_authenticate(request, user=self.user)
+        return self.retrieve_view(request, pk=self.session.pk).data['status']
+
+    def test_status_change_visible_on_next_get(self):
+        """A status saved by a task shows on the next GET instead of the cached one."""
+        self.assertEqual(self._get_status(), 'created')
+
+        self.session.status = 'completed'
+        self.session.save()
+
+        self.assertEqual(self._get_status(), 'completed')
+
+    def test_related_result_change_invalidates_owner(self):
+        """Saving a result of the session drops the session owner's cache."""
+        self._get_status()
+        AnalysisSession.objects.filter(pk=self.session.pk).update(status='failed')
+        AnalysisResult.objects.create(session=self.session, name='Result', analysis_type='test')
+
+        self.assertEqual(self._get_status(), 'failed')
+
+    def _delete_queries(self, visualizations):
+        session = AnalysisSession.objects.create(user=self.user, name='Cascade')
+        result = AnalysisResult.objects.create(session=session, name='R', analysis_type='test')
+        for index in range(visualizations):
+            Visualization.objects.create(
+                analysis_result=result, title=f'Plot {index}',
+                visualization_type='bar', figure_data={}
+            )
+        with CaptureQueriesContext(connection) as queries:
+            AnalysisSession.objects.get(pk=session.pk).delete()
+        return len(queries)
+
+    def test_cascade_delete_skips_child_owner_lookups(self):
+        """Deleting a session costs the same queries whatever its visualization count."""
+        self._get_status()
+
+        self.assertEqual(self._delete_queries(1), self._delete_queries(5))
+        self.assertEqual(self._get_status(), 'created')
+        AnalysisSession.objects.filter(pk=self.session.pk).update(status='failed')
+        AnalysisSession.objects.create(user=self.user, name='Other').delete()
+        self.assertEqual(self._get_status(), 'failed')
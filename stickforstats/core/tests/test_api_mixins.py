@@ -0,0 +1,117 @@
+"""Tests for the core API viewset mixins."""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework import serializers, viewsets
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from stickforstats.core.api.mixins import EagerLoadingMixin, FastListMixin
+from stickforstats.core.api.pagination import CreatedAtCursorPagination
+from stickforstats.core.api.serializers import DatasetSerializer
+from stickforstats.mainapp.models.analysis import AnalysisSession, Dataset
+
+User = get_user_model()
+
+
+class DatasetSummarySerializer(serializers.ModelSerializer):
+    label = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Dataset
+        fields = ['id', 'name', 'label']
+
+    def get_label(self, obj):
+        return obj.name.upper()
+
+
+class DatasetListViewSet(viewsets.ReadOnlyModelViewSet):
+    serializer_class = DatasetSerializer
+    queryset = Dataset.objects.all()
+
+
+class FastDatasetListViewSet(FastListMixin, DatasetListViewSet):
+    pass
+
+
+class PagedPagination(PageNumberPagination):
+    page_size = 2
+
+
+class FastListMixinTest(TestCase):
+    """Test cases for FastListMixin."""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create_user(
+            username='lister', email='lister@example.com', password='pass'
+        )
+        for i in range(3):
+            Dataset.objects.create(
+                user=self.user, name=f'data {i}', file=f'datasets/data{i}.csv',
+                file_type='csv', columns_info={'a': 'numeric'} if i else None
+            )
+
+    def _list(self, viewset_class, **initkwargs):
+        request = self.factory.get('/datasets/')
+        force_authenticate(request, user=self.user)
+        view = viewset_class.as_view({'get': 'list'}, **initkwargs)
+        return view(request)
+
+    def test_matches_serializer_output(self):
+        """Rows built from values() equal the regular serializer output."""
+        fast = self._list(FastDatasetListViewSet, pagination_class=None)
+        regular = self._list(DatasetListViewSet, pagination_class=None)
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(fast.data, regular.data)
+        self.assertTrue(fast.data[0]['file'].startswith('http://testserver/'))
+        self.assertEqual(fast.data[0]['user'], self.user.pk)
+
+    def test_paginated(self):
+        """Pagination wraps the rows the same way."""
+        fast = self._list(FastDatasetListViewSet, pagination_class=PagedPagination)
+        regular = self._list(DatasetListViewSet, pagination_class=PagedPagination)
+        self.assertEqual(fast.data['count'], 3)
+        self.assertEqual(fast.data, regular.data)
+
+    def test_cursor_paginated(self):
+        """Cursor pagination positions on the created_at column of value rows."""
+        pagination = type('TwoPerPage', (CreatedAtCursorPagination,), {'page_size': 2})
+        fast = self._list(FastDatasetListViewSet, pagination_class=pagination)
+        regular = self._list(DatasetListViewSet, pagination_class=pagination)
+        self.assertEqual(fast.data, regular.data)
+        self.assertEqual(len(fast.data['results']), 2)
+        self.assertNotIn('count', fast.data)
+        self.assertIsNotNone(fast.data['next'])
+
+    def test_plan_falls_back_for_method_fields(self):
+        """Serializers with method fields keep the regular list."""
+        self.assertIsNone(FastListMixin()._fast_list_plan(DatasetSummarySerializer()))
+
+
+class EagerSessionViewSet(EagerLoadingMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = AnalysisSession.objects.all()
+    select_related_fields = ('dataset',)
+    prefetch_related_fields = ('results',)
+    skip_eager_loading_actions = ('results',)
+
+
+class EagerLoadingMixinTest(TestCase):
+    """Test cases for EagerLoadingMixin."""
+
+    def _queryset(self, action):
+        viewset = EagerSessionViewSet()
+        viewset.action = action
+        return viewset.get_queryset()
+
+    def test_applies_declared_loading(self):
+        """Serializing actions join and prefetch the declared relations."""
+        queryset = self._queryset('retrieve')
+        self.assertEqual(queryset._prefetch_related_lookups, ('results',))
+        self.assertEqual(queryset.query.select_related, {'dataset': {}})
+
+    def test_skipped_actions_load_plain_rows(self):
+        """Actions that only count related rows skip the eager loading."""
+        queryset = self._queryset('results')
+        self.assertEqual(queryset._prefetch_related_lookups, ())
+        self.assertFalse(queryset.query.select_related)
@@ -0,0 +1,60 @@
+"""Tests for the core API renderers."""
+
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+import numpy as np
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+
+from stickforstats.core.api.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    """Test cases for ORJSONRenderer."""
+
+    def test_matches_json_renderer(self):
+        """Output decodes to the same value as DRF's JSONRenderer."""
+        data = {
+            'id': uuid.uuid4(),
+            'created_at': datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+            'amount': Decimal('1.50'),
+            'values': [1, 2.5, None, 'text'],
+            'nested': {'flag': True},
+        }
+
+        rendered = ORJSONRenderer().render(data)
+
+        self.assertIsInstance(rendered, bytes)
+        self.assertEqual(json.loads(rendered), json.loads(JSONRenderer().render(data)))
+
+    def test_none_renders_empty(self):
+        """None renders as an empty body, like JSONRenderer."""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_indent_from_media_type(self):
+        """An indent parameter in the accepted media type pretty-prints."""
+        rendered = ORJSONRenderer().render({'a': 1}, 'application/json; indent=4')
+
+        self.assertIn(b'\n', rendered)
+
+    def test_non_str_keys(self):
+        """Int, float and numpy float keys render like JSONRenderer."""
+        data = {
+            'top_values': {1: 10, 2: 4},
+            'series': {0.5: 'a', None: 'b'},
+            'numpy': {np.float64(1.5): 3},
+        }
+
+        rendered = ORJSONRenderer().render(data)
+
+        self.assertEqual(json.loads(rendered), json.loads(JSONRenderer().render(data)))
+        self.assertEqual(json.loads(rendered)['top_values'], {'1': 10, '2': 4})
+
+    def test_int_keys_without_fallback(self):
+        """Int-keyed dicts are encoded by orjson itself."""
+        rendered = ORJSONRenderer().render({'counts': {3: 1}})
+
+        self.assertEqual(rendered, b'{"counts":{"3":1}}')
@@ -0,0 +1,110 @@
+"""Tests for the msgspec request schemas of the statistics endpoints."""
+
+import uuid
+import unittest
+
+from django.test import TestCase
+from rest_framework.exceptions import ParseError, ValidationError
+from rest_framework.parsers import JSONParser, MultiPartParser
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from stickforstats.core.api.schemas import (
+    MSGSPEC_AVAILABLE, validate_request, CorrelationAnalysisRequest,
+    RegressionAnalysisRequest
+)
+from stickforstats.core.api.serializers import (
+    CorrelationAnalysisRequestSerializer, RegressionAnalysisRequestSerializer
+)
+
+
+@unittest.skipUnless(MSGSPEC_AVAILABLE, 'msgspec is not installed')
+class ValidateRequestTest(TestCase):
+    """Test cases for validate_request."""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.dataset_id = uuid.uuid4()
+
+    def _request(self, data, format='json'):
+        request = self.factory.post('/statistics/correlation/', data, format=format)
+        return Request(request, parsers=[JSONParser(), MultiPartParser()])
+
+    def _validate(self, request):
+        return validate_request(
+            request, CorrelationAnalysisRequest, CorrelationAnalysisRequestSerializer
+        )
+
+    def test_matches_serializer(self):
+        """JSON bodies produce the same validated data as the serializer."""
+        data = {'dataset_id': str(self.dataset_id), 'variables': ['a', 'b']}
+        serializer = CorrelationAnalysisRequestSerializer(data=data)
+        serializer.is_valid(raise_exception=True)
+
+        self.assertEqual(self._validate(self._request(data)), dict(serializer.validated_data))
+
+    def test_invalid_choice(self):
+        """Values outside a choice set are reported against the field."""
+        request = self._request({
+            'dataset_id': str(self.dataset_id), 'variables': ['a'], 'method': 'nope'
+        })
+        with self.assertRaises(ValidationError) as ctx:
+            self._validate(request)
+        self.assertIn('method', ctx.exception.detail)
+
+    def test_missing_field(self):
+        """Missing required fields are reported like DRF does."""
+        with self.assertRaises(ValidationError) as ctx:
+            self._validate(self._request({'dataset_id': str(self.dataset_id)}))
+        self.assertEqual(ctx.exception.detail['variables'][0], 'This field is required.')
+
+    def test_malformed_json(self):
+        """Bodies that are not JSON raise a parse error."""
+        request = self.factory.post(
+            '/statistics/correlation/', '{', content_type='application/json'
+        )
+        with self.assertRaises(ParseError):
+            self._validate(Request(request, parsers=[JSONParser()]))
+
+    def test_form_body_uses_serializer(self):
+        """Non-JSON bodies fall back to the DRF serializer."""
+        request = self._request({
+            'dataset_id': str(self.dataset_id), 'variables': 'a'
+        }, format='multipart')
+        validated = self._validate(request)
+        self.assertEqual(validated['variables'], ['a'])
+        self.assertEqual(validated['method'], 'pearson')
+
+    def _regression_parity(self, data):
+        """Validate data both ways; return (msgspec result, serializer)."""
+        serializer = RegressionAnalysisRequestSerializer(data=data)
+        serializer.is_valid()
+        try:
+            validated = validate_request(
+                self._request(data), RegressionAnalysisRequest,
+                RegressionAnalysisRequestSerializer
+            )
+        except ValidationError as exc:
+            return exc.detail, serializer
+        return validated, serializer
+
+    def test_strings_trimmed_like_serializer(self):
+        """Surrounding whitespace is stripped as CharField does."""
+        validated, serializer = self._regression_parity({
+            'dataset_id': str(self.dataset_id),
+            'dependent_var': ' y ',
+            'independent_vars': [' a', 'b '],
+        })
+        self.assertEqual(validated, dict(serializer.validated_data))
+        self.assertEqual(validated['independent_vars'], ['a', 'b'])
+
+    def test_blank_strings_rejected_like_serializer(self):
+        """Whitespace-only values fail with the serializer's errors."""
+        detail, serializer = self._regression_parity({
+            'dataset_id': str(self.dataset_id),
+            'dependent_var': '   ',
+            'independent_vars': ['x', '  '],
+        })
+        self.assertEqual(detail, serializer.errors)
+        self.assertEqual(detail['dependent_var'], ['This field may not be blank.'])
+        self.assertEqual(detail['independent_vars'], {1: ['This field may not be blank.']})
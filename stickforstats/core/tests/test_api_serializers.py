@@ -0,0 +1,329 @@
+"""Tests for the core API serializers."""
+
+import json
+import uuid
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from stickforstats.core.api.serializers import (
+    AnalysisCreateSerializer, AnalysisSerializer, CachedFieldsMixin, DatasetSerializer, FastCharField, FastUUIDField,
+    RegressionAnalysisRequestSerializer, ReportGenerationSerializer,
+    VisualizationSerializer, WorkflowCreateSerializer, with_json_text
+)
+from stickforstats.core.api.renderers import ORJSONRenderer, RawJSON, RawJSONEncoder
+from stickforstats.core.api.views import AnalysisViewSet
+from stickforstats.mainapp.models.analysis import (
+    AnalysisResult, AnalysisSession, Visualization
+)
+from stickforstats.mainapp.models.workflow import WorkflowStep
+
+User = get_user_model()
+
+
+class CachedFieldsMixinTest(SimpleTestCase):
+    """Test cases for per-class field caching."""
+
+    def setUp(self):
+        CachedFieldsMixin._fields_cache.pop(DatasetSerializer, None)
+        CachedFieldsMixin._validators_cache.pop(DatasetSerializer, None)
+
+    def test_fields_built_once_per_class(self):
+        """ModelSerializer.get_fields only runs for the first instance."""
+        with patch.object(
+            serializers.ModelSerializer, 'get_fields',
+            autospec=True, side_effect=serializers.ModelSerializer.get_fields
+        ) as get_fields:
+            first = DatasetSerializer().fields
+            second = DatasetSerializer().fields
+
+        self.assertEqual(get_fields.call_count, 1)
+        self.assertEqual(list(first), list(second))
+
+    def test_instances_get_independent_fields(self):
+        """Each instance binds its own copy of every field."""
+        first = DatasetSerializer()
+        second = DatasetSerializer()
+
+        for name in first.fields:
+            self.assertIsNot(first.fields[name], second.fields[name])
+            self.assertIs(first.fields[name].parent, first)
+            self.assertIs(second.fields[name].parent, second)
+
+    def test_validators_cached(self):
+        """Validators are computed once and returned as a fresh list."""
+        first = DatasetSerializer().get_validators()
+        second = DatasetSerializer().get_validators()
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_readable_and_writable_fields_cached(self):
+        """The readable/writable field lists are built once per instance."""
+        serializer = DatasetSerializer()
+
+        self.assertIs(serializer._readable_fields, serializer._readable_fields)
+        self.assertNotIn('id', [f.field_name for f in serializer._writable_fields])
+        self.assertEqual(
+            [f.field_name for f in serializer._readable_fields], list(serializer.fields)
+        )
+
+
+class CachedChoiceFieldTest(SimpleTestCase):
+    """Test cases for shared choice maps."""
+
+    def test_choice_maps_shared(self):
+        """Separate serializer instances reuse one choice lookup dict."""
+        first = RegressionAnalysisRequestSerializer().fields['regression_type']
+        second = RegressionAnalysisRequestSerializer().fields['regression_type']
+        self.assertIsNot(first, second)
+        self.assertIs(first.choice_strings_to_values, second.choice_strings_to_values)
+
+    def test_validation_unchanged(self):
+        """Choices are still enforced."""
+        serializer = RegressionAnalysisRequestSerializer(data={
+            'dataset_id': '3f1c0c8e-8e9a-4c1e-9a53-0f1a4b8d2c11',
+            'dependent_var': 'y',
+            'independent_vars': ['x'],
+            'regression_type': 'quantile',
+        })
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('regression_type', serializer.errors)
+
+
+class FastUUIDFieldTest(SimpleTestCase):
+    """Test cases for regex-screened UUID parsing."""
+
+    def test_accepts_uuid_forms(self):
+        """Hyphenated, hex, braced and urn forms all parse."""
+        value = uuid.uuid4()
+        field = FastUUIDField()
+        for data in (str(value), value.hex, '{%s}' % value, value.urn,
+                     str(value).upper(), value):
+            self.assertEqual(field.to_internal_value(data), value)
+
+    def test_rejects_malformed(self):
+        """Malformed strings fail with the invalid error."""
+        field = FastUUIDField()
+        for data in ('', 'not-a-uuid', '%s0' % uuid.uuid4(), 'g' * 32):
+            with self.assertRaises(serializers.ValidationError):
+                field.to_internal_value(data)
+
+
+class FastCharFieldTest(SimpleTestCase):
+    """Test cases for inline CharField checks."""
+
+    def _errors(self, field, data):
+        with self.assertRaises(serializers.ValidationError) as ctx:
+            field.run_validation(data)
+        return ctx.exception.detail
+
+    def test_matches_char_field(self):
+        """Valid and invalid input behave like CharField."""
+        fast = FastCharField(max_length=5, min_length=2)
+        stock = serializers.CharField(max_length=5, min_length=2)
+        self.assertEqual(fast.run_validation(' abc '), stock.run_validation(' abc '))
+        self.assertEqual(fast.run_validation('h\u00e9'), 'h\u00e9')
+        for data in ('abcdef', 'a', 'a\x00b', 'a\ud800b', True):
+            self.assertEqual(self._errors(fast, data), self._errors(stock, data))
+
+    def test_caller_validators_kept(self):
+        """Only CharField's own validators are inlined."""
+        def no_x(value):
+            if 'x' in value:
+                raise serializers.ValidationError('no x')
+        field = FastCharField(max_length=5, validators=[no_x])
+        self.assertEqual(field.validators, [no_x])
+        self.assertEqual(self._errors(field, 'x'), ['no x'])
+
+
+class SharedChildListFieldTest(SimpleTestCase):
+    """Test cases for list fields with a shared child."""
+
+    def test_child_shared_between_instances(self):
+        """Serializer copies of a list field reuse the same child."""
+        first = RegressionAnalysisRequestSerializer().fields['independent_vars']
+        second = RegressionAnalysisRequestSerializer().fields['independent_vars']
+        self.assertIsNot(first, second)
+        self.assertIs(first.child, second.child)
+
+    def test_child_validation(self):
+        """Items are still validated by the child field."""
+        valid_id = str(uuid.uuid4())
+        serializer = ReportGenerationSerializer(data={
+            'analysis_ids': [valid_id, 'nope'], 'title': 'Report'
+        })
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(list(serializer.errors['analysis_ids']), [1])
+
+        serializer = ReportGenerationSerializer(data={
+            'analysis_ids': [valid_id], 'title': 'Report'
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data['analysis_ids'], [uuid.UUID(valid_id)])
+
+
+class AnalysisVisualizationsTest(TestCase):
+    """Test cases for AnalysisSerializer and its visualizations."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email='analyst@example.com', username='analyst', password='password'
+        )
+        self.session = AnalysisSession.objects.create(user=self.user, name='Session')
+        for index in range(2):
+            result = AnalysisResult.objects.create(
+                session=self.session, name=f'Result {index}', analysis_type='ttest'
+            )
+            Visualization.objects.create(
+                analysis_result=result, title=f'Plot {index}',
+                visualization_type='bar', figure_data={'data': [index]}
+            )
+
+    def test_visualizations_from_prefetched_results(self):
+        """Visualizations of every result are emitted without extra queries."""
+        session = AnalysisSession.objects.prefetch_related(
+            'results__visualizations'
+        ).get(pk=self.session.pk)
+
+        with self.assertNumQueries(0):
+            data = AnalysisSerializer(session).data
+
+        self.assertEqual(data['name'], 'Session')
+        self.assertEqual(data['status'], 'created')
+        visualizations = data['visualizations']
+        self.assertEqual(
+            sorted(viz['title'] for viz in visualizations), ['Plot 0', 'Plot 1']
+        )
+        self.assertEqual(visualizations[0]['visualization_type'], 'bar')
+
+    def _get(self, actions, **kwargs):
+        request = APIRequestFactory().get('/analyses/')
+        force_authenticate(request, user=self.user)
+        return AnalysisViewSet.as_view(actions, pagination_class=None)(request, **kwargs)
+
+    def test_viewset_list_and_retrieve(self):
+        """The analysis endpoints serialize the user's sessions."""
+        listed = self._get({'get': 'list'})
+        self.assertEqual(listed.status_code, 200)
+        self.assertEqual([row['id'] for row in listed.data], [str(self.session.pk)])
+
+        # Session, results, visualizations
+        with self.assertNumQueries(3):
+            retrieved = self._get({'get': 'retrieve'}, pk=self.session.pk)
+        self.assertEqual(retrieved.status_code, 200)
+        self.assertEqual(len(retrieved.data['visualizations']), 2)
+
+    def test_figure_data_passthrough(self):
+        """Figure data fetched as text is rendered without being decoded."""
+        viz = with_json_text(Visualization.objects.all(), 'figure_data').get(title='Plot 1')
+
+        data = VisualizationSerializer(viz).data
+
+        self.assertIsInstance(data['figure_data'], RawJSON)
+        self.assertEqual(json.loads(ORJSONRenderer().render(data))['figure_data'], {'data': [1]})
+        fallback = json.dumps(data, cls=RawJSONEncoder)
+        self.assertEqual(json.loads(fallback)['figure_data'], {'data': [1]})
+
+    def test_figure_data_after_update(self):
+        """An update renders the saved figure data, not the text fetched before it."""
+        viz = with_json_text(Visualization.objects.all(), 'figure_data').get(title='Plot 1')
+        serializer = VisualizationSerializer(viz, data={'figure_data': {'new': 2}}, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+
+        self.assertEqual(serializer.data['figure_data'], {'new': 2})
+        viz.refresh_from_db()
+        self.assertEqual(viz.figure_data, {'new': 2})
+
+
+class AnalysisCreateSerializerTest(TestCase):
+    """Test cases for creating analysis sessions with their visualizations."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='creator@example.com', username='creator', password='password'
+        )
+
+    def test_visualizations_created_in_one_batch(self):
+        """Submitted visualizations are attached to one result in a single INSERT."""
+        serializer = AnalysisCreateSerializer(data={
+            'name': 'Session', 'module': 'sqc', 'dataset': None,
+            'visualizations': [
+                {'title': 'Chart', 'visualization_type': 'line', 'figure_data': {'x': [1]}},
+                {'title': 'Hist', 'visualization_type': 'histogram', 'figure_data': {}},
+            ]
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        # SAVEPOINT, session INSERT, result INSERT, visualizations INSERT, RELEASE
+        with self.assertNumQueries(5):
+            session = serializer.save(user=self.user)
+
+        result = AnalysisResult.objects.get(session=session)
+        self.assertEqual((result.name, result.analysis_type), ('Session', 'sqc'))
+        self.assertEqual(
+            sorted(Visualization.objects.filter(analysis_result=result)
+                   .values_list('title', flat=True)),
+            ['Chart', 'Hist']
+        )
+
+    def test_no_visualizations_no_result(self):
+        """Sessions created without visualizations get no placeholder result."""
+        serializer = AnalysisCreateSerializer(data={'name': 'Empty', 'dataset': None})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        session = serializer.save(user=self.user)
+
+        self.assertFalse(session.results.exists())
+
+    def test_invalid_visualization_rejected(self):
+        """Visualizations go through Visualization field validation."""
+        serializer = AnalysisCreateSerializer(data={
+            'name': 'Session', 'dataset': None,
+            'visualizations': [{'title': 'Chart', 'visualization_type': 'hologram',
+                                'figure_data': {}}]
+        })
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('visualizations', serializer.errors)
+
+
+class WorkflowCreateSerializerTest(TestCase):
+    """Test cases for creating workflows with their steps."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='flow@example.com', username='flow', password='password'
+        )
+
+    def test_steps_created_in_one_batch(self):
+        """Submitted steps are validated and inserted with a single query."""
+        serializer = WorkflowCreateSerializer(data={
+            'user': self.user.pk, 'name': 'Flow', 'dataset': None,
+            'steps': [
+                {'name': 'Load', 'step_type': 'data_loading'},
+                {'name': 'Test', 'step_type': 'statistical_test'},
+            ]
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        # SAVEPOINT, workflow INSERT, steps INSERT, RELEASE
+        with self.assertNumQueries(4):
+            workflow = serializer.save()
+
+        steps = list(WorkflowStep.objects.filter(workflow=workflow))
+        self.assertEqual([(s.name, s.order) for s in steps], [('Load', 0), ('Test', 1)])
+
+    def test_invalid_step_rejected(self):
+        """Steps go through WorkflowStep field validation."""
+        serializer = WorkflowCreateSerializer(data={
+            'user': self.user.pk, 'name': 'Flow', 'dataset': None,
+            'steps': [{'name': 'Load', 'step_type': 'teleport'}]
+        })
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('steps', serializer.errors)
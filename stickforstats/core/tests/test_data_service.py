@@ -0,0 +1,462 @@
+"""Tests for the data service helpers."""
+
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock, patch
+
+import pandas as pd
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from stickforstats.core.registry import ModuleRegistry
+from stickforstats.core.services import data_service
+
+
+class DataFrameCacheSerializationTest(SimpleTestCase):
+    """Test cases for the cached DataFrame payload."""
+
+    def test_round_trip_keeps_dtypes_and_index(self):
+        """Arrow payloads come back with the same dtypes and index."""
+        df = pd.DataFrame({
+            'value': [1.5, None, 3.0],
+            'count': [1, 2, 3],
+            'label': ['a', 'b', None],
+            'when': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-03']),
+        }, index=[0, 2, 5])
+
+        payload = data_service._serialize_df(df)
+
+        self.assertIsInstance(payload, bytes)
+        pd.testing.assert_frame_equal(data_service._deserialize_df(payload), df)
+
+    def test_mixed_object_column_falls_back_to_json(self):
+        """Columns Arrow can't type are cached as JSON instead."""
+        df = pd.DataFrame({'mixed': [1, 'two', 3.0]})
+
+        payload = data_service._serialize_df(df)
+
+        self.assertIsInstance(payload, str)
+        self.assertEqual(list(data_service._deserialize_df(payload)['mixed']), [1, 'two', 3.0])
+
+
+class LoadDatasetTest(SimpleTestCase):
+    """Test cases for loading datasets with their row."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.df = pd.DataFrame({'value': [1, 2, 3]})
+        self.row = Mock(id='1', file=None, data_json=self.df.to_json())
+        get_patcher = patch.object(data_service.Dataset.objects, 'get', return_value=self.row)
+        self.get = get_patcher.start()
+        self.addCleanup(get_patcher.stop)
+        self.service = data_service.DataService()
+
+    def test_row_fetched_once(self):
+        """The row is fetched once, and the data is cached for load_dataset."""
+        df, row = self.service._load_dataset_and_row('1')
+
+        self.assertIs(row, self.row)
+        pd.testing.assert_frame_equal(df, self.df)
+        pd.testing.assert_frame_equal(self.service.load_dataset('1'), self.df)
+        self.get.assert_called_once_with(id='1')
+
+    def test_transform_dataset_single_query(self):
+        """transform_dataset doesn't fetch the row a second time."""
+        result, new_dataset = self.service.transform_dataset('1', [
+            {'type': 'filter', 'column': 'value', 'operator': 'greater_than', 'value': 1},
+        ], save_transformed=False)
+
+        self.assertEqual(list(result['value']), [2, 3])
+        self.assertIsNone(new_dataset)
+        self.get.assert_called_once_with(id='1')
+
+
+class DatasetPreviewTest(SimpleTestCase):
+    """Test cases for get_dataset_preview."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.service = data_service.DataService()
+        self.df = pd.DataFrame({'value': range(50), 'label': [f'row {i}' for i in range(50)]},
+                               index=range(100, 150))
+
+    def test_preview_from_cached_payload(self):
+        """A cached Arrow payload is previewed without loading the frame."""
+        cache.set(self.service._dataset_cache_key('1'), data_service._serialize_df(self.df))
+
+        with patch.object(data_service.DataService, 'load_dataset') as load_dataset:
+            preview = self.service.get_dataset_preview('1', rows=3)
+
+        load_dataset.assert_not_called()
+        self.assertEqual(preview, {
+            'columns': ['value', 'label'],
+            'data': [[0, 'row 0'], [1, 'row 1'], [2, 'row 2']],
+            'total_rows': 50,
+            'preview_rows': 3
+        })
+
+    def test_preview_on_cache_miss(self):
+        """Without a cached payload the dataset is loaded."""
+        with patch.object(data_service.DataService, 'load_dataset', return_value=self.df):
+            preview = self.service.get_dataset_preview('1', rows=60)
+
+        self.assertEqual(preview['total_rows'], 50)
+        self.assertEqual(preview['preview_rows'], 50)
+
+
+class ModuleTransformationsTest(SimpleTestCase):
+    """Test cases for applying a module's registered transformations."""
+
+    def setUp(self):
+        self.registry = ModuleRegistry()
+        self.service = data_service.DataService()
+        self.service.registry = self.registry
+        self.df = pd.DataFrame({'value': [1, 2, 3]})
+
+    def test_transformations_looked_up_once_per_registry_version(self):
+        """The registry is consulted again only after a registration."""
+        self.registry.register_module('sqc', {'metadata': {'data_transformations': [
+            {'type': 'filter', 'column': 'value', 'operator': 'greater_than', 'value': 1},
+        ]}})
+        with patch.object(ModuleRegistry, 'get_module', wraps=self.registry.get_module) as get_module:
+            self.assertEqual(len(self.service._apply_module_transformations(self.df, 'sqc')), 2)
+            self.assertEqual(len(self.service._apply_module_transformations(self.df, 'sqc')), 2)
+            self.assertIs(self.service._apply_module_transformations(self.df, 'pca'), self.df)
+            self.assertEqual(get_module.call_count, 2)
+
+            self.registry.register_module('sqc', {'metadata': {}})
+            self.assertIs(self.service._apply_module_transformations(self.df, 'sqc'), self.df)
+            self.assertEqual(get_module.call_count, 3)
+
+
+class ResolveCallableTest(SimpleTestCase):
+    """Test cases for resolving handlers by dotted path."""
+
+    def test_resolution_cached(self):
+        """Each path is imported once."""
+        data_service._resolve_callable.cache_clear()
+        self.addCleanup(data_service._resolve_callable.cache_clear)
+        with patch.object(
+            data_service.importlib, 'import_module', wraps=data_service.importlib.import_module
+        ) as import_module:
+            self.assertIs(data_service._resolve_callable('os.path.join'), os.path.join)
+            self.assertIs(data_service._resolve_callable('os.path.join'), os.path.join)
+
+        import_module.assert_called_once_with('os.path')
+
+
+def _accepts_values(df):
+    return 'value' in df.columns, {'rows': len(df)}
+
+
+def _rejects_all(df):
+    return False, {}
+
+
+def _broken_checker(df):
+    raise RuntimeError('checker failed')
+
+
+class CompatibleModulesTest(SimpleTestCase):
+    """Test cases for get_compatible_modules."""
+
+    def test_checkers_results_in_registry_order(self):
+        """Compatible modules are listed in order; failing checkers are skipped."""
+        checker = f'{__name__}.%s'
+        modules = {
+            name: {'metadata': {'data_compatibility_checker': checker % function}}
+            for name, function in [('a', '_accepts_values'), ('b', '_broken_checker'),
+                                   ('c', '_rejects_all'), ('d', '_accepts_values')]
+        }
+        modules['e'] = {'metadata': {}}
+        service = data_service.DataService()
+        service.registry = Mock(**{'get_enabled_modules.return_value': modules})
+
+        with patch.object(data_service.DataService, 'load_dataset',
+                          return_value=pd.DataFrame({'value': [1, 2]})):
+            compatible = service.get_compatible_modules('1')
+
+        self.assertEqual([m['module_name'] for m in compatible], ['a', 'd'])
+        self.assertEqual(compatible[0]['compatibility_info'], {'rows': 2})
+
+
+class DataFrameHashTest(SimpleTestCase):
+    """Test cases for the dataset integrity hash."""
+
+    def setUp(self):
+        self.service = data_service.DataService()
+        self.df = pd.DataFrame({'value': [1.5, 2.5], 'label': ['a', None]})
+
+    def test_hash_ignores_index(self):
+        """Equal data hashes the same whatever the index."""
+        self.assertEqual(
+            self.service._calculate_hash(self.df),
+            self.service._calculate_hash(self.df.set_axis([7, 9]))
+        )
+
+    def test_hash_tracks_values_and_columns(self):
+        """Changing a value or a column name changes the hash."""
+        original = self.service._calculate_hash(self.df)
+        changed = self.df.copy()
+        changed.loc[1, 'value'] = 3.5
+        self.assertNotEqual(self.service._calculate_hash(changed), original)
+        self.assertNotEqual(
+            self.service._calculate_hash(self.df.rename(columns={'label': 'name'})), original
+        )
+
+
+    def test_hash_handles_list_and_dict_cells(self):
+        """Nested JSON values are hashed from their text instead of raising."""
+        df = pd.DataFrame({'tags': [['a', 'b'], ['c']], 'meta': [{'k': 1}, {'k': 2}]})
+        changed = df.copy()
+        changed.at[1, 'meta'] = {'k': 3}
+
+        digest = self.service._calculate_hash(df)
+
+        self.assertEqual(digest, self.service._calculate_hash(df.copy()))
+        self.assertNotEqual(self.service._calculate_hash(changed), digest)
+
+class DatasetSummaryTest(SimpleTestCase):
+    """Test cases for get_dataset_summary."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.service = data_service.DataService()
+        self.df = pd.DataFrame({
+            'value': [1.0, None, 3.0, 4.0],
+            'count': [1, 2, 3, 4],
+            'label': ['a', 'b', 'a', None],
+            'group': pd.Categorical(['x', 'x', None, 'x'], categories=['x', 'y']),
+            'when': pd.to_datetime(['2024-01-01', None, '2024-03-01', '2024-02-01']),
+        })
+
+    def test_summary_statistics(self):
+        """Each column type is summarized with its missing count."""
+        with patch.object(data_service.DataService, 'load_dataset', return_value=self.df):
+            summary = self.service.get_dataset_summary('1')
+
+        self.assertEqual(summary['missing_values']['value'], 1)
+        self.assertEqual(summary['numeric_columns']['value'], {
+            'min': 1.0, 'max': 4.0, 'mean': self.df['value'].mean(),
+            'median': 3.0, 'std': self.df['value'].std(), 'missing': 1
+        })
+        self.assertEqual(summary['numeric_columns']['count']['median'], 2.5)
+        self.assertEqual(summary['categorical_columns']['label']['unique_values'], 2)
+        self.assertEqual(summary['categorical_columns']['label']['top_values'], {'a': 2, 'b': 1})
+        self.assertEqual(summary['categorical_columns']['group']['unique_values'], 1)
+        self.assertEqual(summary['date_columns']['when'], {
+            'min': '2024-01-01T00:00:00', 'max': '2024-03-01T00:00:00', 'missing': 1
+        })
+
+    def test_summary_served_from_cache(self):
+        """A cached summary is returned without loading the dataset again."""
+        with patch.object(data_service.DataService, 'load_dataset',
+                          return_value=self.df) as load_dataset:
+            summary = self.service.get_dataset_summary('1')
+            cached = self.service.get_dataset_summary('1')
+
+        load_dataset.assert_called_once()
+        self.assertEqual(cached['shape'], list(summary['shape']))
+        self.assertEqual(cached['numeric_columns'], summary['numeric_columns'])
+        self.assertEqual(cached['categorical_columns']['label']['top_values'], {'a': 2, 'b': 1})
+
+
+class GenerateSchemaTest(SimpleTestCase):
+    """Test cases for _generate_schema."""
+
+    def test_column_schema(self):
+        """Numeric columns get bounds, string and categorical ones a unique count."""
+        df = pd.DataFrame({
+            'value': [2.0, None, 5.0],
+            'label': ['a', 'b', 'a'],
+            'group': pd.Categorical(['x', 'y', 'x']),
+        })
+
+        columns = data_service.DataService()._generate_schema(df)['columns']
+
+        self.assertEqual(columns[0], {
+            'name': 'value', 'dtype': 'float64', 'nullable': True, 'min': 2.0, 'max': 5.0
+        })
+        self.assertEqual(columns[1]['unique_count'], 2)
+        self.assertFalse(columns[1]['nullable'])
+        self.assertEqual(columns[2]['unique_count'], 2)
+
+
+class DatasetFileStorageTest(SimpleTestCase):
+    """Test cases for writing large datasets to files."""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.df = pd.DataFrame({'value': [1.5, 2.5, None], 'label': ['a', 'b', 'c']},
+                               index=[4, 5, 6])
+
+    def _round_trip(self, storage_format):
+        service = data_service.DataService()
+        service.storage_format = storage_format
+        file_path = service._save_to_file(self.df, 'my data')
+        self.assertTrue(file_path.endswith(f'.{storage_format}'))
+        return service._load_from_file(os.path.join(settings.MEDIA_ROOT, file_path))
+
+    def test_feather_round_trip(self):
+        """Feather files are the default and reload without the index."""
+        self.assertEqual(data_service.DataService().storage_format, 'feather')
+        pd.testing.assert_frame_equal(self._round_trip('feather'),
+                                      self.df.reset_index(drop=True))
+
+    def test_parquet_round_trip(self):
+        """Parquet remains available through DATA_STORAGE_FORMAT."""
+        pd.testing.assert_frame_equal(self._round_trip('parquet'),
+                                      self.df.reset_index(drop=True))
+
+    def test_batched_write(self):
+        """Frames larger than one batch are written completely."""
+        self.df = pd.DataFrame({'value': range(10), 'label': [None] * 5 + ['x'] * 5})
+        with patch.object(data_service, 'WRITE_BATCH_ROWS', 3):
+            for storage_format in ('feather', 'parquet'):
+                pd.testing.assert_frame_equal(self._round_trip(storage_format), self.df)
+
+    def test_repeated_strings_stored_as_dictionary(self):
+        """Low-cardinality string columns are written as categoricals and load as strings."""
+        self.df = pd.DataFrame({
+            'group': ['control', 'treatment', None] * 100,
+            'id': [f'subject {i}' for i in range(300)],
+            'mixed': pd.Series(['a', 'b'] * 150, dtype=object),
+        })
+        service = data_service.DataService()
+        self.assertEqual([position for position, _ in service._low_cardinality_columns(self.df)],
+                         [0, 2])
+
+        for storage_format in ('feather', 'parquet'):
+            pd.testing.assert_frame_equal(self._round_trip(storage_format), self.df)
+
+    def test_csv_load(self):
+        """CSV files load with the same values and dtypes as the default reader."""
+        path = os.path.join(settings.MEDIA_ROOT, 'data.csv')
+        self.df.to_csv(path, index=False)
+
+        loaded = data_service.DataService()._load_from_file(path)
+
+        pd.testing.assert_frame_equal(loaded, pd.read_csv(path))
+
+
+    def test_csv_load_keeps_date_columns_as_strings(self):
+        """Date and timestamp columns load as text, as with the default reader."""
+        path = os.path.join(settings.MEDIA_ROOT, 'dates.csv')
+        with open(path, 'w') as f:
+            f.write('day,at,value\n'
+                    '2020-01-02,2020-01-02 10:00:00,1.5\n'
+                    '2021-03-04,2021-03-04T11:30,2.5\n')
+
+        loaded = data_service.DataService()._load_from_file(path)
+
+        pd.testing.assert_frame_equal(loaded, pd.read_csv(path))
+        self.assertEqual(loaded['at'].tolist(), ['2020-01-02 10:00:00', '2021-03-04T11:30'])
+
+class ApplyTransformationsTest(SimpleTestCase):
+    """Test cases for _apply_transformations."""
+
+    def setUp(self):
+        self.service = data_service.DataService()
+        self.df = pd.DataFrame({
+            'value': [1, 5, 10, 15, 20],
+            'label': ['apple', 'banana', 'cherry', 'apple pie', 'date'],
+        })
+
+    def test_consecutive_filters(self):
+        """Filters in a row keep only rows matching all of them."""
+        result = self.service._apply_transformations(self.df, [
+            {'type': 'filter', 'column': 'value', 'operator': 'greater_than', 'value': 1},
+            {'type': 'filter', 'column': 'label', 'operator': 'contains', 'value': 'a'},
+            {'type': 'filter', 'column': 'value', 'operator': 'unknown', 'value': 0},
+            {'type': 'filter', 'column': 'value', 'operator': 'not_equals', 'value': 20},
+        ])
+
+        self.assertEqual(list(result.index), [1, 3])
+
+    def test_filters_around_other_transformations(self):
+        """Filters see the frame as transformed by the steps before them."""
+        result = self.service._apply_transformations(self.df, [
+            {'type': 'filter', 'column': 'value', 'operator': 'less_than', 'value': 20},
+            {'type': 'rename', 'mapping': {'value': 'amount'}},
+            {'type': 'filter', 'column': 'amount', 'operator': 'in', 'value': [1, 10, 20]},
+        ])
+
+        self.assertEqual(list(result['amount']), [1, 10])
+        self.assertEqual(list(self.df.columns), ['value', 'label'])
+
+    @override_settings(ALLOW_CUSTOM_TRANSFORMATIONS=True)
+    def test_custom_expression(self):
+        """Custom expressions can add columns and select rows."""
+        result = self.service._apply_transformations(self.df, [
+            {'type': 'custom', 'expr': 'double = value * 2'},
+            {'type': 'custom', 'expr': 'double > 15'},
+        ])
+
+        self.assertEqual(list(result['double']), [20, 30, 40])
+
+    @override_settings(ALLOW_CUSTOM_TRANSFORMATIONS=True)
+    def test_custom_expression_rejects_python_access(self):
+        """References, attributes, calls and unknown names are rejected before evaluation."""
+        for expr in ["@os.system('echo unsafe') == 0",
+                     "value.to_csv('/tmp/custom_expr.csv') == 0",
+                     "value.__class__",
+                     "abs(value) > 1",
+                     "value[0] > 1",
+                     "os > 1",
+                     "a = b = value",
+                     "value > 1; value < 5"]:
+            with self.subTest(expr=expr), patch.object(pd.DataFrame, 'eval') as df_eval:
+                with self.assertRaises(ValueError):
+                    self.service._apply_transformations(self.df, [{'type': 'custom', 'expr': expr}])
+                df_eval.assert_not_called()
+
+    @override_settings(ALLOW_CUSTOM_TRANSFORMATIONS=True)
+    def test_custom_code_not_executed(self):
+        """Python source in 'code' is ignored."""
+        result = self.service._apply_transformations(self.df, [
+            {'type': 'custom', 'code': "df = df.iloc[:1]"},
+        ])
+
+        pd.testing.assert_frame_equal(result, self.df)
+
+    def test_custom_expression_disabled(self):
+        """Custom expressions are skipped unless explicitly allowed."""
+        result = self.service._apply_transformations(self.df, [
+            {'type': 'custom', 'expr': 'value > 5'},
+        ])
+
+        self.assertEqual(len(result), 5)
+
+
+class FileStorageDecisionTest(SimpleTestCase):
+    """Test cases for choosing between JSON and file storage."""
+
+    def setUp(self):
+        self.service = data_service.DataService()
+
+    def test_small_numeric_frame_skips_deep_measure(self):
+        """Numeric frames are sized without walking objects."""
+        df = pd.DataFrame({'value': range(10)})
+        with patch.object(pd.DataFrame, 'memory_usage', wraps=df.memory_usage) as usage:
+            self.assertFalse(self.service._needs_file_storage(df))
+
+        usage.assert_called_once_with(deep=False)
+
+    def test_long_strings_use_file(self):
+        """A few rows of long strings still go to a file."""
+        df = pd.DataFrame({'text': ['x' * 100_000] * 20}, dtype=object)
+        self.assertTrue(self.service._needs_file_storage(df))
+
+    def test_many_rows_use_file(self):
+        """Frames over the row limit go to a file."""
+        df = pd.DataFrame({'value': range(data_service.FILE_STORAGE_MIN_ROWS + 1)})
+        self.assertTrue(self.service._needs_file_storage(df))
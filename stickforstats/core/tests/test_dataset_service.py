@@ -0,0 +1,42 @@
+"""Tests for the dataset service helpers."""
+
+import io
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from stickforstats.core.services import dataset_service
+
+
+class ProfileCsvTest(SimpleTestCase):
+    """Test cases for streaming CSV profiling."""
+
+    def _csv(self, rows):
+        return io.BytesIO(('id,value,label\n' + ''.join(rows)).encode())
+
+    def test_types_from_single_block(self):
+        """Small files are counted and typed from their only block."""
+        source = self._csv(['1,1.5,a\n', '2,,b\n', '3,2.5,c\n'])
+
+        profile = dataset_service.DatasetService().profile_csv(source)
+
+        self.assertEqual(profile['row_count'], 3)
+        self.assertEqual(profile['column_count'], 3)
+        self.assertEqual(profile['columns_info'], {
+            'id': {'type': 'numeric'},
+            'value': {'type': 'numeric'},
+            'label': {'type': 'categorical'},
+        })
+
+    @patch.object(dataset_service, 'CSV_BLOCK_SIZE', 1 << 16)
+    def test_late_value_in_numeric_column_spans_blocks(self):
+        """A text value after the first block retypes the column instead of failing."""
+        rows = [f'{i},{i * 0.5},x\n' for i in range(200_000)]
+        rows.append('abc,1.0,x\n')
+        source = self._csv(rows)
+
+        profile = dataset_service.DatasetService().profile_csv(source)
+
+        self.assertEqual(profile['row_count'], 200_001)
+        self.assertEqual(profile['columns_info']['id'], {'type': 'categorical'})
+        self.assertEqual(profile['columns_info']['value'], {'type': 'numeric'})
@@ -0,0 +1,40 @@
+"""Tests for the dump_urls management command."""
+
+import importlib.util
+import io
+import os
+import shutil
+import tempfile
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from django.urls import Resolver404, URLResolver
+from django.urls.resolvers import RegexPattern
+
+
+class DumpUrlsTest(SimpleTestCase):
+    """Test cases for the generated router URL module."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        directory = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, directory)
+        output = os.path.join(directory, 'generated_urls.py')
+        call_command('dump_urls', '--output', output, stdout=io.StringIO())
+
+        spec = importlib.util.spec_from_file_location('generated_urls', output)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        cls.resolver = URLResolver(RegexPattern(r'^'), module.router_urls)
+
+    def test_detail_route_resolves(self):
+        """Lookup values resolve to the detail view."""
+        match = self.resolver.resolve('datasets/abc/')
+        self.assertEqual(match.url_name, 'dataset-detail')
+        self.assertEqual(match.kwargs, {'pk': 'abc'})
+
+    def test_lookup_rejects_dots(self):
+        """Like the router's [^/.]+ lookup, dotted values don't match."""
+        with self.assertRaises(Resolver404):
+            self.resolver.resolve('datasets/abc.json/')
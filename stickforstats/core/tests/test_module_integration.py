@@ -0,0 +1,244 @@
+"""Tests for the module integration helpers."""
+
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from stickforstats.core import module_integration
+from stickforstats.core.registry import ModuleRegistry
+
+
+class IntegrationReportCacheTest(SimpleTestCase):
+    """Test cases for the cached integration report."""
+
+    def setUp(self):
+        module_integration.clear_integration_report_cache()
+        self.addCleanup(module_integration.clear_integration_report_cache)
+
+    def test_report_reused_until_cleared(self):
+        """The report is built once and rebuilt after cache_clear."""
+        with patch.object(
+            module_integration.ModuleIntegration, 'generate_integration_report',
+            side_effect=lambda deep=False: {'status': 'OK', 'modules': {}}
+        ) as generate:
+            first = module_integration.generate_integration_report()
+            second = module_integration.generate_integration_report()
+            self.assertIs(first, second)
+            self.assertEqual(generate.call_count, 1)
+
+            module_integration.clear_integration_report_cache()
+            module_integration.generate_integration_report()
+            self.assertEqual(generate.call_count, 2)
+
+    def test_report_expires(self):
+        """A new time bucket rebuilds the report."""
+        with patch.object(
+            module_integration.ModuleIntegration, 'generate_integration_report',
+            side_effect=lambda deep=False: {'status': 'OK', 'modules': {}}
+        ) as generate, patch.object(module_integration.time, 'monotonic') as monotonic:
+            monotonic.return_value = 0
+            module_integration.generate_integration_report()
+            monotonic.return_value = module_integration.REPORT_CACHE_SECONDS
+            module_integration.generate_integration_report()
+
+        self.assertEqual(generate.call_count, 2)
+
+
+class ValidateModulesCacheTest(SimpleTestCase):
+    """Test cases for cached module validation."""
+
+    def setUp(self):
+        self.registry = ModuleRegistry()
+        self.integrator = module_integration.ModuleIntegration()
+        self.integrator.registry = self.registry
+
+    def test_validation_reused_until_registry_changes(self):
+        """discover_modules only runs again after a registration or invalidate()."""
+        with patch.object(
+            module_integration.ModuleIntegration, 'discover_modules', wraps=self.integrator.discover_modules
+        ) as discover:
+            first = self.integrator.validate_modules()
+            self.assertIs(self.integrator.validate_modules(), first)
+            self.assertEqual(discover.call_count, 1)
+
+            self.registry.register_module('core', {'name': 'core'})
+            self.integrator.validate_modules()
+            self.assertEqual(discover.call_count, 2)
+
+            self.integrator.invalidate()
+            self.integrator.validate_modules()
+            self.assertEqual(discover.call_count, 3)
+
+    def test_lightweight_validation_skips_imports(self):
+        """Registered modules count as valid without importing anything."""
+        self.registry.register_module('core', {
+            'name': 'core', 'api_namespace': 'does.not.exist',
+            'services': {'broken': {'service': 'does.not.Exist'}}
+        })
+        with patch.object(module_integration.importlib, 'import_module') as import_module:
+            results = self.integrator.validate_modules_lightweight()
+
+        import_module.assert_not_called()
+        self.assertEqual(results['core']['status'], 'valid')
+        self.assertEqual(results['mainapp']['status'], 'not_registered')
+        self.assertEqual(results['sqc_analysis']['status'], 'missing')
+
+    def test_failed_service_resolution_cached(self):
+        """A path that fails to import is not retried until invalidate()."""
+        with patch.object(
+            module_integration.importlib, 'import_module', side_effect=ImportError('nope')
+        ) as import_module:
+            self.assertIsNone(self.integrator.resolve_service('does.not.Exist'))
+            self.assertIsNone(self.integrator.resolve_service('does.not.Exist'))
+            self.assertEqual(import_module.call_count, 1)
+
+            self.integrator.invalidate()
+            self.assertIsNone(self.integrator.resolve_service('does.not.Exist'))
+            self.assertEqual(import_module.call_count, 2)
+
+
+class CapabilityIndexTest(SimpleTestCase):
+    """Test cases for the registry's capability index."""
+
+    def test_services_indexed_by_capability(self):
+        """Matching services are listed in order and re-indexed on registration."""
+        registry = ModuleRegistry()
+        registry.register_module('a', {
+            'capabilities': ['reporting', 'visualization'],
+            'services': {
+                'reporting': {'service': 'a.Reporting'},
+                'plots': {'service': 'a.Plots', 'capabilities': ['visualization']},
+                'other': {'service': 'a.Other'},
+            }
+        })
+        self.assertEqual(registry.get_capability_services('reporting'), ['a.Reporting'])
+        self.assertEqual(registry.get_capability_services('visualization'), ['a.Plots'])
+        self.assertEqual(registry.get_capability_services('other'), [])
+
+        registry.register_module('b', {
+            'capabilities': ['reporting'],
+            'services': {'reporting': {'service': 'b.Reporting'}}
+        })
+        self.assertEqual(
+            registry.get_capability_services('reporting'), ['a.Reporting', 'b.Reporting']
+        )
+
+    def test_registration_fills_defaults_on_a_copy(self):
+        """Missing list/dict keys are added without touching the caller's dict."""
+        registry = ModuleRegistry()
+        module_info = {'name': 'bare'}
+        registry.register_module('bare', module_info)
+
+        registered = registry.get_module('bare')
+        self.assertEqual(registered['services'], {})
+        self.assertEqual(registered['dependencies'], [])
+        self.assertEqual(registered['capabilities'], [])
+        self.assertEqual(module_info, {'name': 'bare'})
+
+    def test_all_modules_read_only_view(self):
+        """get_all_modules can't be modified and shows later registrations."""
+        registry = ModuleRegistry()
+        modules = registry.get_all_modules()
+        registry.register_module('core', {'name': 'core'})
+
+        self.assertIn('core', modules)
+        self.assertIs(registry.get_all_modules(), modules)
+        with self.assertRaises(TypeError):
+            modules['other'] = {}
+
+
+class IntegrationReportRegistryTest(SimpleTestCase):
+    """Test cases for report invalidation on registration."""
+
+    def setUp(self):
+        module_integration.clear_integration_report_cache()
+        self.addCleanup(module_integration.clear_integration_report_cache)
+
+    def test_registration_rebuilds_report(self):
+        """A module registering after the report was built forces a rebuild."""
+        registry = ModuleRegistry()
+        with patch.object(module_integration.module_integrator, 'registry', registry), \
+                patch.object(
+                    module_integration.ModuleIntegration, 'generate_integration_report',
+                    side_effect=lambda deep=False: {'status': 'OK', 'modules': {}}
+                ) as generate:
+            module_integration.generate_integration_report()
+            module_integration.generate_integration_report()
+            registry.register_module('late', {'name': 'late'})
+            module_integration.generate_integration_report()
+
+        self.assertEqual(generate.call_count, 2)
+
+
+class ReverseDependencyTest(SimpleTestCase):
+    """Test cases for the reverse dependency index."""
+
+    def test_dependent_modules(self):
+        """troubleshoot_module lists the modules depending on the given one."""
+        registry = ModuleRegistry()
+        registry.register_module('core', {'name': 'core'})
+        registry.register_module('sqc', {'name': 'sqc', 'dependencies': ['core']})
+        registry.register_module('pca', {'name': 'pca', 'dependencies': ['core', 'sqc']})
+        integrator = module_integration.ModuleIntegration()
+        integrator.registry = registry
+        integrator.build_dependencies_graph()
+
+        self.assertEqual(integrator.troubleshoot_module('core')['dependent_modules'],
+                         ['sqc', 'pca'])
+        self.assertEqual(integrator.troubleshoot_module('pca')['dependent_modules'], [])
+
+
+class ValidationReuseTest(SimpleTestCase):
+    """Test cases for sharing validation results between callers."""
+
+    def setUp(self):
+        self.registry = ModuleRegistry()
+        self.integrator = module_integration.ModuleIntegration()
+        self.integrator.registry = self.registry
+
+    def test_report_validates_once(self):
+        """A deep report validates modules once, for itself and initialization."""
+        with patch.object(
+            module_integration.ModuleIntegration, 'discover_modules',
+            wraps=self.integrator.discover_modules
+        ) as discover:
+            self.integrator.generate_integration_report(deep=True)
+            self.integrator.troubleshoot_module('core')
+            # Current deep results are reused by the lightweight report too
+            report = self.integrator.generate_integration_report()
+
+        self.assertEqual(discover.call_count, 1)
+        self.assertIs(report['modules'], self.integrator.modules_status)
+
+
+class PreloadModulesTest(SimpleTestCase):
+    """Test cases for preloading modules at start-up."""
+
+    def setUp(self):
+        self.registry = ModuleRegistry()
+        self.registry.register_module('core', {
+            'name': 'core', 'api_namespace': 'json',
+            'services': {'decoder': {'service': 'json.decoder.JSONDecoder'}}
+        })
+        self.integrator = module_integration.ModuleIntegration()
+        self.integrator.registry = self.registry
+
+    @override_settings(DEBUG=False)
+    def test_preload_imports_validation_modules(self):
+        """The API namespace and service modules of registered modules are imported."""
+        with patch.object(
+            module_integration.importlib, 'import_module',
+            wraps=module_integration.importlib.import_module
+        ) as import_module:
+            self.assertEqual(self.integrator.preload_modules(), 2)
+
+        imported = {call.args[0] for call in import_module.call_args_list}
+        self.assertEqual(imported, {'json', 'json.decoder'})
+
+    @override_settings(DEBUG=True)
+    def test_preload_skipped_in_development(self):
+        """Development mode validation doesn't import, so neither does preloading."""
+        with patch.object(module_integration.importlib, 'import_module') as import_module:
+            self.assertEqual(self.integrator.preload_modules(), 0)
+
+        import_module.assert_not_called()
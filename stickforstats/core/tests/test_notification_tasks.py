@@ -0,0 +1,48 @@
+"""Tests for the notification tasks."""
+
+import queue
+import threading
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from stickforstats.core.tasks import notification_tasks
+
+
+class SendNotificationTest(SimpleTestCase):
+    """Test cases for queued notifications."""
+
+    def test_notification_sent_in_background(self):
+        """send_notification returns at once and the sender thread delivers it."""
+        sent = threading.Event()
+        with patch.object(notification_tasks, 'send_notification_sync',
+                          side_effect=lambda **kwargs: sent.set()) as send_sync:
+            result = notification_tasks.send_notification.delay(
+                user_id='1', title='Done', message='Analysis completed'
+            )
+            self.assertTrue(sent.wait(5))
+
+        self.assertEqual(result['status'], 'queued')
+        send_sync.assert_called_once_with(
+            user_id='1', title='Done', message='Analysis completed', notification_type='info',
+            related_object_type=None, related_object_id=None
+        )
+
+    def test_drain_sends_in_order_despite_errors(self):
+        """Queued notifications are sent in order; a failing one doesn't stop the rest."""
+        # A queue of its own, so a sender thread from another test can't take the items
+        with patch.object(notification_tasks, '_notification_queue', queue.SimpleQueue()), \
+                patch.object(notification_tasks, '_ensure_worker'), \
+                patch.object(notification_tasks, 'send_notification_sync',
+                             side_effect=[RuntimeError('down'), None]) as send_sync:
+            notification_tasks.send_notification('1', 'First', 'a')
+            notification_tasks.send_notification('1', 'Second', 'b')
+            notification_tasks._drain_queue()
+
+        self.assertEqual([c.kwargs['title'] for c in send_sync.call_args_list], ['First', 'Second'])
+
+    def test_sync_send(self):
+        """send_notification_sync still sends immediately."""
+        result = notification_tasks.send_notification_sync('1', 'Done', 'ok', 'success')
+        self.assertEqual(result['status'], 'sent')
+        self.assertEqual(result['type'], 'success')
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mainapp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='analysissession',
+            index=models.Index(fields=['user', 'status'], name='mainapp_session_user_status'),
+        ),
+    ]
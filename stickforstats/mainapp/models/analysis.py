@@ -68,6 +68,9 @@ class AnalysisSession(models.Model):
         verbose_name = _('analysis session')
         verbose_name_plural = _('analysis sessions')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'status'], name='mainapp_session_user_status'),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.module})"
@@ -178,6 +178,7 @@ AUTH_USER_MODEL = 'mainapp.User'
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
+        'stickforstats.core.api.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.TokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
@@ -195,11 +196,17 @@ REST_FRAMEWORK = {
         'user': '1000/day'
     },
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer' if DEBUG else 'rest_framework.renderers.JSONRenderer',
+        'stickforstats.core.api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer' if DEBUG else 'stickforstats.core.api.renderers.ORJSONRenderer',
     ],
 }
 
+# JWT settings: HS256 access tokens signed with SECRET_KEY
+SIMPLE_JWT = {
+    'ALGORITHM': 'HS256',
+    'AUTH_HEADER_TYPES': ('Bearer',),
+}
+
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = DEBUG  # Allow all origins in development
 CORS_ALLOWED_ORIGINS = os.environ.get('CORS_ALLOWED_ORIGINS', 'http://localhost:3000,http://127.0.0.1:3000').split(',')
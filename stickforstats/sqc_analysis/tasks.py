@@ -323,6 +323,7 @@ def create_notification(user_id, title, message, notification_type="info",
     """Create a notification for a user."""
     try:
         from stickforstats.core.models import Notification
+        from stickforstats.core.consumers import invalidate_pending_notifications
         
         # Create notification
         user = User.objects.get(id=user_id)
@@ -334,6 +335,7 @@ def create_notification(user_id, title, message, notification_type="info",
             related_object_type=related_object_type,
             related_object_id=related_object_id
         )
+        invalidate_pending_notifications(user_id)
         
         # Send notification via WebSocket
         async_to_sync(channel_layer.group_send)(
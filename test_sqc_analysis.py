@@ -30,9 +30,9 @@ def authenticate():
     try:
         response = requests.post(f"{BASE_URL}/api/v1/core/auth/token/", json=auth_data)
         if response.status_code == 200:
-            token = response.json().get("token")
+            token = response.json().get("access")
             global headers
-            headers = {"Authorization": f"Token {token}"}
+            headers = {"Authorization": f"Bearer {token}"}
             print("Authentication successful!")
             return True
         else: